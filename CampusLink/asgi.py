@@ -3,6 +3,10 @@ ASGI config for CampusLink project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Serve it with an ASGI server (e.g. ``uvicorn CampusLink.asgi:application``)
+to enable the live notification stream; under WSGI the notification bell
+falls back to long polling.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
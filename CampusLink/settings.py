@@ -2,6 +2,7 @@ import os
 from pathlib import Path
 import dj_database_url
 from decouple import config
+from django.core.exceptions import ImproperlyConfigured
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -47,6 +48,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'MyLogin',   
     'Myapp',     
 ]
@@ -58,6 +60,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'Myapp.middleware.user_role.UserRoleMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'Myapp.middleware.auto_logout.AutoLogoutMiddleware',
@@ -76,11 +79,42 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'MyLogin.context_processors.notifications',
             ],
         },
     },
 ]
 
+# --- CACHE ---
+# Local memory is per process; with several workers, and always with
+# JOB_WORKER (the worker clears cached notification badges and roles),
+# use a shared backend, e.g.
+# CACHE_BACKEND=django.core.cache.backends.filebased.FileBasedCache
+# CACHE_LOCATION=/var/tmp/campuslink_cache
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'campuslink'),
+    }
+}
+# The local, file and database backends drop a third of their entries once
+# they hold MAX_ENTRIES (300 by default), which would evict sessions and
+# posting cards on any real site. FileBasedCache lists its directory on every
+# write, so past a few tens of thousands of entries use Redis or Memcached,
+# which size themselves and take no such option.
+CULLING_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.filebased.FileBasedCache',
+    'django.core.cache.backends.db.DatabaseCache',
+)
+if CACHES['default']['BACKEND'] in CULLING_CACHES:
+    CACHES['default']['OPTIONS'] = {'MAX_ENTRIES': int(os.environ.get('CACHE_MAX_ENTRIES', 20000))}
+
+# --- CONDITIONAL GETS ---
+# Part of every page ETag, so pages rendered by an older deploy (older
+# templates) never validate. Render sets RENDER_GIT_COMMIT for each deploy.
+RELEASE_VERSION = os.environ.get('RELEASE_VERSION', os.environ.get('RENDER_GIT_COMMIT', ''))
+
 WSGI_APPLICATION = 'CampusLink.wsgi.application'
 
 # --- PASSWORD VALIDATION ---
@@ -91,12 +125,64 @@ AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
 ]
 
+# --- PASSWORD HASHING ---
+# PASSWORD_HASHER picks the algorithm for new hashes: pbkdf2 (Django's
+# default), scrypt, or argon2 (needs the argon2-cffi package). Existing
+# hashes keep working and are rehashed with the chosen algorithm and cost
+# when their owner next logs in.
+PASSWORD_HASHER_CHOICES = {
+    'pbkdf2': 'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'scrypt': 'MyLogin.hashers.TunableScryptPasswordHasher',
+    'argon2': 'MyLogin.hashers.TunableArgon2PasswordHasher',
+    'bcrypt': 'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'pbkdf2_sha1': 'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+}
+PASSWORD_HASHER = os.environ.get('PASSWORD_HASHER', 'pbkdf2')
+if PASSWORD_HASHER not in PASSWORD_HASHER_CHOICES:
+    raise ImproperlyConfigured(
+        f"Unknown PASSWORD_HASHER {PASSWORD_HASHER!r}; choose one of {', '.join(PASSWORD_HASHER_CHOICES)}."
+    )
+PASSWORD_HASHERS = [PASSWORD_HASHER_CHOICES[PASSWORD_HASHER]] + [
+    hasher for name, hasher in PASSWORD_HASHER_CHOICES.items() if name != PASSWORD_HASHER
+]
+PASSWORD_SCRYPT_WORK_FACTOR = int(os.environ.get('PASSWORD_SCRYPT_WORK_FACTOR', 2 ** 14))
+PASSWORD_SCRYPT_BLOCK_SIZE = int(os.environ.get('PASSWORD_SCRYPT_BLOCK_SIZE', 8))
+PASSWORD_SCRYPT_PARALLELISM = int(os.environ.get('PASSWORD_SCRYPT_PARALLELISM', 1))
+PASSWORD_ARGON2_TIME_COST = int(os.environ.get('PASSWORD_ARGON2_TIME_COST', 2))
+PASSWORD_ARGON2_MEMORY_COST = int(os.environ.get('PASSWORD_ARGON2_MEMORY_COST', 64 * 1024))  # KiB
+PASSWORD_ARGON2_PARALLELISM = int(os.environ.get('PASSWORD_ARGON2_PARALLELISM', 2))
+
+# --- LOGIN RATE LIMITS ---
+# Token buckets checked before a login is attempted, as (burst, refills
+# per minute) of failed attempts per client IP and per account; successful
+# logins are free, so a campus behind one NAT address can all sign in.
+# Buckets live in the default cache, so they are per process unless
+# CACHE_BACKEND is shared.
+LOGIN_RATE_LIMIT_IP = (
+    int(os.environ.get('LOGIN_RATE_LIMIT_IP_BURST', 30)),
+    int(os.environ.get('LOGIN_RATE_LIMIT_IP_PER_MINUTE', 30)),
+)
+LOGIN_RATE_LIMIT_ACCOUNT = (
+    int(os.environ.get('LOGIN_RATE_LIMIT_ACCOUNT_BURST', 5)),
+    int(os.environ.get('LOGIN_RATE_LIMIT_ACCOUNT_PER_MINUTE', 1)),
+)
+# Proxies in front of the app that append to X-Forwarded-For (Render has one)
+NUM_PROXIES = int(os.environ.get('NUM_PROXIES', 1 if os.environ.get('RENDER') else 0))
+
 # --- INTERNATIONALIZATION ---
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
 USE_I18N = True
 USE_TZ = True
 
+# --- LIVE NOTIFICATIONS ---
+# Wakes open notification streams / long polls. The in-process broker only
+# reaches connections in the same worker (others catch up on their next
+# heartbeat); point this at a Redis-backed broker with the same interface
+# to fan out across workers.
+NOTIFICATION_BROKER = 'MyLogin.realtime.InProcessBroker'
+
+
 # --- STATIC FILES CONFIG ---
 STATIC_URL = '/static/'
 STATICFILES_DIRS = [
@@ -119,8 +205,27 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # ✅ Auto logout configuration (5 minutes)
 AUTO_LOGOUT_DELAY = 300  # seconds
+# Activity is saved to the session at most once per this many seconds
+AUTO_LOGOUT_GRANULARITY = int(os.environ.get('AUTO_LOGOUT_GRANULARITY', 60))
+# SESSION_WRITE_BEHIND=true reads sessions from the cache and writes them to
+# the database in batches (see Myapp.sessions). It needs a shared
+# CACHE_BACKEND: a per-process cache could serve a session another process
+# has logged out.
+SESSION_WRITE_BEHIND = os.environ.get('SESSION_WRITE_BEHIND', '').lower() == 'true'
+if SESSION_WRITE_BEHIND and CACHES['default']['BACKEND'] == 'django.core.cache.backends.locmem.LocMemCache':
+    raise ImproperlyConfigured("SESSION_WRITE_BEHIND needs a CACHE_BACKEND shared between processes.")
+SESSION_ENGINE = os.environ.get(
+    'SESSION_ENGINE',
+    'Myapp.sessions' if SESSION_WRITE_BEHIND else 'django.contrib.sessions.backends.db'
+)
+# Seconds between batched session writes, and the batch size that triggers one early
+SESSION_WRITE_BEHIND_INTERVAL = float(os.environ.get('SESSION_WRITE_BEHIND_INTERVAL', 5))
+SESSION_WRITE_BEHIND_BATCH = int(os.environ.get('SESSION_WRITE_BEHIND_BATCH', 500))
 SESSION_EXPIRE_AT_BROWSER_CLOSE = True
 
+# Email or username login, loading the Profile with the user (see MyLogin.backends)
+AUTHENTICATION_BACKENDS = ['MyLogin.backends.EmailOrUsernameBackend']
+
 LOGIN_REDIRECT_URL = '/Myapp/dashboard/'
 LOGIN_URL = '/'
 MEDIA_URL = '/media/'
@@ -129,3 +234,42 @@ MEDIA_ROOT = BASE_DIR / 'media'
 
 
 
+
+# --- FILE STORAGE ---
+# Uploads are kept under MEDIA_ROOT unless FILE_STORAGE=s3, which stores them
+# in an S3-compatible bucket instead (AWS S3, Supabase Storage through its S3
+# endpoint, or MinIO for local testing). The s3 backend needs boto3.
+if os.environ.get('FILE_STORAGE', 'local') == 's3':
+    DEFAULT_STORAGE = {
+        'BACKEND': 'Myapp.storage.S3CompatibleStorage',
+        'OPTIONS': {
+            'bucket': os.environ.get('S3_BUCKET', ''),
+            'endpoint_url': os.environ.get('S3_ENDPOINT_URL') or None,
+            'region': os.environ.get('S3_REGION') or None,
+            'access_key': os.environ.get('S3_ACCESS_KEY_ID') or None,
+            'secret_key': os.environ.get('S3_SECRET_ACCESS_KEY') or None,
+            # Base URL of a public bucket; private buckets get presigned URLs
+            'public_url': os.environ.get('S3_PUBLIC_URL', ''),
+        },
+    }
+else:
+    DEFAULT_STORAGE = {'BACKEND': 'django.core.files.storage.FileSystemStorage'}
+
+# STATICFILES_STORAGE above is ignored since Django 5.1; static files keep the
+# storage they were effectively using
+STORAGES = {
+    'default': DEFAULT_STORAGE,
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
+# --- BACKGROUND JOBS ---
+# Set JOB_WORKER=true when `manage.py run_worker` runs next to the web
+# processes (it also needs a shared CACHE_BACKEND). Without it, each queued
+# job (notifications, uploads, thumbnails) runs in the process that queued
+# it, right after the request's transaction commits.
+JOB_WORKER = os.environ.get('JOB_WORKER', '').lower() == 'true'
+
+# Uploads are written to local disk during the request and moved to the
+# default storage by a job (see Myapp.uploads); with JOB_WORKER the worker
+# must be able to read this directory too
+UPLOAD_STAGING_ROOT = os.environ.get('UPLOAD_STAGING_ROOT', BASE_DIR / 'upload_staging')
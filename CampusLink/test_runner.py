@@ -0,0 +1,38 @@
+from importlib import import_module
+
+from django.contrib.auth.models import User
+from django.db import connections
+from django.db.models.signals import post_migrate
+from django.test.runner import DiscoverRunner
+
+from Myapp.models import Posting
+from Myapp.search import FTS_TABLE
+
+GIN_INDEX = import_module('Myapp.migrations.0011_posting_search_vector').GIN_INDEX
+EMAIL_INDEX = import_module('MyLogin.migrations.0012_user_email_lower_index').EMAIL_INDEX
+
+
+def create_raw_sql_objects(sender, app_config, using, **kwargs):
+    """The search index and the case-insensitive email index, which the migrations create with raw SQL."""
+    if app_config.label != 'Myapp':
+        return
+    with connections[using].schema_editor() as schema_editor:
+        vendor = schema_editor.connection.vendor
+        posting_table = schema_editor.quote_name(Posting._meta.db_table)
+        user_table = schema_editor.quote_name(User._meta.db_table)
+        if vendor == 'postgresql':
+            schema_editor.execute(f'CREATE INDEX IF NOT EXISTS {GIN_INDEX} ON {posting_table} USING gin (search_vector)')
+        elif vendor == 'sqlite':
+            schema_editor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+                f"title, description, tags, org_name, tokenize = 'porter unicode61')"
+            )
+        schema_editor.execute(f'CREATE INDEX IF NOT EXISTS {EMAIL_INDEX} ON {user_table} (LOWER(email))')
+
+
+class CampusLinkTestRunner(DiscoverRunner):
+    """Builds the test databases from the models (see CampusLink.test_settings)."""
+
+    def setup_databases(self, **kwargs):
+        post_migrate.connect(create_raw_sql_objects, dispatch_uid='campuslink_raw_sql_objects')
+        return super().setup_databases(**kwargs)
@@ -0,0 +1,23 @@
+"""
+Settings for `python manage.py test --settings=CampusLink.test_settings`.
+
+The test databases are built straight from the models: the early MyLogin
+migrations do not apply cleanly to an empty database. CampusLink.test_runner
+adds what the migrations create with raw SQL.
+"""
+import os
+
+os.environ.setdefault('SECRET_KEY', 'campuslink-tests')
+
+from .settings import *  # noqa: E402,F401,F403
+
+MIGRATION_MODULES = {'MyLogin': None, 'Myapp': None}
+TEST_RUNNER = 'CampusLink.test_runner.CampusLinkTestRunner'
+
+# Hashing is not what these tests measure
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+if DATABASES['default']['ENGINE'] == 'django.db.backends.sqlite3':
+    # A file rather than shared memory, so the concurrency tests can open
+    # one connection per thread
+    DATABASES['default']['TEST'] = {'NAME': BASE_DIR / 'test_campuslink.sqlite3'}
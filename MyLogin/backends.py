@@ -0,0 +1,47 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.db.models import Q
+from django.db.models.functions import Lower
+
+UserModel = get_user_model()
+
+
+class EmailOrUsernameBackend(ModelBackend):
+    """
+    Log in with a username or an email address (any case). The user comes
+    back with their Profile from one query, so the role checks that follow
+    a login or load a session don't query again. Email matches use the
+    LOWER(email) index added by MyLogin migration 0012.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+
+        candidates = list(
+            UserModel._default_manager.select_related('profile')
+            .alias(email_lower=Lower('email'))
+            .filter(Q(**{UserModel.USERNAME_FIELD: username}) | Q(email_lower=username.lower()))
+        )
+        # An exact username wins; otherwise the email must identify one account
+        user = next((candidate for candidate in candidates if candidate.get_username() == username), None)
+        if user is None and len(candidates) == 1:
+            user = candidates[0]
+
+        if user is None:
+            # Run the default password hasher once to reduce the timing
+            # difference between an existing and a nonexistent user (#20760).
+            UserModel().set_password(password)
+            return None
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
+
+    def get_user(self, user_id):
+        try:
+            user = UserModel._default_manager.select_related('profile').get(pk=user_id)
+        except UserModel.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,9 @@
+from .notifications import notification_summary
+
+
+def notifications(request):
+    """Adds `unread_count` and `recent_notifications` for the header notification bell."""
+    user = getattr(request, 'user', None)
+    if user is None or not user.is_authenticated:
+        return {}
+    return notification_summary(user)
@@ -0,0 +1,83 @@
+"""
+ETag functions for django.views.decorators.http.condition.
+
+Each one reads version columns, aggregates or cached version tokens instead of
+rendering the page, so an unchanged page costs a few cheap queries and a
+304 Not Modified. Returning None skips the check and renders as usual.
+
+There is no Last-Modified: the pages also depend on notification and CSRF
+state that has no timestamp, so a date alone could answer 304 for a page
+that changed.
+"""
+import hashlib
+
+from django.conf import settings
+from django.db.models import Count, Max
+from django.utils import timezone
+
+from Myapp.feed import feed_version
+from Myapp.models import Application
+from Myapp.utils import applied_posting_ids
+from .notifications import notification_summary
+
+
+def _etag(request, *state):
+    # None of these pages display flash messages, so pending ones do not
+    # change them; a page that does must not use an ETag while any are queued
+    if request.method not in ('GET', 'HEAD'):
+        return None
+    notifications = notification_summary(request.user).get('version')
+    if notifications is None:
+        return None
+    state = (
+        settings.RELEASE_VERSION,
+        request.user.pk,
+        # Pages embed the CSRF token
+        request.COOKIES.get(settings.CSRF_COOKIE_NAME),
+        request.GET.urlencode(),
+        notifications,
+        *state,
+    )
+    return hashlib.sha256(repr(state).encode()).hexdigest()[:32]
+
+
+def student_dashboard_etag(request):
+    # Cached tokens only: counting postings or students here would cost
+    # more than the cached cards the 304 saves rendering
+    return _etag(
+        request,
+        # Active opportunities depend on the date
+        timezone.now().date(),
+        feed_version(),
+        # Integer hashes are the same in every process
+        hash(applied_posting_ids(request.user)),
+        request.user_role.profile_version,
+    )
+
+
+def my_applications_etag(request):
+    applications = request.user.applications.aggregate(
+        count=Count('id'), updated=Max('updated_at'), postings_updated=Max('posting__updated_at')
+    )
+    return _etag(
+        request,
+        applications['count'], applications['updated'], applications['postings_updated'],
+        request.user_role.profile_version,
+    )
+
+
+def application_details_etag(request, application_id):
+    details = (
+        Application.objects.filter(id=application_id, posting__organization=request.user)
+        .values_list(
+            'updated_at', 'student__first_name', 'student__last_name', 'student__email', 'student__profile__version'
+        )
+        .first()
+    )
+    if details is None:
+        return None
+    return _etag(request, *details)
+
+
+def notifications_etag(request):
+    return _etag(request, request.user_role.profile_version)
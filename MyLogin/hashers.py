@@ -0,0 +1,30 @@
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, ScryptPasswordHasher
+
+
+class TunableScryptPasswordHasher(ScryptPasswordHasher):
+    """
+    scrypt with its cost set by the PASSWORD_SCRYPT_* settings. Passwords
+    hashed at another cost are rehashed when their owner next logs in.
+    """
+
+    def __init__(self):
+        self.work_factor = settings.PASSWORD_SCRYPT_WORK_FACTOR
+        self.block_size = settings.PASSWORD_SCRYPT_BLOCK_SIZE
+        self.parallelism = settings.PASSWORD_SCRYPT_PARALLELISM
+        # scrypt needs 128 * N * r bytes; the limit (OpenSSL's default is 32 MB)
+        # leaves room to verify hashes made at up to 8 times the current cost
+        self.maxmem = 1024 * self.work_factor * self.block_size
+
+
+class TunableArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2 (needs the argon2-cffi package) with its cost set by the
+    PASSWORD_ARGON2_* settings. Passwords hashed at another cost are
+    rehashed when their owner next logs in.
+    """
+
+    def __init__(self):
+        self.time_cost = settings.PASSWORD_ARGON2_TIME_COST
+        self.memory_cost = settings.PASSWORD_ARGON2_MEMORY_COST
+        self.parallelism = settings.PASSWORD_ARGON2_PARALLELISM
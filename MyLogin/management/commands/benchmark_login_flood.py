@@ -0,0 +1,88 @@
+import time
+import uuid
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from MyLogin.models import Profile
+
+BENCH_PASSWORD = 'login-flood-password'
+UNLIMITED = (10 ** 9, 10 ** 9)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure logins/sec in this process while one IP floods the login view with wrong passwords, "
+        "with and without the login rate limits (all data is rolled back)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help="Login requests per run")
+        parser.add_argument('--attack-ratio', type=int, default=9, help="Attacker requests per genuine login")
+        parser.add_argument('--hasher', choices=sorted(settings.PASSWORD_HASHER_CHOICES),
+                            default=settings.PASSWORD_HASHER, help="Password hasher for the benchmark accounts")
+
+    def handle(self, *args, **options):
+        hasher = settings.PASSWORD_HASHER_CHOICES[options['hasher']]
+        hashers = [hasher] + [path for path in settings.PASSWORD_HASHERS if path != hasher]
+        with override_settings(PASSWORD_HASHERS=hashers), transaction.atomic():
+            started = time.perf_counter()
+            password = make_password(BENCH_PASSWORD)
+            self.stdout.write(f"Hasher {options['hasher']}: one hash takes {(time.perf_counter() - started) * 1000:.0f} ms")
+
+            students = User.objects.bulk_create([
+                User(username=f'flood-{i}@example.com', email=f'flood-{i}@example.com', password=password)
+                for i in range(options['requests'])
+            ])
+            Profile.objects.bulk_create([Profile(user=user, role='Student') for user in students])
+
+            self.run("Without rate limits", students, options, UNLIMITED, UNLIMITED)
+            self.run("With rate limits", students, options,
+                     settings.LOGIN_RATE_LIMIT_IP, settings.LOGIN_RATE_LIMIT_ACCOUNT)
+            transaction.set_rollback(True)
+        self.stdout.write(self.style.SUCCESS("Done; benchmark data rolled back."))
+
+    def run(self, label, students, options, ip_limit, account_limit):
+        url = reverse('login')
+        host = settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS else 'localhost'
+        # Fresh keys each run, so buckets left over from the previous run don't count
+        run_id = uuid.uuid4().hex[:8]
+        attacker_ip = f'attacker-{run_id}'
+        counts = {'logins': 0, 'refused': 0, 'attacks': 0, 'attacks_blocked': 0}
+
+        started = time.perf_counter()
+        with override_settings(LOGIN_RATE_LIMIT_IP=ip_limit, LOGIN_RATE_LIMIT_ACCOUNT=account_limit):
+            for i in range(options['requests']):
+                client = Client(HTTP_HOST=host)
+                if i % (options['attack_ratio'] + 1):
+                    # Credential stuffing: a different (unknown) account each time, all from one address
+                    response = client.post(
+                        url, {'email': f'victim-{run_id}-{i}@example.com', 'password': 'guess', 'role': 'Student'},
+                        REMOTE_ADDR=attacker_ip
+                    )
+                    counts['attacks'] += 1
+                    counts['attacks_blocked'] += response.status_code == 429
+                else:
+                    student = students[i]
+                    response = client.post(
+                        url, {'email': student.email, 'password': BENCH_PASSWORD, 'role': 'Student'},
+                        REMOTE_ADDR=f'student-{run_id}-{i}'
+                    )
+                    if response.status_code == 302 and response.url == reverse('student_dashboard'):
+                        counts['logins'] += 1
+                    else:
+                        counts['refused'] += 1
+        elapsed = time.perf_counter() - started
+
+        if counts['refused']:
+            raise CommandError(f"{label}: {counts['refused']} genuine logins were refused.")
+        self.stdout.write(
+            f"{label}: {counts['logins']} genuine logins in {elapsed:.1f}s "
+            f"({counts['logins'] / elapsed:.2f} logins/sec); "
+            f"{counts['attacks_blocked']} of {counts['attacks']} attacker requests refused before hashing"
+        )
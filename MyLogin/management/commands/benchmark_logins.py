@@ -0,0 +1,74 @@
+import time
+from statistics import quantiles
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from MyLogin.models import Profile
+
+BENCH_EMAIL = 'Login.Bench@example.com'
+BENCH_PASSWORD = 'login-benchmark-password'
+BACKENDS = (
+    'django.contrib.auth.backends.ModelBackend',
+    'MyLogin.backends.EmailOrUsernameBackend',
+)
+# Rate limits high enough that the benchmark's logins are never refused
+UNLIMITED = (10 ** 9, 10 ** 9)
+
+
+class Command(BaseCommand):
+    help = "Measure login throughput and queries per login through the login view (all data is rolled back)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--logins', type=int, default=50, help="Logins per authentication backend")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            user = User.objects.create_user(username=BENCH_EMAIL, email=BENCH_EMAIL, password=BENCH_PASSWORD)
+            Profile.objects.create(user=user, role='Student')
+            for backend in BACKENDS:
+                with override_settings(AUTHENTICATION_BACKENDS=[backend],
+                                       LOGIN_RATE_LIMIT_IP=UNLIMITED, LOGIN_RATE_LIMIT_ACCOUNT=UNLIMITED):
+                    self.run(backend, options['logins'])
+            transaction.set_rollback(True)
+        self.stdout.write(self.style.SUCCESS("Done; benchmark data rolled back."))
+
+    def run(self, backend, count):
+        # ModelBackend only matches the username exactly; this one also takes the email in any case
+        login_as = BENCH_EMAIL if backend.endswith('ModelBackend') else BENCH_EMAIL.lower()
+        url = reverse('login')
+        host = settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS else 'localhost'
+        timings = []
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(count):
+                # A fresh client each time, so every login starts without a session
+                client = Client(HTTP_HOST=host)
+                started = time.perf_counter()
+                response = client.post(url, {'email': login_as, 'password': BENCH_PASSWORD, 'role': 'Student'})
+                timings.append((time.perf_counter() - started) * 1000)
+                if response.status_code != 302 or response.url != reverse('student_dashboard'):
+                    self.stderr.write(f"{backend}: login failed")
+                    return
+        login_queries = len(queries) / count
+        user_queries = sum('FROM "auth_user"' in query['sql'] for query in queries) / count
+        profile_queries = sum(
+            'FROM "MyLogin_profile"' in query['sql'] or 'JOIN "MyLogin_profile"' in query['sql'] for query in queries
+        ) / count
+
+        hash_started = time.perf_counter()
+        User(password=User.objects.get(username=BENCH_EMAIL).password).check_password(BENCH_PASSWORD)
+        hashing = (time.perf_counter() - hash_started) * 1000
+
+        cuts = quantiles(timings, n=100, method='inclusive')
+        self.stdout.write(
+            f"{backend}\n"
+            f"  {1000 / (sum(timings) / count):.1f} logins/sec, p50 {cuts[49]:.1f} ms, p99 {cuts[98]:.1f} ms "
+            f"(password check alone {hashing:.1f} ms)\n"
+            f"  {login_queries:.1f} queries per login "
+            f"({user_queries:.1f} reading auth_user, {profile_queries:.1f} reading the profile)"
+        )
@@ -0,0 +1,50 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from MyLogin.notifications import NOTIFY_BATCH_SIZE, notify_many
+
+
+class Command(BaseCommand):
+    help = "Measure bulk notification fan-out throughput (all data is rolled back)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--recipients', type=int, default=100_000, help="Number of recipients to notify")
+        parser.add_argument('--batch-size', type=int, default=NOTIFY_BATCH_SIZE, help="Rows per INSERT")
+
+    def handle(self, *args, **options):
+        count = options['recipients']
+        batch_size = options['batch_size']
+
+        with transaction.atomic():
+            self.stdout.write(f"Creating {count} throwaway recipients...")
+            User.objects.bulk_create(
+                [User(username=f'notify-bench-{i}', password='!') for i in range(count)],
+                batch_size=batch_size
+            )
+            recipient_ids = User.objects.filter(username__startswith='notify-bench-').values_list('id', flat=True)
+
+            def run(label):
+                started = time.perf_counter()
+                created = notify_many(
+                    recipient_ids,
+                    notification_type='posting_approved',
+                    title='Benchmark',
+                    message='Bulk notification benchmark',
+                    dedup_key='benchmark',
+                    batch_size=batch_size
+                )
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f"{label}: {created} created in {elapsed:.2f}s "
+                    f"({count / elapsed:,.0f} recipients/sec)"
+                )
+
+            run("First send")
+            run("Retry (deduplicated)")
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS("Done; benchmark data rolled back."))
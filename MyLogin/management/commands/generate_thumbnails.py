@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from MyLogin.models import Profile
+from MyLogin.thumbnails import THUMBNAIL_FIELDS, generate_profile_thumbnails, stale_thumbnail_fields
+
+
+class Command(BaseCommand):
+    help = "Generate missing or outdated profile picture and logo thumbnails (backfill, or after their jobs failed)"
+
+    def handle(self, *args, **options):
+        has_image = Q()
+        for field in THUMBNAIL_FIELDS:
+            has_image |= ~Q(**{field: ''}) & Q(**{f'{field}__isnull': False})
+        # Profiles whose images were cleared still need their thumbnails dropped
+        profiles = Profile.objects.filter(has_image | ~Q(thumbnails={}))
+
+        updated = 0
+        for profile in profiles.iterator():
+            if stale_thumbnail_fields(profile):
+                generate_profile_thumbnails(profile.pk)
+                updated += 1
+        self.stdout.write(self.style.SUCCESS(f"Refreshed thumbnails for {updated} profiles."))
@@ -0,0 +1,124 @@
+import asyncio
+import resource
+import time
+from importlib import import_module
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.contrib.auth.models import User
+from django.core.handlers.asgi import ASGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+
+from MyLogin.notifications import notify
+from MyLogin.realtime import get_broker
+
+LOADTEST_USERNAME = 'notification-stream-loadtest'
+
+
+class StreamClient:
+    """One fake browser holding an event stream open against the ASGI handler."""
+
+    def __init__(self):
+        self.messages = asyncio.Queue()
+        self.messages.put_nowait({'type': 'http.request', 'body': b'', 'more_body': False})
+        self.status = None
+        self.opened = asyncio.Event()
+        self.delivered = asyncio.Event()
+
+    async def receive(self):
+        return await self.messages.get()
+
+    async def send(self, message):
+        if message['type'] == 'http.response.start':
+            self.status = message['status']
+        elif message['type'] == 'http.response.body':
+            self.opened.set()
+            if b'event: notifications' in message.get('body', b''):
+                self.delivered.set()
+
+    def disconnect(self):
+        self.messages.put_nowait({'type': 'http.disconnect'})
+
+
+def _rss_mb():
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class Command(BaseCommand):
+    help = "Hold many notification event streams open in one process and time a delivery to all of them"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--connections', type=int, default=1000, help="Number of streams to open")
+        parser.add_argument('--timeout', type=float, default=60, help="Seconds to wait for each phase")
+
+    def handle(self, *args, **options):
+        user, _ = User.objects.get_or_create(username=LOADTEST_USERNAME)
+        session = import_module(settings.SESSION_ENGINE).SessionStore()
+        session[SESSION_KEY] = str(user.pk)
+        session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.save()
+
+        try:
+            asyncio.run(self.run(user, session.session_key, options['connections'], options['timeout']))
+        finally:
+            session.delete()
+            user.delete()
+
+    async def run(self, user, session_key, connections, timeout):
+        handler = ASGIHandler()
+        path = reverse('notification_stream')
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': 'GET',
+            'scheme': 'http',
+            'path': path,
+            'raw_path': path.encode(),
+            'query_string': b'',
+            'root_path': '',
+            'headers': [
+                (b'host', b'localhost'),
+                (b'cookie', f'{settings.SESSION_COOKIE_NAME}={session_key}'.encode()),
+            ],
+            'client': ('127.0.0.1', 0),
+            'server': ('localhost', 80),
+        }
+
+        rss_before = _rss_mb()
+        started = time.perf_counter()
+        clients = [StreamClient() for _ in range(connections)]
+        tasks = [asyncio.create_task(handler(dict(scope), client.receive, client.send)) for client in clients]
+        try:
+            await asyncio.wait_for(asyncio.gather(*(client.opened.wait() for client in clients)), timeout)
+        except asyncio.TimeoutError:
+            raise CommandError(f"Only {sum(c.opened.is_set() for c in clients)} of {connections} streams opened.")
+        failed = [client.status for client in clients if client.status != 200]
+        if failed:
+            raise CommandError(f"{len(failed)} streams were refused (status {failed[0]}).")
+
+        opened_in = time.perf_counter() - started
+        self.stdout.write(
+            f"Opened {connections} streams in {opened_in:.2f}s; "
+            f"{get_broker().connection_count()} connections held by this worker, "
+            f"peak RSS {_rss_mb():.0f} MB (+{_rss_mb() - rss_before:.0f} MB)"
+        )
+
+        started = time.perf_counter()
+        await sync_to_async(notify)(user, 'posting_approved', 'Load test', 'Notification stream load test')
+        try:
+            await asyncio.wait_for(asyncio.gather(*(client.delivered.wait() for client in clients)), timeout)
+        except asyncio.TimeoutError:
+            raise CommandError(f"Only {sum(c.delivered.is_set() for c in clients)} of {connections} streams got the event.")
+        self.stdout.write(f"Delivered one notification to all {connections} streams in {time.perf_counter() - started:.2f}s")
+
+        for client in clients:
+            client.disconnect()
+        await asyncio.wait(tasks, timeout=timeout)
+        self.stdout.write(self.style.SUCCESS(
+            f"Closed; {get_broker().connection_count()} connections still subscribed."
+        ))
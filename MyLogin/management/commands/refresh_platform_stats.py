@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from MyLogin.stats import PLATFORM_STATS_CACHE_TIMEOUT, refresh_platform_stats
+from Myapp.utils import cache_is_per_process
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the admin dashboard statistics and store them in the cache. "
+        f"Run more often than every {PLATFORM_STATS_CACHE_TIMEOUT // 60} minutes (e.g. from cron)."
+    )
+
+    def handle(self, *args, **options):
+        if cache_is_per_process():
+            # The numbers would be cached in this process only, where no page is served
+            raise CommandError(
+                "Refreshing the statistics needs a cache shared with the web processes; "
+                "set CACHE_BACKEND (e.g. django.core.cache.backends.filebased.FileBasedCache) and CACHE_LOCATION."
+            )
+        stats = refresh_platform_stats()
+        self.stdout.write(self.style.SUCCESS(
+            f"{stats['total_users']} users, {stats['active_postings']} active postings, "
+            f"{stats['applications_submitted']} applications ({stats['success_rate']}% accepted)."
+        ))
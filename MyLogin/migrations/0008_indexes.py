@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('MyLogin', '0007_add_skills_and_portfolio'),
+        ('Myapp', '0013_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', '-timestamp'], name='notif_recipient_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('is_archived', False), ('read', False)), fields=['recipient'], name='notif_unread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(fields=['role', 'verification_status'], name='profile_role_verif_idx'),
+        ),
+    ]
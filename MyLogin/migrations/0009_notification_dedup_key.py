@@ -0,0 +1,30 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('MyLogin', '0008_indexes'),
+        ('Myapp', '0014_application_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='dedup_key',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='notification_type',
+            field=models.CharField(choices=[('posting_approved', 'Posting Approved'), ('posting_rejected', 'Posting Rejected'), ('verification_approved', 'Verification Approved'), ('verification_rejected', 'Verification Rejected'), ('new_application', 'New Application'), ('application_status_update', 'Application Status Update')], max_length=50),
+        ),
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.UniqueConstraint(condition=models.Q(('dedup_key__isnull', False)), fields=('recipient', 'dedup_key'), name='notif_recipient_dedup_uniq'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-17 19:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('MyLogin', '0009_notification_dedup_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
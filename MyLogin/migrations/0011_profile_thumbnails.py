@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-17 19:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('MyLogin', '0010_profile_versioning'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='thumbnails',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,26 @@
+from django.db import migrations
+
+EMAIL_INDEX = 'auth_user_email_lower_idx'
+
+
+def create_email_index(apps, schema_editor):
+    """Case-insensitive email lookups at login (see MyLogin.backends); auth.User has no Meta we can add it to."""
+    User = apps.get_model('auth', 'User')
+    table = schema_editor.quote_name(User._meta.db_table)
+    schema_editor.execute(f'CREATE INDEX {EMAIL_INDEX} ON {table} (LOWER(email))')
+
+
+def drop_email_index(apps, schema_editor):
+    schema_editor.execute(f'DROP INDEX IF EXISTS {EMAIL_INDEX}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('MyLogin', '0011_profile_thumbnails'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_email_index, drop_email_index),
+    ]
@@ -3,7 +3,37 @@ from django.contrib.auth.models import User
 from django.utils import timezone
 
 
-class Profile(models.Model):
+class Versioned(models.Model):
+    """
+    A last-modified time and a version number that goes up on every save,
+    used to validate cached pages (ETags). Queryset .update() calls bypass
+    save(); pass **version_bump() to them when they change what is shown.
+    """
+    updated_at = models.DateTimeField(auto_now=True)
+    version = models.PositiveIntegerField(default=1, editable=False)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        bumped = not self._state.adding
+        if bumped:
+            # Incremented in the database so concurrent saves never share a version
+            self.version = models.F('version') + 1
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'version', 'updated_at'}
+        super().save(*args, **kwargs)
+        if bumped:
+            self.refresh_from_db(fields=['version'])
+
+
+def version_bump():
+    """Field updates that mark rows of a Versioned model as changed."""
+    return {'version': models.F('version') + 1, 'updated_at': timezone.now()}
+
+
+class Profile(Versioned):
     ROLE_CHOICES = (
         ('Student', 'Student'),
         ('Organization', 'Organization'),
@@ -35,6 +65,9 @@ class Profile(models.Model):
     # PROFILE & LOGO
     profile_picture = models.ImageField(upload_to='profile_pics/', null=True, blank=True)
     org_logo = models.ImageField(upload_to="org_logos/", null=True, blank=True)
+    # Resized WebP/AVIF copies of the two images, written by a job
+    # (see MyLogin.thumbnails): {field: {'source': name, format: [[name, width, height], ...]}}
+    thumbnails = models.JSONField(default=dict, blank=True, editable=False)
 
     # ORG DETAILS (US-76)
     description = models.TextField(null=True, blank=True)
@@ -66,6 +99,12 @@ class Profile(models.Model):
     verified_at = models.DateTimeField(null=True, blank=True)
     verification_submitted_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            # Admin queues and the verified-organization join in the student feed
+            models.Index(fields=['role', 'verification_status'], name='profile_role_verif_idx'),
+        ]
+
     def __str__(self):
         return f"{self.user.username} ({self.role})"
 
@@ -84,6 +123,8 @@ class Notification(models.Model):
         ('posting_rejected', 'Posting Rejected'),
         ('verification_approved', 'Verification Approved'),
         ('verification_rejected', 'Verification Rejected'),
+        ('new_application', 'New Application'),
+        ('application_status_update', 'Application Status Update'),
     )
     
     recipient = models.ForeignKey(User, on_delete=models.CASCADE, related_name='notifications')
@@ -98,10 +139,31 @@ class Notification(models.Model):
     # ➕ Add these:
     is_archived = models.BooleanField(default=False)
     is_favorite = models.BooleanField(default=False)
+
+    # Identifies one logical send (e.g. "posting_closed:42") so a fan-out can
+    # be retried without notifying anyone twice; see MyLogin.notifications
+    dedup_key = models.CharField(max_length=100, null=True, blank=True)
     
     def __str__(self):
         return f"{self.title} - {self.recipient.username}"
     
     class Meta:
         ordering = ['-timestamp']
+        indexes = [
+            # Recent notifications dropdown: recipient's latest 5
+            models.Index(fields=['recipient', '-timestamp'], name='notif_recipient_ts_idx'),
+            # Unread badge count, only covers the unread/unarchived rows
+            models.Index(
+                fields=['recipient'],
+                condition=models.Q(read=False, is_archived=False),
+                name='notif_unread_idx',
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['recipient', 'dedup_key'],
+                condition=models.Q(dedup_key__isnull=False),
+                name='notif_recipient_dedup_uniq',
+            ),
+        ]
 
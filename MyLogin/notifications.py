@@ -0,0 +1,184 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from Myapp.models import Application
+
+from .models import Notification
+from .realtime import publish_notifications
+
+# Notifications shown in the header bell dropdown
+RECENT_NOTIFICATIONS_LIMIT = 5
+NOTIFICATION_SUMMARY_CACHE_TIMEOUT = 300  # seconds
+
+# Rows per INSERT when fanning a notification out to many recipients
+NOTIFY_BATCH_SIZE = 1000
+
+# Most notifications sent in one live update (event stream / long poll)
+MAX_LIVE_NOTIFICATIONS = 20
+
+
+def _summary_cache_key(user_id):
+    return f'notifications:summary:{user_id}'
+
+
+def notification_summary(user):
+    """
+    The header bell for a user: unread (non-archived) count and the most
+    recent notifications. Cached per user; MyLogin.signals clears the entry
+    whenever one of the user's notifications changes, so the summary's
+    `version` token also identifies the state of all of them.
+    """
+    key = _summary_cache_key(user.pk)
+    summary = cache.get(key)
+    if summary is None:
+        summary = {
+            'unread_count': Notification.objects.filter(recipient=user, read=False, is_archived=False).count(),
+            'recent_notifications': list(
+                Notification.objects.filter(recipient=user).order_by('-timestamp')[:RECENT_NOTIFICATIONS_LIMIT]
+            ),
+            'version': time.time_ns(),
+        }
+        cache.set(key, summary, NOTIFICATION_SUMMARY_CACHE_TIMEOUT)
+    return summary
+
+
+def invalidate_notification_summary(user_id):
+    """Call after queryset updates, which bypass the model signals."""
+    cache.delete(_summary_cache_key(user_id))
+
+
+def latest_notification_id(user):
+    return Notification.objects.filter(recipient=user).order_by('-id').values_list('id', flat=True).first() or 0
+
+
+def notification_payload(user, after_id):
+    """New notifications for a user since `after_id`, plus the current badge count."""
+    notifications = list(
+        Notification.objects.filter(recipient=user, id__gt=after_id, is_archived=False)
+        .order_by('id')[:MAX_LIVE_NOTIFICATIONS]
+    )
+    return {
+        'last_id': notifications[-1].id if notifications else after_id,
+        'unread_count': notification_summary(user)['unread_count'],
+        'notifications': [
+            {
+                'id': notification.id,
+                'title': notification.title,
+                'message': notification.message,
+                'notification_type': notification.notification_type,
+                'timestamp': notification.timestamp.isoformat(),
+            }
+            for notification in notifications
+        ],
+    }
+
+
+def _invalidate_summaries(user_ids):
+    keys = [_summary_cache_key(user_id) for user_id in user_ids]
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def _recipient_ids(recipients, batch_size):
+    """Yield each distinct recipient id from users, ids or a queryset of either."""
+    if isinstance(recipients, QuerySet):
+        recipients = recipients.iterator(chunk_size=batch_size)
+    seen = set()
+    for recipient in recipients:
+        recipient_id = getattr(recipient, 'pk', recipient)
+        if recipient_id not in seen:
+            seen.add(recipient_id)
+            yield recipient_id
+
+
+def _batches(ids, batch_size):
+    batch = []
+    for item in ids:
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def notify_many(recipients, notification_type, title, message, sender=None, related_posting=None,
+                dedup_key=None, batch_size=NOTIFY_BATCH_SIZE):
+    """
+    Send the same notification to many recipients with one INSERT per
+    `batch_size` rows. `recipients` may be users, user ids, or a queryset
+    of either (e.g. a values_list of student ids); sender and
+    related_posting may be instances or ids.
+
+    With a dedup_key, recipients who already received a notification with
+    that key are skipped, so a fan-out can safely be retried.
+    Returns the number of notifications created.
+    """
+    created = 0
+    timestamp = timezone.now()
+    sender_id = getattr(sender, 'pk', sender)
+    related_posting_id = getattr(related_posting, 'pk', related_posting)
+    for batch in _batches(_recipient_ids(recipients, batch_size), batch_size):
+        if dedup_key:
+            already_sent = set(
+                Notification.objects.filter(dedup_key=dedup_key, recipient_id__in=batch)
+                .values_list('recipient_id', flat=True)
+            )
+            batch = [recipient_id for recipient_id in batch if recipient_id not in already_sent]
+            if not batch:
+                continue
+
+        Notification.objects.bulk_create(
+            [
+                Notification(
+                    recipient_id=recipient_id,
+                    sender_id=sender_id,
+                    notification_type=notification_type,
+                    title=title,
+                    message=message,
+                    related_posting_id=related_posting_id,
+                    timestamp=timestamp,
+                    dedup_key=dedup_key,
+                )
+                for recipient_id in batch
+            ],
+            # A concurrent send with the same key may have won the race
+            ignore_conflicts=bool(dedup_key),
+        )
+        if dedup_key:
+            # Rows that lost the race were dropped without an error, so count what was written
+            created += Notification.objects.filter(
+                dedup_key=dedup_key, recipient_id__in=batch, timestamp=timestamp
+            ).count()
+        else:
+            created += len(batch)
+        # bulk_create skips the model signals, so clear the badges and
+        # wake any live connections here
+        _invalidate_summaries(batch)
+        publish_notifications(batch)
+    return created
+
+
+def notify(recipient, notification_type, title, message, sender=None, related_posting=None, dedup_key=None):
+    """Send a single notification. Returns False if dedup_key was already sent to this recipient."""
+    return notify_many(
+        [recipient], notification_type, title, message,
+        sender=sender, related_posting=related_posting, dedup_key=dedup_key
+    ) == 1
+
+
+def notify_posting_applicants(posting, notification_type, title, message, sender=None, dedup_key=None,
+                              exclude_statuses=('withdrawn',)):
+    """Fan a notification out to everyone who applied to a posting."""
+    student_ids = (
+        Application.objects.filter(posting=posting)
+        .exclude(status__in=exclude_statuses)
+        .values_list('student_id', flat=True)
+    )
+    return notify_many(
+        student_ids, notification_type, title, message,
+        sender=sender, related_posting=posting, dedup_key=dedup_key
+    )
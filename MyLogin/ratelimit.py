@@ -0,0 +1,100 @@
+import hashlib
+import math
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.contrib import messages
+from django.core.cache import cache
+from django.shortcuts import render
+
+
+class TokenBucket:
+    """
+    A token bucket per key, kept in the default cache. Each attempt takes a
+    token; tokens come back at `per_minute` a minute up to `capacity`.
+
+    The read-modify-write is not atomic, so concurrent requests can
+    occasionally take one token too many; good enough to keep floods off
+    the password hasher.
+    """
+
+    def __init__(self, name, capacity, per_minute):
+        self.name = name
+        self.capacity = capacity
+        self.rate = per_minute / 60
+
+    def _cache_key(self, key):
+        return f'ratelimit:{self.name}:{hashlib.sha256(key.encode()).hexdigest()[:32]}'
+
+    def _level(self, key, now):
+        tokens, updated = cache.get(self._cache_key(key), (self.capacity, now))
+        return min(self.capacity, tokens + (now - updated) * self.rate)
+
+    def retry_after(self, key):
+        """Seconds until a token is available (0 if one is now), without taking it."""
+        tokens = self._level(key, time.time())
+        return 0 if tokens >= 1 else math.ceil((1 - tokens) / self.rate)
+
+    def consume(self, key):
+        """Take a token; returns 0, or the seconds to wait if the bucket is empty."""
+        now = time.time()
+        tokens = self._level(key, now)
+        if tokens < 1:
+            return math.ceil((1 - tokens) / self.rate)
+        # Kept only until the bucket would be full again
+        timeout = math.ceil((self.capacity - tokens + 1) / self.rate)
+        cache.set(self._cache_key(key), (tokens - 1, now), timeout)
+        return 0
+
+
+def ip_bucket():
+    return TokenBucket('login-ip', *settings.LOGIN_RATE_LIMIT_IP)
+
+
+def account_bucket():
+    return TokenBucket('login-account', *settings.LOGIN_RATE_LIMIT_ACCOUNT)
+
+
+def client_ip(request):
+    """The client address, taken from X-Forwarded-For behind NUM_PROXIES trusted proxies."""
+    if settings.NUM_PROXIES:
+        forwarded = [ip.strip() for ip in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',') if ip.strip()]
+        if len(forwarded) >= settings.NUM_PROXIES:
+            return forwarded[-settings.NUM_PROXIES]
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def _account_key(username):
+    return (username or '').strip().lower()
+
+
+def login_rate_limited(username_field, template_name):
+    """
+    Refuse login POSTs (429, before any password is hashed) once the
+    client IP or the account has used up its failed attempts.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method == 'POST':
+                account = _account_key(request.POST.get(username_field))
+                retry_after = account_bucket().retry_after(account) if account else 0
+                retry_after = retry_after or ip_bucket().retry_after(client_ip(request))
+                if retry_after:
+                    messages.error(request, f"Too many login attempts. Please try again in {retry_after} seconds.")
+                    response = render(request, template_name, status=429)
+                    response['Retry-After'] = str(retry_after)
+                    return response
+            return view_func(request, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_failed_login(username, request=None):
+    """Failed attempts use up the account's and the client IP's tokens; successful logins never do."""
+    account = _account_key(username)
+    if account:
+        account_bucket().consume(account)
+    if request is not None:
+        ip_bucket().consume(client_ip(request))
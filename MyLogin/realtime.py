@@ -0,0 +1,103 @@
+import asyncio
+import json
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+# Seconds between keep-alive comments on an idle event stream. Each one also
+# re-checks the database, which picks up notifications published by other
+# worker processes when the in-process broker is in use.
+STREAM_HEARTBEAT = 15
+# Seconds a long-poll request waits for a new notification before returning
+LONG_POLL_TIMEOUT = 25
+# Seconds a client waits between polls under WSGI, where a request may not be held open
+SHORT_POLL_INTERVAL = 15
+
+
+class InProcessBroker:
+    """
+    Wakes up the open notification connections of a user in this process.
+
+    Messages carry no data; a woken connection reads new rows from the
+    database. A Redis (or other) broker only needs the same three methods
+    and can be selected with the NOTIFICATION_BROKER setting.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._waiters = defaultdict(set)
+
+    def subscribe(self, user_id, waiter):
+        with self._lock:
+            self._waiters[user_id].add(waiter)
+
+    def unsubscribe(self, user_id, waiter):
+        with self._lock:
+            waiters = self._waiters.get(user_id)
+            if waiters is not None:
+                waiters.discard(waiter)
+                if not waiters:
+                    del self._waiters[user_id]
+
+    def publish(self, user_id):
+        with self._lock:
+            waiters = list(self._waiters.get(user_id, ()))
+        for waiter in waiters:
+            waiter.wake()
+
+    def connection_count(self):
+        with self._lock:
+            return sum(len(waiters) for waiters in self._waiters.values())
+
+
+class Waiter:
+    """An open connection waiting on the broker, woken from any thread."""
+
+    def __init__(self):
+        self._loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+
+    def wake(self):
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:
+            pass  # the connection's event loop has already closed
+
+    async def wait(self, timeout):
+        """Return True if woken, False on timeout."""
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._event.clear()
+
+
+_broker = None
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        _broker = import_string(getattr(settings, 'NOTIFICATION_BROKER', 'MyLogin.realtime.InProcessBroker'))()
+    return _broker
+
+
+def publish_notifications(user_ids):
+    """Wake the connections of these users once the current transaction commits."""
+    user_ids = list(user_ids)
+    transaction.on_commit(lambda: _publish(user_ids))
+
+
+def _publish(user_ids):
+    broker = get_broker()
+    for user_id in user_ids:
+        broker.publish(user_id)
+
+
+def format_event(payload):
+    return f"id: {payload['last_id']}\nevent: notifications\ndata: {json.dumps(payload)}\n\n"
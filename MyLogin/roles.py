@@ -0,0 +1,71 @@
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import Profile
+
+ROLE_CACHE_TIMEOUT = 3600  # seconds
+
+
+class UserRole:
+    """
+    The parts of a user's Profile needed to authorize a request, cached so
+    role checks don't load the Profile. Attached to each request as
+    `request.user_role` by Myapp.middleware.user_role.
+    """
+    __slots__ = ('role', 'verification_status', 'display_name', 'profile_version')
+
+    def __init__(self, role=None, verification_status=None, display_name='', profile_version=None):
+        self.role = role
+        self.verification_status = verification_status
+        self.display_name = display_name
+        self.profile_version = profile_version
+
+    def __repr__(self):
+        return f'<UserRole {self.role} ({self.verification_status})>'
+
+    @property
+    def is_student(self):
+        return self.role == 'Student'
+
+    @property
+    def is_organization(self):
+        return self.role == 'Organization'
+
+    @property
+    def is_verified_organization(self):
+        return self.role == 'Organization' and self.verification_status == 'verified'
+
+
+ANONYMOUS_ROLE = UserRole()
+
+
+def _role_cache_key(user_id):
+    return f'profile:role:{user_id}'
+
+
+def get_user_role(user):
+    if not user.is_authenticated:
+        return ANONYMOUS_ROLE
+
+    key = _role_cache_key(user.pk)
+    fields = cache.get(key)
+    if fields is None:
+        profile = (
+            Profile.objects.filter(user_id=user.pk)
+            .values_list('role', 'verification_status', 'org_name', 'full_name', 'version')
+            .first()
+        )
+        fallback_name = user.get_full_name() or user.username
+        if profile is None:
+            fields = (None, None, fallback_name, None)
+        else:
+            role, verification_status, org_name, full_name, version = profile
+            name = org_name if role == 'Organization' else full_name
+            fields = (role, verification_status, name or fallback_name, version)
+        cache.set(key, fields, ROLE_CACHE_TIMEOUT)
+    return UserRole(*fields)
+
+
+def invalidate_user_role(user_id):
+    """Forget the cached role once the current transaction commits (call on every Profile change)."""
+    transaction.on_commit(lambda: cache.delete(_role_cache_key(user_id)))
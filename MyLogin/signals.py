@@ -0,0 +1,47 @@
+from django.contrib.auth.signals import user_login_failed
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Notification, Profile
+from .notifications import invalidate_notification_summary
+from .ratelimit import record_failed_login
+from .realtime import publish_notifications
+from .roles import invalidate_user_role
+from .tasks import make_thumbnails
+from .thumbnails import stale_thumbnail_fields
+
+
+@receiver(post_save, sender=Notification)
+@receiver(post_delete, sender=Notification)
+def clear_notification_summary(sender, instance, **kwargs):
+    """Created, read, archived or deleted: the recipient's bell needs a refresh."""
+    recipient_id = instance.recipient_id
+    transaction.on_commit(lambda: invalidate_notification_summary(recipient_id))
+
+
+@receiver(post_save, sender=Notification)
+def publish_new_notification(sender, instance, created, raw=False, **kwargs):
+    """Push new notifications to the recipient's open streams / long polls."""
+    if created and not raw:
+        publish_notifications([instance.recipient_id])
+
+
+@receiver(post_save, sender=Profile)
+def refresh_profile_thumbnails(sender, instance, raw=False, **kwargs):
+    """A new profile picture or logo gets resized copies from a job."""
+    if not raw and stale_thumbnail_fields(instance):
+        make_thumbnails.enqueue(profile_id=instance.pk)
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def clear_user_role(sender, instance, **kwargs):
+    """Role, verification status, name or version may have changed."""
+    invalidate_user_role(instance.user_id)
+
+
+@receiver(user_login_failed)
+def count_failed_login(sender, credentials, request=None, **kwargs):
+    """Wrong passwords count against the account's and the client's login rate limits."""
+    record_failed_login(credentials.get('username'), request)
@@ -0,0 +1,60 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from Myapp.models import OrganizationApplicationStats, Posting
+
+from .models import Profile
+
+PLATFORM_STATS_CACHE_KEY = 'admin:platform_stats'
+# Long enough that the periodic refresh_platform_stats job keeps the admin
+# dashboard from ever computing the numbers itself
+PLATFORM_STATS_CACHE_TIMEOUT = 15 * 60  # seconds
+
+
+def compute_platform_stats():
+    """
+    Platform-wide numbers for the admin dashboard, in four small queries.
+    Application counts come from the per-organization rollup rows rather
+    than the Application table.
+    """
+    users_by_role = dict(Profile.objects.order_by().values_list('role').annotate(count=Count('id')))
+
+    postings = Posting.objects.aggregate(
+        total=Count('id'),
+        active=Count('id', filter=Q(approval_status='approved', status='Active', deadline__gte=date.today())),
+    )
+
+    counters = OrganizationApplicationStats.COUNTER_FIELDS
+    totals = OrganizationApplicationStats.objects.aggregate(**{field: Sum(field) for field in counters})
+    applications = OrganizationApplicationStats(**{field: totals[field] or 0 for field in counters})
+
+    return {
+        'total_users': User.objects.count(),
+        'users_by_role': users_by_role,
+        'student_count': users_by_role.get('Student', 0),
+        'organization_count': users_by_role.get('Organization', 0),
+        'total_postings': postings['total'],
+        'active_postings': postings['active'],
+        'applications_submitted': applications.applicant_count,
+        'applications_by_status': {field: getattr(applications, field) for field in counters},
+        'success_rate': applications.acceptance_rate,
+        'computed_at': timezone.now(),
+    }
+
+
+def refresh_platform_stats():
+    stats = compute_platform_stats()
+    cache.set(PLATFORM_STATS_CACHE_KEY, stats, PLATFORM_STATS_CACHE_TIMEOUT)
+    return stats
+
+
+def platform_stats():
+    """Cached platform statistics; recomputed when the cache entry expires."""
+    stats = cache.get(PLATFORM_STATS_CACHE_KEY)
+    if stats is None:
+        stats = refresh_platform_stats()
+    return stats
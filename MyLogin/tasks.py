@@ -0,0 +1,31 @@
+from Myapp.jobs import task
+
+from .notifications import notify_many
+from .thumbnails import generate_profile_thumbnails
+
+
+@task
+def send_notification(recipient_ids, notification_type, title, message, sender_id=None, related_posting_id=None,
+                      dedup_key=None):
+    notify_many(
+        recipient_ids, notification_type, title, message,
+        sender=sender_id, related_posting=related_posting_id, dedup_key=dedup_key
+    )
+
+
+def notify_later(recipient, notification_type, title, message, sender=None, related_posting=None, dedup_key=None):
+    """Like notify(), but written by a job: by the worker if JOB_WORKER is set, else right after commit."""
+    return send_notification.enqueue(
+        recipient_ids=[getattr(recipient, 'pk', recipient)],
+        notification_type=notification_type,
+        title=title,
+        message=message,
+        sender_id=getattr(sender, 'pk', sender),
+        related_posting_id=getattr(related_posting, 'pk', related_posting),
+        dedup_key=dedup_key,
+    )
+
+
+@task
+def make_thumbnails(profile_id):
+    generate_profile_thumbnails(profile_id)
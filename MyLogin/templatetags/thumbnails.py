@@ -0,0 +1,35 @@
+from django import template
+from django.templatetags.static import static
+from django.utils.html import format_html
+
+from MyLogin.thumbnails import thumbnail_srcset, thumbnail_url
+
+register = template.Library()
+
+
+@register.simple_tag
+def image_attrs(profile, field, size, default=None):
+    """
+    src, srcset and sizes attributes for an <img> showing a profile image
+    `size` CSS pixels wide, e.g.
+    <img {% image_attrs user.profile 'profile_picture' 40 default='Myapp/default-avatar.png' %} alt="Profile">
+    """
+    url = thumbnail_url(profile, field, size) if profile else None
+    if url is None:
+        return format_html('src="{}"', static(default) if default else '')
+    srcset = thumbnail_srcset(profile, field)
+    if not srcset:
+        return format_html('src="{}"', url)
+    return format_html('src="{}" srcset="{}" sizes="{}px"', url, srcset, size)
+
+
+@register.simple_tag
+def image_sources(profile, field, size):
+    """
+    An AVIF <source> for a <picture> around an {% image_attrs %} <img>;
+    empty when there are no AVIF thumbnails.
+    """
+    srcset = thumbnail_srcset(profile, field, 'avif') if profile else ''
+    if not srcset:
+        return ''
+    return format_html('<source type="image/avif" srcset="{}" sizes="{}px">', srcset, size)
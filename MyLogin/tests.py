@@ -0,0 +1,120 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from Myapp.models import Application
+from Myapp.tests import create_organization, create_postings, create_student
+from .models import Notification
+
+
+class QueryCountTestCase(TestCase):
+    """Pages whose query count must not grow with the data they list."""
+
+    def setUp(self):
+        cache.clear()
+
+    def assertPageQueries(self, num, url):
+        # The first request fills the per-user caches (role, notification bell)
+        self.assertEqual(self.client.get(url).status_code, 200)
+        with self.assertNumQueries(num):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+
+class OrganizationPageQueryTests(QueryCountTestCase):
+    def setUp(self):
+        super().setUp()
+        self.organization = create_organization()
+        self.client.force_login(self.organization)
+
+    def add_postings(self, count):
+        for posting in create_postings(self.organization, count):
+            for index, status in enumerate(('submitted', 'accepted', 'rejected')):
+                Application.objects.create(
+                    student=create_student(f'student-{posting.pk}-{index}@example.com'), posting=posting, status=status
+                )
+
+    def test_dashboard_queries_do_not_grow_with_postings(self):
+        url = reverse('organization_dashboard')
+        self.add_postings(2)
+        self.assertPageQueries(7, url)
+        self.add_postings(10)
+        self.assertPageQueries(7, url)
+
+    def test_manage_postings_queries_do_not_grow_with_postings(self):
+        url = reverse('manage_postings')
+        self.add_postings(2)
+        self.assertPageQueries(4, url)
+        self.add_postings(10)
+        self.assertPageQueries(4, url)
+
+    def test_manage_postings_shows_applicant_counts(self):
+        self.add_postings(1)
+        response = self.client.get(reverse('manage_postings'))
+        self.assertEqual([row['applicant_count'] for row in response.context['postings_with_tags']], [3])
+
+
+class ApplicationPageQueryTests(QueryCountTestCase):
+    def setUp(self):
+        super().setUp()
+        self.organization = create_organization()
+        self.posting = create_postings(self.organization, 1)[0]
+
+    def apply(self, count, student=None):
+        """`count` applications across every status, all by `student` or each by a new one."""
+        statuses = [status for status, _ in Application.STATUS_CHOICES]
+        postings = create_postings(self.organization, count) if student else [self.posting] * count
+        for index, posting in enumerate(postings):
+            Application.objects.create(
+                student=student or create_student(f'applicant-{Application.objects.count()}@example.com'),
+                posting=posting, status=statuses[index % len(statuses)],
+            )
+
+    def test_my_applications_queries_do_not_grow_with_applications(self):
+        student = create_student()
+        self.client.force_login(student)
+        url = reverse('my_applications')
+        self.apply(2, student)
+        self.assertPageQueries(6, url)
+        self.apply(10, student)
+        self.assertPageQueries(6, url)
+
+    def test_my_applications_counts_every_status(self):
+        student = create_student()
+        self.client.force_login(student)
+        self.apply(6, student)
+        context = self.client.get(reverse('my_applications')).context
+        self.assertEqual(context['total_applications'], 6)
+        self.assertEqual(context['submitted_count'], 2)
+        self.assertEqual(context['withdrawn_count'], 1)
+
+    def test_applicants_list_queries_do_not_grow_with_applicants(self):
+        self.client.force_login(self.organization)
+        url = f"{reverse('applicants_list')}?posting_id={self.posting.pk}"
+        self.apply(2)
+        self.assertPageQueries(5, url)
+        self.apply(10)
+        self.assertPageQueries(5, url)
+
+
+class NotificationPageQueryTests(QueryCountTestCase):
+    def add_notifications(self, user, count):
+        Notification.objects.bulk_create([
+            Notification(
+                recipient=user, notification_type='posting_approved', title=f'Notification {index}', message='m',
+                is_favorite=index % 3 == 0, is_archived=index % 4 == 0,
+            )
+            for index in range(count)
+        ])
+
+    def assert_queries_do_not_grow(self, user, url):
+        self.client.force_login(user)
+        self.add_notifications(user, 2)
+        self.assertPageQueries(6, url)
+        self.add_notifications(user, 20)
+        self.assertPageQueries(6, url)
+
+    def test_organization_notifications(self):
+        self.assert_queries_do_not_grow(create_organization(), reverse('notifications'))
+
+    def test_student_notifications(self):
+        self.assert_queries_do_not_grow(create_student(), reverse('student_notification'))
@@ -0,0 +1,127 @@
+import hashlib
+import logging
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import Q
+from PIL import Image, ImageOps, features
+
+from .models import Profile, version_bump
+from .roles import invalidate_user_role
+
+logger = logging.getLogger(__name__)
+
+# Widths generated for each image; pages pick one through srcset/sizes
+THUMBNAIL_SIZES = (48, 96, 160, 320)
+# Image fields with thumbnails, and whether they are cropped to a square
+THUMBNAIL_FIELDS = {'profile_picture': True, 'org_logo': False}
+THUMBNAIL_QUALITY = {'webp': 80, 'avif': 60}
+THUMBNAIL_DIR = 'thumbnails'
+
+
+def thumbnail_formats():
+    """WebP always; AVIF too when this Pillow build can encode it."""
+    return ['webp', 'avif'] if features.check('avif') else ['webp']
+
+
+def _source_name(profile, field):
+    return getattr(profile, field).name or ''
+
+
+def stale_thumbnail_fields(profile):
+    """Image fields whose thumbnails were not made from the current upload."""
+    return [
+        field for field in THUMBNAIL_FIELDS
+        if _source_name(profile, field) != (profile.thumbnails or {}).get(field, {}).get('source', '')
+    ]
+
+
+def build_thumbnails(image_file, crop):
+    """
+    Write every size and format of one image to the default storage.
+    Names carry a hash of the source bytes, so they never change and can
+    be cached forever; existing files are reused.
+    """
+    entry = {'source': image_file.name}
+    with image_file.open('rb') as source:
+        data = source.read()
+    digest = hashlib.sha256(data).hexdigest()[:20]
+    try:
+        with Image.open(BytesIO(data)) as image:
+            image = ImageOps.exif_transpose(image)
+            has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+            image = image.convert('RGBA' if has_alpha else 'RGB')
+    except (OSError, Image.DecompressionBombError):
+        # Not an image Pillow can read; pages keep showing the original
+        logger.warning("Could not make thumbnails of %s", image_file.name, exc_info=True)
+        return entry
+
+    largest = min(image.size) if crop else max(image.size)
+    sizes = [size for size in THUMBNAIL_SIZES if size <= largest] or THUMBNAIL_SIZES[:1]
+    for fmt in thumbnail_formats():
+        entry[fmt] = []
+        for size in sizes:
+            if crop:
+                thumbnail = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+            else:
+                thumbnail = ImageOps.contain(image, (size, size), Image.Resampling.LANCZOS)
+            name = f'{THUMBNAIL_DIR}/{digest}-{size}.{fmt}'
+            if not default_storage.exists(name):
+                buffer = BytesIO()
+                thumbnail.save(buffer, fmt.upper(), quality=THUMBNAIL_QUALITY[fmt])
+                name = default_storage.save(name, ContentFile(buffer.getvalue()))
+            entry[fmt].append([name, thumbnail.width, thumbnail.height])
+    return entry
+
+
+def generate_profile_thumbnails(profile_id):
+    """Bring a profile's thumbnails in line with its current images."""
+    profile = Profile.objects.filter(pk=profile_id).first()
+    if profile is None:
+        return
+    fields = stale_thumbnail_fields(profile)
+    if not fields:
+        return
+
+    thumbnails = dict(profile.thumbnails or {})
+    for field in fields:
+        image_file = getattr(profile, field)
+        if image_file:
+            thumbnails[field] = build_thumbnails(image_file, THUMBNAIL_FIELDS[field])
+        else:
+            thumbnails.pop(field, None)
+
+    # Only record them if neither image was replaced in the meantime
+    unchanged = Q()
+    for field in THUMBNAIL_FIELDS:
+        name = _source_name(profile, field)
+        unchanged &= Q(**{field: name}) if name else Q(**{field: ''}) | Q(**{f'{field}__isnull': True})
+    if Profile.objects.filter(unchanged, pk=profile_id).update(thumbnails=thumbnails, **version_bump()):
+        invalidate_user_role(profile.user_id)
+
+
+def _variants(profile, field, fmt):
+    entry = (profile.thumbnails or {}).get(field) if profile else None
+    if not entry or entry.get('source') != _source_name(profile, field):
+        return []
+    return entry.get(fmt, [])
+
+
+def thumbnail_srcset(profile, field, fmt='webp'):
+    """A `srcset` value listing every width of an image, or '' if there are none yet."""
+    return ', '.join(f'{default_storage.url(name)} {width}w' for name, width, _ in _variants(profile, field, fmt))
+
+
+def thumbnail_url(profile, field, size, fmt='webp'):
+    """
+    URL of the smallest thumbnail at least `size` pixels wide (or the
+    largest there is), the original image if there are no thumbnails yet,
+    or None if the field is empty.
+    """
+    variants = _variants(profile, field, fmt)
+    if variants:
+        name = next((name for name, width, _ in variants if width >= size), variants[-1][0])
+        return default_storage.url(name)
+    image_file = getattr(profile, field) if profile else None
+    return image_file.url if image_file else None
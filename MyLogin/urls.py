@@ -15,6 +15,9 @@ urlpatterns = [
 
     # --- Student Pages ---
     path('student/dashboard/', views.student_dashboard, name='student_dashboard'),
+    path('student/dashboard/feed/', views.student_feed, name='student_feed'),
+    path('student/dashboard/search/', views.posting_search, name='posting_search'),
+    path('postings/tags/', views.posting_tag_facets, name='posting_tag_facets'),
     path('student/dashboard/profile/', views.profile, name='profile'),
     path('student/dashboard/profile/update/', views.update_profile, name='update_profile'),
     path('student/dashboard/profile/save-skills/', views.save_skills, name='save_skills'),
@@ -70,6 +73,10 @@ urlpatterns = [
         name='notification_mark_all_read'
     ),
 
+    # 🔔 Live notification delivery (SSE and long-poll under ASGI, short polling under WSGI)
+    path('notifications/stream/', views.notification_stream, name='notification_stream'),
+    path('notifications/poll/', views.notification_poll, name='notification_poll'),
+
     # === ORGANIZATION VERIFICATION SUBMISSION ===
     path('organization/verify/', views.submit_verification, name='submit_verification'),
 
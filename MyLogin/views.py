@@ -1,23 +1,38 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import authenticate, login, logout, login as auth_login
 from django.contrib import messages
-from django.urls import reverse
 from django.utils import timezone
 from datetime import datetime, date
 from functools import wraps
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.models import User
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
+from django.core.handlers.asgi import ASGIRequest
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections, connection
+from django.template.loader import render_to_string
 import json
-from Myapp.models import Posting, Application
+import uuid
+from Myapp.models import Posting, Application, OrganizationApplicationStats
+from .etags import application_details_etag, my_applications_etag, notifications_etag, student_dashboard_etag
 from .models import Profile, Notification
-from Myapp.utils import can_user_apply
+from .notifications import invalidate_notification_summary, latest_notification_id, notification_payload
+from .ratelimit import login_rate_limited
+from .realtime import LONG_POLL_TIMEOUT, SHORT_POLL_INTERVAL, STREAM_HEARTBEAT, Waiter, format_event, get_broker
+from .stats import platform_stats
+from .tasks import notify_later
+from .thumbnails import thumbnail_url
+from Myapp.utils import can_user_apply, check_duplicate_application
+from Myapp.applications import is_resubmission, submit_application
+from Myapp.counters import change_application_status
+from Myapp.middleware.auto_logout import record_activity
+from Myapp.feed import (
+    FEED_PAGE_SIZE, build_feed_items, feed_sort, filter_postings, get_feed_page, tag_facets, visible_postings
+)
+from Myapp.search import search_postings
 from django.contrib.admin.views.decorators import staff_member_required
-from django.views.decorators.http import require_POST
-
-
-# --- Session timeout (10 minutes AFK limit) ---
-SESSION_TIMEOUT = 600  # seconds
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_POST
 
 
 # --- Role-based access decorator ---
@@ -33,7 +48,7 @@ def role_required(allowed_roles=[]):
             if request.user.is_superuser:
                 return view_func(request, *args, **kwargs)
 
-            if hasattr(request.user, 'profile') and request.user.profile.role in allowed_roles:
+            if request.user_role.role in allowed_roles:
                 return view_func(request, *args, **kwargs)
 
             messages.error(request, "Access denied.")
@@ -43,6 +58,7 @@ def role_required(allowed_roles=[]):
 
 
 # --- Authentication Views ---
+@login_rate_limited('email', 'login.html')
 def login_view(request):
     if request.method == 'GET' and 'session_expired' in request.GET:
         messages.warning(request, "You were logged out due to inactivity.")
@@ -59,7 +75,7 @@ def login_view(request):
                 return redirect('login')
 
             login(request, user)
-            request.session['last_activity'] = timezone.now().isoformat()
+            record_activity(request)
 
             # Redirect based on role
             if hasattr(user, 'profile'):
@@ -96,6 +112,7 @@ def admin_redirect(request):
 
 
 # --- Admin Login View ---
+@login_rate_limited('username', 'admin_login.html')
 def admin_login_view(request):
     if request.method == 'POST':
         username = request.POST.get('username')
@@ -164,146 +181,136 @@ def home_view(request):
 # --- Dashboards ---
 @login_required
 @role_required(allowed_roles=['Student'])
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=student_dashboard_etag)
 def student_dashboard(request):
-    last_activity = request.session.get('last_activity')
-    now = timezone.now()
-
-    if last_activity:
-        last_activity = datetime.fromisoformat(last_activity)
-        elapsed = (now - last_activity).total_seconds()
-        if elapsed > SESSION_TIMEOUT:
-            # Clear any existing messages to prevent accumulation
-            from django.contrib.messages import get_messages
-            storage = get_messages(request)
-            for message in storage:
-                pass  # Consume all messages to clear them
-            
-            logout(request)
-            messages.warning(request, "You were logged out due to inactivity.")
-            return redirect(f"{reverse('login')}?session_expired=1")
-
-    request.session['last_activity'] = now.isoformat()
-    
     # Handle application submission from modal
     if request.method == "POST":
         posting_id = request.POST.get('posting_id')
         resume = request.FILES.get('resume')
         note = request.POST.get('note', '')
+        idempotency_key = request.POST.get('idempotency_key', '')
         
         if posting_id and resume:
             try:
                 posting = Posting.objects.get(id=posting_id)
                 
-                # Check if user has already applied
-                if Application.objects.filter(student=request.user, posting=posting).exists():
-                    messages.error(request, "You have already applied to this posting.")
-                else:
-                    # Create application
-                    application = Application.objects.create(
-                        student=request.user,
-                        posting=posting,
-                        resume=resume,
-                        note=note
-                    )
-                    
+                # The unique constraint decides whether this is a new application
+                application, created = submit_application(request.user, posting, resume, note, idempotency_key)
+                if created:
                     # Send notification to the organization
-                    Notification.objects.create(
-                        recipient=posting.organization,
-                        sender=request.user,
+                    notify_later(
+                        posting.organization_id,
                         notification_type='new_application',
                         title=f'New Application Received for "{posting.title}"',
                         message=f'{request.user.get_full_name() or request.user.username} has applied for your opportunity "{posting.title}".',
+                        sender=request.user,
                         related_posting=posting,
+                        dedup_key=f'new_application:{application.pk}',
                     )
                     
                     messages.success(request, "Application submitted successfully!")
+                elif is_resubmission(application, idempotency_key):
+                    # The same form sent twice (double click, browser retry)
+                    messages.success(request, "Application submitted successfully!")
+                else:
+                    messages.error(request, "You have already applied to this posting.")
             except Posting.DoesNotExist:
                 messages.error(request, "Invalid posting.")
         else:
             messages.error(request, "Please upload your resume.")
     
-    # Get approved postings from verified organizations
-    postings = Posting.objects.filter(
-        approval_status='approved',
-        organization__profile__role='Organization',
-        organization__profile__verification_status='verified'
-    ).select_related('organization', 'organization__profile').order_by('-created_at')
-    
-    # Get user's applications to determine which postings they've applied to
-    user_applications = Application.objects.filter(student=request.user).values_list('posting_id', flat=True)
-    
-    # Process tags for each posting (convert comma-separated string to list)
-    postings_list = []
-    for posting in postings:
-        tags_list = [tag.strip() for tag in posting.tags.split(',') if tag.strip()] if posting.tags else []
-        postings_list.append({
-            'posting': posting,
-            'tags_list': tags_list,
-            'has_applied': posting.id in user_applications
-        })
+    # Get approved postings from verified organizations (first page only, the
+    # dashboard JS pages through the rest via the student_feed endpoint)
+    postings = visible_postings()
+    page, next_cursor = get_feed_page(filter_postings(postings, request.GET), sort=feed_sort(request.GET))
+    postings_list = build_feed_items(page, request.user)
 
     # 🔢 DASHBOARD STATS
-    today = timezone.now().date()
-
     # Active opportunities = approved + verified orgs + Active status + deadline in future
-    active_opportunities_count = postings.filter(
-        status='Active',
-        deadline__gte=today
-    ).count()
+    active_opportunities_count = postings.open(timezone.now().date()).count()
 
     # Students connected = number of student profiles
     students_connected_count = Profile.objects.filter(role='Student').count()
-    
-    # Get unread notification count for the user (ignore archived)
-    unread_count = Notification.objects.filter(
-        recipient=request.user,
-        read=False,
-        is_archived=False
-    ).count()
-    
-    # Get recent notifications for the dropdown (limit to 5 most recent)
-    recent_notifications = Notification.objects.filter(
-        recipient=request.user
-    ).order_by('-timestamp')[:5]
+
+    # Tag chips with posting counts (cached)
+    facets = tag_facets()
     
     context = {
         'postings_list': postings_list,
-        'unread_count': unread_count,
-        'notifications': recent_notifications,
+        'next_cursor': next_cursor,
 
         'active_opportunities_count': active_opportunities_count,
         'students_connected_count': students_connected_count,
+        'tag_facets': facets,
     }
     
     return render(request, 'student_dashboard.html', context)
 
 
+@login_required
+@role_required(allowed_roles=['Student'])
+def student_feed(request):
+    """JSON endpoint the student dashboard uses to page through postings (?sort= one of Myapp.feed.FEED_SORTS)."""
+    try:
+        page_size = int(request.GET.get('limit', FEED_PAGE_SIZE))
+    except ValueError:
+        page_size = FEED_PAGE_SIZE
+
+    postings = filter_postings(visible_postings(), request.GET)
+    page, next_cursor = get_feed_page(postings, request.GET.get('cursor'), page_size, feed_sort(request.GET))
+    postings_list = build_feed_items(page, request.user)
+
+    return JsonResponse({
+        'success': True,
+        'html': render_to_string('posting_cards.html', {'postings_list': postings_list}, request=request),
+        'count': len(postings_list),
+        'next_cursor': next_cursor,
+        'has_more': next_cursor is not None,
+    })
+
+
+@login_required
+def posting_tag_facets(request):
+    """Tag chips with the number of visible postings per tag."""
+    return JsonResponse({'success': True, 'tags': tag_facets()})
+
+
+@login_required
+@role_required(allowed_roles=['Student'])
+def posting_search(request):
+    """Ranked full-text search over postings, with the same filters as the feed."""
+    query = request.GET.get('q', '').strip()
+    postings = filter_postings(visible_postings(), request.GET)
+    results = search_postings(query, postings)
+    postings_list = build_feed_items(results, request.user)
+
+    return JsonResponse({
+        'success': True,
+        'query': query,
+        'html': render_to_string('posting_cards.html', {'postings_list': postings_list}, request=request),
+        'count': len(results),
+        'results': [
+            {
+                'id': posting.id,
+                'title': posting.title,
+                'organization': posting.org_display_name,
+                'rank': posting.search_rank,
+                'snippet': posting.search_snippet,
+            }
+            for posting in results
+        ],
+        'next_cursor': None,
+        'has_more': False,
+    })
+
+
 
 
 @login_required
 @role_required(allowed_roles=['Organization'])
 def organization_dashboard(request):
     """Organization dashboard with verification status"""
-    # Check for auto-logout due to inactivity
-    last_activity = request.session.get('last_activity')
-    now = timezone.now()
-
-    if last_activity:
-        last_activity = datetime.fromisoformat(last_activity)
-        elapsed = (now - last_activity).total_seconds()
-        if elapsed > SESSION_TIMEOUT:
-            # Clear any existing messages to prevent accumulation
-            from django.contrib.messages import get_messages
-            storage = get_messages(request)
-            for message in storage:
-                pass  # Consume all messages to clear them
-            
-            logout(request)
-            messages.warning(request, "You were logged out due to inactivity.")
-            return redirect(f"{reverse('login')}?session_expired=1")
-
-    request.session['last_activity'] = now.isoformat()
-    
     try:
         profile = Profile.objects.get(user=request.user)
     except Profile.DoesNotExist:
@@ -316,21 +323,22 @@ def organization_dashboard(request):
         return redirect('student_dashboard')
     
     # Get organization's postings
-    postings = Posting.objects.filter(organization=request.user).order_by('-created_at')
+    postings = Posting.objects.for_org(request.user).order_by('-created_at')
     
-    # Calculate active postings count (approved, active status, and not expired)
+    # Active postings (approved, active status, and not expired)
     from datetime import date
-    active_postings_count = postings.filter(
-        approval_status='approved',
-        status='Active',
-        deadline__gte=date.today()
-    ).count()
+    active_postings = postings.approved().open()
+    active_postings_count = active_postings.count()
     
-    # Calculate total applicants across all postings
-    total_applicants = sum(posting.applications.count() for posting in postings)
+    # Applicant totals across all postings (kept current by Myapp.counters)
+    application_stats = (
+        OrganizationApplicationStats.objects.filter(organization=request.user).first()
+        or OrganizationApplicationStats(organization=request.user)
+    )
+    total_applicants = application_stats.applicant_count
     
     total_views = 0
-    acceptance_rate = 0
+    acceptance_rate = application_stats.acceptance_rate
 
     # Verification status context
     verification_context = {
@@ -345,16 +353,6 @@ def organization_dashboard(request):
     if profile.is_verified_organization() and not request.session.get('verified_modal_shown', False):
         request.session['verified_modal_shown'] = True
     
-    # Get unread notification count for the user (ignore archived)
-    unread_count = Notification.objects.filter(
-        recipient=request.user,
-        read=False,
-        is_archived=False
-    ).count()
-    
-    # Get recent notifications for the dropdown (limit to 5 most recent)
-    recent_notifications = Notification.objects.filter(recipient=request.user).order_by('-timestamp')[:5]
-    
     context = {
         'profile': profile,
         'postings': postings,
@@ -362,14 +360,9 @@ def organization_dashboard(request):
         'total_applicants': total_applicants,
         'total_views': total_views,
         'acceptance_rate': acceptance_rate,
-        'recent_postings': postings.filter(
-            approval_status='approved',
-            status='Active',
-            deadline__gte=date.today()
-        ).order_by('-id')[:4],  # Show 4 recent postings instead of 3
+        'application_stats': application_stats,
+        'recent_postings': active_postings.prefetch_related('tags').order_by('-id')[:4],  # Show 4 recent postings instead of 3
         'today': date.today(),
-        'unread_count': unread_count,
-        'notifications': recent_notifications,
         **verification_context
     }
     return render(request, 'org_dashboard.html', context)
@@ -396,10 +389,7 @@ def admin_dashboard(request):
     
     from datetime import date
     context = {
-        'total_users': 1248,
-        'active_postings': 142,
-        'applications_submitted': 856,
-        'success_rate': 78,
+        **platform_stats(),
         'server_status': 'Operational',
         'database_status': 'Connected',
         'error_rate': 'Low (0.2%)',
@@ -416,7 +406,9 @@ def admin_dashboard(request):
 @role_required(allowed_roles=['Admin'])
 def admin_posting_approval(request):
     """Display pending postings for admin approval"""
-    pending_postings = Posting.objects.filter(approval_status='pending').select_related('organization', 'organization__profile').order_by('-created_at')
+    pending_postings = Posting.objects.filter(approval_status='pending').select_related(
+        'organization', 'organization__profile'
+    ).prefetch_related('tags').order_by('-created_at')
     
     context = {
         'pending_postings': pending_postings,
@@ -440,12 +432,12 @@ def approve_posting(request, posting_id):
             posting.save()
 
             # Send notification to the organization
-            Notification.objects.create(
-                recipient=posting.organization,
-                sender=request.user,
+            notify_later(
+                posting.organization_id,
                 notification_type='posting_approved',
                 title=f'Posting Approved: {posting.title}',
                 message=f'Your posting "{posting.title}" has been approved by the admin and is now live for students to view.',
+                sender=request.user,
                 related_posting=posting,
             )
 
@@ -486,16 +478,6 @@ def reject_posting(request, posting_id):
 # --- Profile ---
 @login_required
 def profile(request):
-    # Get unread notification count for the user (ignore archived)
-    unread_count = Notification.objects.filter(
-        recipient=request.user,
-        read=False,
-        is_archived=False
-    ).count()
-    
-    # Get recent notifications for the dropdown (limit to 5 most recent)
-    recent_notifications = Notification.objects.filter(recipient=request.user).order_by('-timestamp')[:5]
-    
     # Provide JSON strings for client-side population (embedded safely in <script type="application/json">)
     import json as _json
     profile_obj = request.user.profile
@@ -504,8 +486,6 @@ def profile(request):
 
     return render(request, 'profile.html', {
         "profile": profile_obj,
-        'unread_count': unread_count,
-        'notifications': recent_notifications,
         'skills_json': skills_json,
         'portfolio_json': portfolio_json,
     })
@@ -599,46 +579,29 @@ def save_skills(request):
 # --- Organization / Posting Management ---
 @login_required
 def manage_postings(request):
-    if not hasattr(request.user, 'profile'):
-        messages.error(request, "Access denied.")
-        return redirect('home')
-
-    if request.user.profile.role == "Organization":
-        postings = Posting.objects.filter(organization=request.user)
-    elif request.user.profile.role == "Admin":
+    role = request.user_role.role
+    if role == "Organization":
+        postings = Posting.objects.for_org(request.user)
+    elif role == "Admin":
         postings = Posting.objects.all()
     else:
         messages.error(request, "Access denied.")
         return redirect('home')
 
-    # Get unread notification count for the user (ignore archived)
-    unread_count = Notification.objects.filter(
-        recipient=request.user,
-        read=False,
-        is_archived=False
-    ).count()
-    
-    # Get recent notifications for the dropdown (limit to 5 most recent)
-    recent_notifications = Notification.objects.filter(recipient=request.user).order_by('-timestamp')[:5]
-
-    # Process tags for each posting (convert comma-separated string to list)
-    # And get applicant count for each posting
-    postings_with_tags = []
-    for posting in postings:
-        tags_list = [tag.strip() for tag in posting.tags.split(',') if tag.strip()] if posting.tags else []
-        # Get applicant count for this posting
-        applicant_count = Application.objects.filter(posting=posting).count()
-        postings_with_tags.append({
+    # Get tag names and applicant counts (per status) for each posting
+    postings = postings.prefetch_related('tags')
+    postings_with_tags = [
+        {
             'posting': posting,
-            'tags_list': tags_list,
-            'applicant_count': applicant_count,
-        })
+            'tags_list': posting.tags_list,
+            'applicant_count': posting.applicant_count,
+        }
+        for posting in postings
+    ]
     
     return render(request, 'manage_posting.html', {
         'postings': postings,
         'postings_with_tags': postings_with_tags,
-        'unread_count': unread_count,
-        'notifications': recent_notifications,
     })
 
 
@@ -650,7 +613,7 @@ def edit_posting(request, post_id):
         messages.error(request, "Posting not found.")
         return redirect('manage_postings')
 
-    if request.user.profile.role == "Organization" and posting.organization != request.user:
+    if request.user_role.is_organization and posting.organization_id != request.user.pk:
         messages.error(request, "Access denied.")
         return redirect('manage_postings')
 
@@ -666,12 +629,10 @@ def edit_posting(request, post_id):
                 # Add handling for opportunity_type field
                 if 'opportunity_type' in request.POST:
                     posting.opportunity_type = request.POST.get('opportunity_type')
+                posting.save()
                 # Add handling for tags
                 if 'tags' in request.POST:
-                    selected_tags = request.POST.getlist('tags')
-                    tags_str = ','.join(selected_tags)
-                    posting.tags = tags_str
-                posting.save()
+                    posting.set_tags(request.POST.getlist('tags'))
                 return JsonResponse({'success': True, 'message': 'Posting updated successfully.'})
             except Exception as e:
                 return JsonResponse({'success': False, 'message': str(e)})
@@ -685,12 +646,10 @@ def edit_posting(request, post_id):
             # Add handling for opportunity_type field
             if 'opportunity_type' in request.POST:
                 posting.opportunity_type = request.POST.get('opportunity_type')
+            posting.save()
             # Add handling for tags
             if 'tags' in request.POST:
-                selected_tags = request.POST.getlist('tags')
-                tags_str = ','.join(selected_tags)
-                posting.tags = tags_str
-            posting.save()
+                posting.set_tags(request.POST.getlist('tags'))
             messages.success(request, "Posting updated successfully.")
             return redirect('manage_postings')
 
@@ -709,7 +668,7 @@ def delete_posting(request, post_id):
         messages.error(request, "Posting not found.")
         return redirect('manage_postings')
 
-    if request.user.profile.role == "Organization" and posting.organization != request.user:
+    if request.user_role.is_organization and posting.organization_id != request.user.pk:
         if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
             return JsonResponse({'success': False, 'message': 'Access denied.'})
         messages.error(request, "Access denied.")
@@ -730,43 +689,26 @@ def delete_posting(request, post_id):
 # --- Student Applications ---
 @login_required
 @role_required(allowed_roles=['Student'])
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=my_applications_etag)
 def my_applications(request):
     # Fetch applications for the current user
-    applications = Application.objects.filter(student=request.user).select_related('posting', 'posting__organization')
-    
-    # Process tags for each application's posting
-    for application in applications:
-        tags_list = [tag.strip() for tag in application.posting.tags.split(',') if tag.strip()] if application.posting.tags else []
-        application.posting.tags_list = tags_list
-    
-    # Calculate statistics
-    total_applications = applications.count()
-    submitted_count = applications.filter(status='submitted').count()
-    under_review_count = applications.filter(status='under_review').count()
-    accepted_count = applications.filter(status='accepted').count()
-    rejected_count = applications.filter(status='rejected').count()
-    withdrawn_count = applications.filter(status='withdrawn').count()
-    
-    # Get unread notification count for the user (ignore archived)
-    unread_count = Notification.objects.filter(
-        recipient=request.user,
-        read=False,
-        is_archived=False
-    ).count()
+    # The card shows the posting's denormalized organization name, so no profile is loaded per row
+    applications = Application.objects.filter(student=request.user).select_related(
+        'posting'
+    ).prefetch_related('posting__tags')
     
-    # Get recent notifications for the dropdown (limit to 5 most recent)
-    recent_notifications = Notification.objects.filter(recipient=request.user).order_by('-timestamp')[:5]
+    # Calculate statistics (one query for every status)
+    status_counts = applications.status_histogram()
     
     return render(request, 'my_applications.html', {
         'applications': applications,
-        'unread_count': unread_count,
-        'notifications': recent_notifications,
-        'total_applications': total_applications,
-        'submitted_count': submitted_count,
-        'under_review_count': under_review_count,
-        'accepted_count': accepted_count,
-        'rejected_count': rejected_count,
-        'withdrawn_count': withdrawn_count,
+        'total_applications': status_counts['total'],
+        'submitted_count': status_counts['submitted'],
+        'under_review_count': status_counts['under_review'],
+        'accepted_count': status_counts['accepted'],
+        'rejected_count': status_counts['rejected'],
+        'withdrawn_count': status_counts['withdrawn'],
     })
 
 
@@ -774,7 +716,7 @@ def my_applications(request):
 @login_required
 def applicants_list(request):
     # Check if user is an organization
-    if not hasattr(request.user, 'profile') or request.user.profile.role != 'Organization':
+    if not request.user_role.is_organization:
         messages.error(request, "Access denied.")
         return redirect('home')
     
@@ -786,26 +728,15 @@ def applicants_list(request):
     
     try:
         # Get the posting and verify it belongs to this organization
-        posting = Posting.objects.get(id=posting_id, organization=request.user)
+        posting = Posting.objects.for_org(request.user).get(id=posting_id)
         
         # Get all applications for this posting
         applications = Application.objects.filter(posting=posting).select_related('student', 'student__profile')
         
-        # Get unread notification count for the user (ignore archived)
-        unread_count = Notification.objects.filter(
-            recipient=request.user,
-            read=False,
-            is_archived=False
-        ).count()
-        
-        # Get recent notifications for the dropdown (limit to 5 most recent)
-        recent_notifications = Notification.objects.filter(recipient=request.user).order_by('-timestamp')[:5]
-        
         return render(request, 'applicants_list.html', {
             'posting': posting,
             'applications': applications,
-            'unread_count': unread_count,
-            'notifications': recent_notifications,
+            'status_counts': applications.status_histogram(),
         })
     except Posting.DoesNotExist:
         messages.error(request, "Posting not found or access denied.")
@@ -890,10 +821,7 @@ def submit_verification(request):
 @login_required
 @role_required(allowed_roles=['Organization'])
 def post_opportunity(request):
-    profile = request.user.profile
-    is_verified = profile.is_verified_organization()
-    
-    if not is_verified:
+    if not request.user_role.is_verified_organization:
         messages.error(request, "Only verified organizations can post opportunities. Please verify your organization first.")
         return redirect('submit_verification')
 
@@ -904,7 +832,6 @@ def post_opportunity(request):
         opportunity_type = request.POST.get('opportunity_type', 'other')  # Default to 'other'
 
         selected_tags = request.POST.getlist("tags")
-        tags_str = ",".join(selected_tags)
 
         if not (title and description and deadline_str):
             messages.error(request, "Please fill in all required fields.")
@@ -927,49 +854,26 @@ def post_opportunity(request):
             title=title,
             description=description,
             deadline=deadline,
-            tags=tags_str,
             approval_status=approval_status,
             opportunity_type=opportunity_type  # Add opportunity_type field
         )
+        posting.set_tags(selected_tags)
 
         success_message = "Opportunity created successfully! Waiting for admin approval."
         messages.success(request, success_message)
         return redirect('organization_dashboard')
 
-    # Get unread notification count for the user (ignore archived)
-    unread_count = Notification.objects.filter(
-        recipient=request.user,
-        read=False,
-        is_archived=False
-    ).count()
-    
-    recent_notifications = Notification.objects.filter(recipient=request.user).order_by('-timestamp')[:5]
-
-    return render(request, 'post_opportunity.html', {
-        'unread_count': unread_count,
-        'notifications': recent_notifications,
-    })
+    return render(request, 'post_opportunity.html')
 
 
 @login_required
 def org_profile(request):
     """Load the single-page organization profile UI."""
     profile = request.user.profile  
-    
-    # Get unread notification count for the user (ignore archived)
-    unread_count = Notification.objects.filter(
-        recipient=request.user,
-        read=False,
-        is_archived=False
-    ).count()
-    
-    recent_notifications = Notification.objects.filter(recipient=request.user).order_by('-timestamp')[:5]
 
     context = {
         "user": request.user,
         "profile": profile,
-        'unread_count': unread_count,
-        'notifications': recent_notifications,
     }
     return render(request, "org_profile.html", context)
 
@@ -1112,8 +1016,8 @@ def approve_organization(request, profile_id):
             # ✅ Create notification for the organization
             org_name = profile.org_name or profile.user.get_full_name() or profile.user.username
 
-            Notification.objects.create(
-                recipient=profile.user,
+            notify_later(
+                profile.user_id,
                 sender=request.user,
                 notification_type='verification_approved',
                 title='Organization Verification Approved',
@@ -1156,8 +1060,8 @@ def reject_organization(request, profile_id):
             profile.save()
 
             # ✅ Send notification to the organization
-            Notification.objects.create(
-                recipient=profile.user,
+            notify_later(
+                profile.user_id,
                 notification_type='verification_rejected',
                 title='Organization Verification Rejected',
                 message=(
@@ -1181,15 +1085,18 @@ def reject_organization(request, profile_id):
 
 # --- Notifications (Tabbed: All / Archive / Favorite) ---
 @login_required
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=notifications_etag)
 def notifications(request):
     tab = request.GET.get('tab', 'all')
 
     # Mark all non-archived notifications as read when opening the page
-    Notification.objects.filter(
+    if Notification.objects.filter(
         recipient=request.user,
         read=False,
         is_archived=False
-    ).update(read=True)
+    ).update(read=True):
+        invalidate_notification_summary(request.user.pk)
 
     base_qs = Notification.objects.filter(recipient=request.user)
 
@@ -1203,14 +1110,12 @@ def notifications(request):
 
     notifications_qs = notifications_qs.order_by('-timestamp')
 
-    # ✅ Counts for badges
-    unread_count = base_qs.filter(read=False, is_archived=False).count()
+    # ✅ Counts for badges (the unread badge comes from the context processor)
     favorite_count = base_qs.filter(is_favorite=True, is_archived=False).count()
     archive_count = base_qs.filter(is_archived=True).count()
 
     context = {
         'notifications': notifications_qs,
-        'unread_count': unread_count,
         'favorite_count': favorite_count,
         'archive_count': archive_count,
         'active_tab': tab,
@@ -1258,35 +1163,119 @@ def notification_delete(request, pk):
 @login_required
 @require_POST
 def notification_mark_all_read(request):
-    Notification.objects.filter(
+    if Notification.objects.filter(
         recipient=request.user,
         read=False,
         is_archived=False
-    ).update(read=True)
+    ).update(read=True):
+        invalidate_notification_summary(request.user.pk)
     return redirect(request.META.get('HTTP_REFERER', 'notifications'))
 
+
+# --- Live notifications (server-sent events, long-poll fallback) ---
+def _parse_notification_id(value):
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return None
+    return value if value >= 0 else None
+
+
+def _release_connection():
+    connection.close()
+
+
+def _live_payload(user, after_id):
+    close_old_connections()
+    return notification_payload(user, after_id)
+
+
+# Open streams and polls query on the shared executor rather than each
+# request's own thread, so they reuse a few database connections instead of
+# holding one apiece
+live_payload = sync_to_async(_live_payload, thread_sensitive=False)
+
+
+async def _notification_events(user, last_id):
+    broker = get_broker()
+    waiter = Waiter()
+    broker.subscribe(user.pk, waiter)
+    try:
+        yield "retry: 5000\n\n"
+        while True:
+            payload = await live_payload(user, last_id)
+            if payload['notifications']:
+                last_id = payload['last_id']
+                yield format_event(payload)
+            if not await waiter.wait(STREAM_HEARTBEAT):
+                yield ": keepalive\n\n"
+    finally:
+        broker.unsubscribe(user.pk, waiter)
+
+
+@login_required
+async def notification_stream(request):
+    """Stream new notifications to the bell as server-sent events (ASGI only)."""
+    if not isinstance(request, ASGIRequest):
+        # Under WSGI a stream would hold a worker forever; the client falls back to polling
+        return JsonResponse({'success': False, 'message': 'Use the poll endpoint.'}, status=501)
+
+    user = await request.auser()
+    last_id = _parse_notification_id(request.headers.get('Last-Event-ID') or request.GET.get('after'))
+    if last_id is None:
+        last_id = await sync_to_async(latest_notification_id)(user)
+    # Release this request's connection for as long as the stream stays open
+    await sync_to_async(_release_connection)()
+
+    response = StreamingHttpResponse(_notification_events(user, last_id), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@login_required
+async def notification_poll(request):
+    """
+    Long-poll fallback: returns as soon as there is a notification newer than
+    ?after=<id>, or with an empty list after LONG_POLL_TIMEOUT seconds.
+    Without ?after it returns the current position immediately.
+
+    Under WSGI waiting would tie up a worker per open page, so it answers
+    straight away and tells the client (`retry`, in seconds) when to ask again.
+    """
+    user = await request.auser()
+    after = _parse_notification_id(request.GET.get('after'))
+    can_wait = isinstance(request, ASGIRequest)
+    if after is None or not can_wait:
+        if after is None:
+            after = await sync_to_async(latest_notification_id)(user)
+        payload = await sync_to_async(notification_payload)(user, after)
+        if not can_wait:
+            payload['retry'] = SHORT_POLL_INTERVAL
+        return JsonResponse({'success': True, **payload})
+
+    await sync_to_async(_release_connection)()
+    broker = get_broker()
+    waiter = Waiter()
+    broker.subscribe(user.pk, waiter)
+    try:
+        payload = await live_payload(user, after)
+        if not payload['notifications']:
+            await waiter.wait(LONG_POLL_TIMEOUT)
+            payload = await live_payload(user, after)
+    finally:
+        broker.unsubscribe(user.pk, waiter)
+    return JsonResponse({'success': True, **payload})
+
+
 @login_required
 def org_profile(request):
     """Load the single-page organization profile UI."""
     profile = request.user.profile  # should always exist for logged-in org
 
-    # Unread notification count (ignoring archived)
-    unread_count = Notification.objects.filter(
-        recipient=request.user,
-        read=False,
-        is_archived=False
-    ).count()
-
-    # Recent notifications for dropdown
-    recent_notifications = Notification.objects.filter(
-        recipient=request.user
-    ).order_by('-timestamp')[:5]
-
     context = {
         "user": request.user,
         "profile": profile,
-        "unread_count": unread_count,
-        "notifications": recent_notifications,
     }
     return render(request, "org_profile.html", context)
 
@@ -1404,15 +1393,18 @@ def save_org_profile(request):
         return JsonResponse({"success": False, "error": str(e)}, status=500)
     
 @login_required
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=notifications_etag)
 def student_notification(request):
     tab = request.GET.get('tab', 'all')
 
     # Mark all non-archived notifications as read when opening the page
-    Notification.objects.filter(
+    if Notification.objects.filter(
         recipient=request.user,
         read=False,
         is_archived=False
-    ).update(read=True)
+    ).update(read=True):
+        invalidate_notification_summary(request.user.pk)
 
     base_qs = Notification.objects.filter(recipient=request.user)
 
@@ -1426,14 +1418,12 @@ def student_notification(request):
 
     notifications_qs = notifications_qs.order_by('-timestamp')
 
-    # Counts for badges
-    unread_count = base_qs.filter(read=False, is_archived=False).count()
+    # Counts for badges (the unread badge comes from the context processor)
     favorite_count = base_qs.filter(is_favorite=True, is_archived=False).count()
     archive_count = base_qs.filter(is_archived=True).count()
 
     context = {
         'notifications': notifications_qs,
-        'unread_count': unread_count,
         'favorite_count': favorite_count,
         'archive_count': archive_count,
         'active_tab': tab,
@@ -1450,46 +1440,35 @@ def create_application(request, posting_id):
     
     posting = get_object_or_404(Posting, id=posting_id)
     
-    # Check if user has already applied
-    if Application.objects.filter(student=request.user, posting=posting).exists():
-        messages.error(request, "You have already applied to this posting.")
-        return redirect('my_applications')
-    
     if request.method == "POST":
         resume = request.FILES.get('resume')
         note = request.POST.get('note', '')
+        idempotency_key = request.POST.get('idempotency_key', '')
         
         # Process attachments (currently just storing the primary resume)
         # Future enhancement: Handle multiple attachments
         
-        if Application.objects.filter(student=request.user, posting=posting).exists():
-            messages.error(request, "You have already applied to this posting.")
-        else:
-            application = Application.objects.create(
-                student=request.user,
-                posting=posting,
-                resume=resume,
-                note=note
-            )
+        # A resubmitted form (double click, browser retry) reports success again
+        application, created = submit_application(request.user, posting, resume, note, idempotency_key)
+        if created or is_resubmission(application, idempotency_key):
             messages.success(request, "Application submitted successfully!")
-            return redirect('my_applications')
+        else:
+            messages.error(request, "You have already applied to this posting.")
+        return redirect('my_applications')
+    
+    # Check if user has already applied
+    if check_duplicate_application(request.user, posting.id):
+        messages.error(request, "You have already applied to this posting.")
+        return redirect('my_applications')
     
-    # Process tags for the posting
-    tags_list = [tag.strip() for tag in posting.tags.split(',') if tag.strip()] if posting.tags else []
+    # Tag names for the posting
+    tags_list = posting.tags_list
     posting_data = {
         'posting': posting,
-        'tags_list': tags_list
+        'tags_list': tags_list,
+        'idempotency_key': uuid.uuid4().hex,
     }
     
-    # Get unread notification count for the user (ignore archived)
-    unread_count = Notification.objects.filter(
-        recipient=request.user,
-        read=False,
-        is_archived=False
-    ).count()
-    
-    posting_data['unread_count'] = unread_count
-    
     return render(request, "create_application.html", posting_data)
 
 
@@ -1498,7 +1477,7 @@ def create_application(request, posting_id):
 @require_POST
 def update_application_status(request, application_id):
     # Check if user is an organization
-    if not hasattr(request.user, 'profile') or request.user.profile.role != 'Organization':
+    if not request.user_role.is_organization:
         return JsonResponse({'success': False, 'message': 'Access denied.'})
     
     try:
@@ -1518,13 +1497,12 @@ def update_application_status(request, application_id):
         if new_status not in valid_statuses:
             return JsonResponse({'success': False, 'message': 'Invalid status.'})
         
-        # Update the status
-        application.status = new_status
-        application.save()
+        # Update the status (and the applicant counters)
+        change_application_status(application, new_status)
         
         # Create a notification for the student
-        Notification.objects.create(
-            recipient=application.student,
+        notify_later(
+            application.student_id,
             title=f"Application Status Updated",
             message=f"Your application status for '{application.posting.title}' has been updated to '{application.get_status_display()}'.",
             notification_type='application_status_update'
@@ -1538,9 +1516,11 @@ def update_application_status(request, application_id):
 
 # --- Get Application Details for Modal ---
 @login_required
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=application_details_etag)
 def get_application_details(request, application_id):
     # Check if user is an organization
-    if not hasattr(request.user, 'profile') or request.user.profile.role != 'Organization':
+    if not request.user_role.is_organization:
         return JsonResponse({'success': False, 'message': 'Access denied.'})
     
     try:
@@ -1559,7 +1539,8 @@ def get_application_details(request, application_id):
             'applied_date': application.created_at.strftime("%B %d, %Y"),
             'note': application.note,
             'resume': application.resume.url if application.resume else None,
-            'profile_picture': application.student.profile.profile_picture.url if application.student.profile.profile_picture else None,
+            'resume_pending': bool(application.resume_upload),
+            'profile_picture': thumbnail_url(application.student.profile, 'profile_picture', 50),
             'status': application.status,
             'status_display': application.get_status_display(),
             'status_class': 'pending' if application.status in ['submitted', 'under_review'] else 'active' if application.status == 'accepted' else 'closed'
@@ -0,0 +1,47 @@
+from django.db import IntegrityError, transaction
+
+from .models import Application
+from .tasks import finalize_resume_later
+from .uploads import discard_staged, stage_upload
+
+IDEMPOTENCY_KEY_MAX_LENGTH = 64
+
+
+def submit_application(student, posting, resume, note='', idempotency_key=''):
+    """
+    Create a student's application to a posting, at most once.
+
+    There is no exists() check first: the INSERT runs in a savepoint and
+    the (student, posting) unique constraint rejects duplicates, so
+    concurrent double-submits cannot both get in. Returns
+    (application, created); when created is False the application is the
+    one already on file.
+
+    The resume is only staged on local disk here; a job moves it to the
+    file storage after the application is committed.
+    """
+    staged = stage_upload(resume, Application.resume.field.upload_to) if resume else ''
+    application = Application(
+        student=student,
+        posting=posting,
+        resume_upload=staged,
+        note=note,
+        idempotency_key=idempotency_key[:IDEMPOTENCY_KEY_MAX_LENGTH],
+    )
+    try:
+        with transaction.atomic():
+            application.save()
+    except IntegrityError:
+        discard_staged(staged)
+        existing = Application.objects.filter(student=student, posting=posting).first()
+        if existing is None:
+            raise
+        return existing, False
+    if staged:
+        finalize_resume_later(application.pk)
+    return application, True
+
+
+def is_resubmission(application, idempotency_key):
+    """True if the application was created by a form carrying this key."""
+    return bool(idempotency_key) and application.idempotency_key == idempotency_key[:IDEMPOTENCY_KEY_MAX_LENGTH]
@@ -0,0 +1,124 @@
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from MyLogin.models import version_bump
+
+from .feed import invalidate_feed_version
+from .models import Application, OrganizationApplicationStats, Posting
+
+
+def _status_counter(status):
+    return f'{status}_count'
+
+
+def _increment(field):
+    return F(field) + 1
+
+
+def _decrement(field):
+    # Never go below zero, even if the counters have drifted
+    return Greatest(F(field) - 1, Value(0))
+
+
+def _organization_id(application):
+    if Application.posting.is_cached(application):
+        return application.posting.organization_id
+    return Posting.objects.filter(pk=application.posting_id).values_list('organization_id', flat=True).first()
+
+
+def _apply(application, changes):
+    """Apply counter expressions to the application's posting and its organization rollup."""
+    # Applicant counts are shown on the posting, so they count as a change to it
+    Posting.objects.filter(pk=application.posting_id).update(**changes, **version_bump())
+    # The student feed's cards show the counts too
+    invalidate_feed_version()
+
+    organization_id = _organization_id(application)
+    if organization_id is None:
+        return
+    if not OrganizationApplicationStats.objects.filter(organization_id=organization_id).update(**changes):
+        # First application for this organization
+        OrganizationApplicationStats.objects.get_or_create(organization_id=organization_id)
+        OrganizationApplicationStats.objects.filter(organization_id=organization_id).update(**changes)
+
+
+def application_created(application):
+    status_field = _status_counter(application.status)
+    _apply(application, {
+        'applicant_count': _increment('applicant_count'),
+        status_field: _increment(status_field),
+    })
+
+
+def application_deleted(application):
+    status_field = _status_counter(application.status)
+    _apply(application, {
+        'applicant_count': _decrement('applicant_count'),
+        status_field: _decrement(status_field),
+    })
+
+
+def change_application_status(application, new_status):
+    """
+    Move an application to a new status and shift the counters with it.
+    The status is only changed if it still matches what was loaded, so
+    concurrent updates cannot count the same transition twice.
+    Returns True if the status changed.
+    """
+    old_status = application.status
+    if new_status == old_status:
+        return False
+
+    with transaction.atomic():
+        updated = Application.objects.filter(pk=application.pk, status=old_status).update(
+            status=new_status,
+            updated_at=timezone.now()
+        )
+        if not updated:
+            return False
+        _apply(application, {
+            _status_counter(old_status): _decrement(_status_counter(old_status)),
+            _status_counter(new_status): _increment(_status_counter(new_status)),
+        })
+
+    application.status = new_status
+    return True
+
+
+def _count_subquery(group_by, outer, **filters):
+    applications = (
+        Application.objects.filter(**{group_by: OuterRef(outer)}, **filters)
+        .order_by()
+        .values(group_by)
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    return Coalesce(Subquery(applications), Value(0))
+
+
+def _counter_expressions(group_by, outer):
+    counters = {'applicant_count': _count_subquery(group_by, outer)}
+    for status, _ in Application.STATUS_CHOICES:
+        counters[_status_counter(status)] = _count_subquery(group_by, outer, status=status)
+    return counters
+
+
+def rebuild_application_counters():
+    """
+    Recompute every posting and organization counter from the Application
+    table. Returns (postings updated, organizations updated).
+    """
+    with transaction.atomic():
+        postings = Posting.objects.update(**_counter_expressions('posting', 'pk'), **version_bump())
+
+        organization_ids = Posting.objects.values_list('organization_id', flat=True).distinct()
+        OrganizationApplicationStats.objects.bulk_create(
+            [OrganizationApplicationStats(organization_id=org_id) for org_id in organization_ids],
+            ignore_conflicts=True
+        )
+        organizations = OrganizationApplicationStats.objects.update(
+            **_counter_expressions('posting__organization', 'organization')
+        )
+    return postings, organizations
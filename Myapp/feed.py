@@ -0,0 +1,274 @@
+import base64
+import binascii
+import json
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Q, prefetch_related_objects
+from django.template.loader import render_to_string
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.text import slugify
+
+from .models import Posting, PostingTag, Tag
+from .utils import applied_posting_ids
+
+# Number of posting cards rendered per page of the student feed
+FEED_PAGE_SIZE = 12
+MAX_FEED_PAGE_SIZE = 50
+
+TAG_FACETS_CACHE_KEY = 'feed:tag_facets'
+TAG_FACETS_CACHE_TIMEOUT = 300  # seconds
+
+# Identifies the state of the visible postings and dashboard stats, for ETags
+FEED_VERSION_CACHE_KEY = 'feed:version'
+
+# Rendered posting cards are shared by every student and kept until the
+# posting's card version changes
+POSTING_CARD_CACHE_TIMEOUT = 60 * 60 * 24  # seconds
+
+
+def visible_postings():
+    """Approved postings from verified organizations, newest first."""
+    return Posting.objects.visible().defer('search_vector').order_by('-created_at', '-id')
+
+
+def filter_postings(postings, params):
+    """
+    Apply the student feed filters from a QueryDict:
+    type (repeatable), tag (repeatable tag slugs; tag_mode=any|all, default all),
+    deadline_from / deadline_to (YYYY-MM-DD) and status.
+    """
+    valid_types = {value for value, _ in Posting.OPPORTUNITY_TYPE_CHOICES}
+    types = [t for t in params.getlist('type') if t in valid_types]
+    if types:
+        postings = postings.filter(opportunity_type__in=types)
+
+    slugs = {slugify(tag) for tag in params.getlist('tag')} - {''}
+    if slugs:
+        postings = filter_by_tags(postings, slugs, match_all=params.get('tag_mode') != 'any')
+
+    deadline_from = parse_date(params.get('deadline_from') or '')
+    if deadline_from:
+        postings = postings.filter(deadline__gte=deadline_from)
+
+    deadline_to = parse_date(params.get('deadline_to') or '')
+    if deadline_to:
+        postings = postings.filter(deadline__lte=deadline_to)
+
+    valid_statuses = {value for value, _ in Posting.STATUS_CHOICES}
+    status = params.get('status')
+    if status in valid_statuses:
+        postings = postings.filter(status=status)
+
+    return postings
+
+
+def filter_by_tags(postings, slugs, match_all=True):
+    """
+    Keep postings tagged with all (or any) of the given tag slugs.
+    Uses EXISTS over the (tag, posting) index rather than a join, so
+    postings are never duplicated.
+    """
+    tag_ids = list(Tag.objects.filter(slug__in=slugs).values_list('id', flat=True))
+    if match_all:
+        if len(tag_ids) < len(slugs):
+            return postings.none()
+        for tag_id in tag_ids:
+            postings = postings.filter(Exists(PostingTag.objects.filter(posting=OuterRef('pk'), tag_id=tag_id)))
+        return postings
+    if not tag_ids:
+        return postings.none()
+    return postings.filter(Exists(PostingTag.objects.filter(posting=OuterRef('pk'), tag_id__in=tag_ids)))
+
+
+def tag_facets():
+    """
+    Tag counts over the postings students can see, most used first, e.g.
+    [{'slug': 'leadership', 'name': 'Leadership', 'count': 42}, ...].
+    Cached; Myapp.signals clears the cache when postings or tags change.
+    """
+    facets = cache.get(TAG_FACETS_CACHE_KEY)
+    if facets is None:
+        facets = [
+            {'slug': row['tag__slug'], 'name': row['tag__name'], 'count': row['count']}
+            for row in PostingTag.objects.filter(posting__in=visible_postings().values('pk'))
+            .values('tag__slug', 'tag__name')
+            .annotate(count=Count('posting_id'))
+            .order_by('-count', 'tag__name')
+        ]
+        cache.set(TAG_FACETS_CACHE_KEY, facets, TAG_FACETS_CACHE_TIMEOUT)
+    return facets
+
+
+def invalidate_tag_facets():
+    transaction.on_commit(lambda: cache.delete(TAG_FACETS_CACHE_KEY))
+    # Facets change whenever the visible postings do
+    invalidate_feed_version()
+
+
+def feed_version():
+    """
+    A token that changes whenever postings or student profiles change, so
+    ETags can tell the feed and its stats are unchanged without querying.
+    """
+    version = cache.get(FEED_VERSION_CACHE_KEY)
+    if version is None:
+        version = _new_card_version()
+        cache.set(FEED_VERSION_CACHE_KEY, version, POSTING_CARD_CACHE_TIMEOUT)
+    return version
+
+
+def invalidate_feed_version():
+    transaction.on_commit(lambda: cache.delete(FEED_VERSION_CACHE_KEY))
+
+
+# Orderings the student feed can page through: name -> (field, descending).
+# Ties are broken by id in the same direction, so every order is a keyset.
+FEED_SORTS = {
+    'recent': ('created_at', True),
+    'deadline': ('deadline', False),
+    'title': ('title', False),
+    'organization': ('org_display_name', False),
+}
+DEFAULT_FEED_SORT = 'recent'
+
+_CURSOR_PARSERS = {'created_at': parse_datetime, 'deadline': parse_date}
+
+
+def feed_sort(params):
+    """The ?sort= of a QueryDict if it is one of FEED_SORTS, else the default."""
+    sort = params.get('sort')
+    return sort if sort in FEED_SORTS else DEFAULT_FEED_SORT
+
+
+def encode_cursor(posting, sort=DEFAULT_FEED_SORT):
+    """Encode the (sort field, id) keyset position of a posting."""
+    value = getattr(posting, FEED_SORTS[sort][0])
+    if hasattr(value, 'isoformat'):
+        value = value.isoformat()
+    raw = json.dumps([sort, value, posting.id])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor, sort=DEFAULT_FEED_SORT):
+    """
+    Decode a feed cursor into (sort field value, id), or None if it is
+    malformed or was made for a different sort.
+    """
+    try:
+        cursor_sort, value, posting_id = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        if cursor_sort != sort or not isinstance(value, str):
+            return None
+        parse = _CURSOR_PARSERS.get(FEED_SORTS[sort][0])
+        value = parse(value) if parse else value
+    except (ValueError, TypeError, binascii.Error):
+        return None
+    if value is None or not isinstance(posting_id, int):
+        return None
+    return value, posting_id
+
+
+def get_feed_page(postings, cursor=None, page_size=FEED_PAGE_SIZE, sort=DEFAULT_FEED_SORT):
+    """
+    Return one page of postings after the given cursor in one of the
+    FEED_SORTS orders (newest first by default), plus the cursor for the
+    next page.
+    """
+    field, descending = FEED_SORTS[sort]
+    page_size = max(1, min(page_size, MAX_FEED_PAGE_SIZE))
+    position = decode_cursor(cursor, sort) if cursor else None
+    if position:
+        value, posting_id = position
+        after = 'lt' if descending else 'gt'
+        postings = postings.filter(
+            Q(**{f'{field}__{after}': value}) | Q(**{field: value, f'id__{after}': posting_id})
+        )
+
+    direction = '-' if descending else ''
+    page = list(postings.order_by(f'{direction}{field}', f'{direction}id')[:page_size + 1])
+    next_cursor = encode_cursor(page[page_size - 1], sort) if len(page) > page_size else None
+    return page[:page_size], next_cursor
+
+
+def _card_version_key(posting_id):
+    return f'feed:card_version:{posting_id}'
+
+
+def _card_key(posting_id, version):
+    return f'feed:card:{posting_id}:{version}'
+
+
+def _new_card_version():
+    # A fresh token rather than a counter, so an evicted version can never
+    # come back and match an old rendering
+    return time.time_ns()
+
+
+def card_versions(posting_ids):
+    """The current card version of each posting, creating any that are missing."""
+    keys = {_card_version_key(posting_id): posting_id for posting_id in posting_ids}
+    versions = {keys[key]: version for key, version in cache.get_many(keys).items()}
+    missing = {key: _new_card_version() for key, posting_id in keys.items() if posting_id not in versions}
+    if missing:
+        cache.set_many(missing, POSTING_CARD_CACHE_TIMEOUT)
+        versions.update((keys[key], version) for key, version in missing.items())
+    return versions
+
+
+def invalidate_posting_cards(posting_ids):
+    """
+    Give these postings a new card version once the current transaction
+    commits; Myapp.signals calls this on every change. Bumping it earlier
+    would let a concurrent request cache the uncommitted rows' old card
+    under the new version.
+    """
+    keys = [_card_version_key(posting_id) for posting_id in posting_ids]
+
+    def bump():
+        version = _new_card_version()
+        cache.set_many({key: version for key in keys}, POSTING_CARD_CACHE_TIMEOUT)
+
+    transaction.on_commit(bump)
+
+
+def render_posting_cards(postings):
+    """
+    The shared HTML of each posting's card (title, organization, description,
+    tags), keyed by posting id. Cards are cached per card version; search
+    results carry a query-specific snippet and are always rendered.
+    """
+    postings = list(postings)
+    keys = {}
+    cacheable = [posting for posting in postings if not getattr(posting, 'search_snippet', None)]
+    if cacheable:
+        versions = card_versions([posting.id for posting in cacheable])
+        keys = {posting.id: _card_key(posting.id, versions[posting.id]) for posting in cacheable}
+
+    cached = cache.get_many(keys.values())
+    cards = {posting_id: cached[key] for posting_id, key in keys.items() if key in cached}
+
+    misses = [posting for posting in postings if posting.id not in cards]
+    prefetch_related_objects(misses, 'tags')
+    rendered = {}
+    for posting in misses:
+        cards[posting.id] = render_to_string('posting_card.html', {'posting': posting})
+        if posting.id in keys:
+            rendered[keys[posting.id]] = cards[posting.id]
+    if rendered:
+        cache.set_many(rendered, POSTING_CARD_CACHE_TIMEOUT)
+    return cards
+
+
+def build_feed_items(postings, user):
+    """Attach the rendered card and this user's applied flag to each posting on a page."""
+    cards = render_posting_cards(postings)
+    applied_ids = applied_posting_ids(user)
+    return [
+        {
+            'posting': posting,
+            'card': cards[posting.id],
+            'has_applied': posting.id in applied_ids,
+        }
+        for posting in postings
+    ]
@@ -0,0 +1,201 @@
+import logging
+import random
+import traceback
+import uuid
+from datetime import timedelta
+from statistics import quantiles
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Min
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ATTEMPTS = 5
+# Seconds before the first retry; doubled on each later attempt
+RETRY_BACKOFF = 10
+MAX_RETRY_DELAY = 3600
+
+_tasks = {}
+
+
+def task(func=None, *, max_attempts=DEFAULT_MAX_ATTEMPTS):
+    """
+    Register a function as a job the worker may run, and give it an
+    `enqueue(**kwargs)` method. Keyword arguments are stored as JSON, so
+    pass ids rather than model instances.
+
+    A job runs in a transaction that also marks it done, so database-only
+    tasks take effect exactly once; anything outside the database (e.g.
+    email) must tolerate being retried.
+    """
+    def register(func):
+        name = f'{func.__module__}.{func.__qualname__}'
+        _tasks[name] = func
+        func.task_name = name
+        func.max_attempts = max_attempts
+        func.enqueue = lambda **kwargs: enqueue(func, **kwargs)
+        return func
+
+    return register(func) if func is not None else register
+
+
+def enqueue(func, **kwargs):
+    """
+    Queue func(**kwargs) for the worker. Commits (or rolls back) with the
+    current transaction. Without a worker (JOB_WORKER unset) the job is run
+    in this process as soon as that transaction commits.
+    """
+    job = Job.objects.create(task=func.task_name, kwargs=kwargs, max_attempts=func.max_attempts)
+    if not settings.JOB_WORKER:
+        transaction.on_commit(lambda: run_now(job.pk))
+    return job
+
+
+def run_now(job_id, visibility_timeout=300):
+    """
+    Claim one queued job and run it in this process. A job that succeeds is
+    deleted, since no worker is purging finished jobs; a failed attempt
+    stays queued (see `manage.py job_stats`) until a worker retries it.
+    """
+    now = timezone.now()
+    token = uuid.uuid4().hex
+    claimed = Job.objects.ready(now).filter(pk=job_id).update(
+        status=Job.RUNNING,
+        lock_token=token,
+        locked_until=now + timedelta(seconds=visibility_timeout),
+        attempts=F('attempts') + 1,
+        started_at=now,
+    )
+    if not claimed:
+        return None
+    status = run_job(job_id, token)
+    if status == Job.DONE:
+        Job.objects.filter(pk=job_id, status=Job.DONE).delete()
+    return status
+
+
+def claim_jobs(limit, visibility_timeout):
+    """
+    Claim up to `limit` due jobs for this worker, hiding them from other
+    workers for `visibility_timeout` seconds. Returns (lock_token, job ids).
+    """
+    now = timezone.now()
+    token = uuid.uuid4().hex
+
+    # A job whose last attempt timed out has nothing left to retry
+    Job.objects.filter(
+        status=Job.RUNNING, locked_until__lt=now, attempts__gte=F('max_attempts')
+    ).update(
+        status=Job.FAILED, finished_at=now, lock_token='',
+        last_error='The worker did not finish the last attempt within the visibility timeout.',
+    )
+
+    with transaction.atomic():
+        # SKIP LOCKED keeps concurrent workers off the same rows on PostgreSQL;
+        # elsewhere the conditional UPDATE below decides who got each job
+        candidates = list(
+            Job.objects.ready(now).order_by('run_at')
+            .select_for_update(skip_locked=True)
+            .values_list('pk', flat=True)[:limit]
+        )
+        if not candidates:
+            return token, []
+        Job.objects.ready(now).filter(pk__in=candidates).update(
+            status=Job.RUNNING,
+            lock_token=token,
+            locked_until=now + timedelta(seconds=visibility_timeout),
+            attempts=F('attempts') + 1,
+            started_at=now,
+        )
+    return token, list(Job.objects.filter(lock_token=token).values_list('pk', flat=True))
+
+
+def retry_delay(attempts):
+    """Exponential backoff with jitter, so failed jobs don't retry in lockstep."""
+    delay = min(RETRY_BACKOFF * 2 ** (attempts - 1), MAX_RETRY_DELAY)
+    return delay * random.uniform(0.5, 1.0)
+
+
+class LostClaim(Exception):
+    """The job was re-claimed by another worker after this one's visibility timeout."""
+
+
+def run_job(job_id, token):
+    """Run one claimed job and record the outcome. Returns the job's new status."""
+    job = Job.objects.filter(pk=job_id, lock_token=token).first()
+    if job is None:
+        return None
+
+    try:
+        func = _tasks.get(job.task)
+        if func is None:
+            raise LookupError(f"No task registered as {job.task!r}")
+        with transaction.atomic():
+            func(**job.kwargs)
+            finished = Job.objects.filter(pk=job.pk, lock_token=token).update(
+                status=Job.DONE, finished_at=timezone.now(), locked_until=None, lock_token='', last_error=''
+            )
+            if not finished:
+                raise LostClaim(job.task)
+        return Job.DONE
+    except LostClaim:
+        logger.warning("Job %s (%s) outlived its visibility timeout; its work was rolled back", job.pk, job.task)
+        return None
+    except Exception:
+        logger.exception("Job %s (%s) failed on attempt %s of %s", job.pk, job.task, job.attempts, job.max_attempts)
+        now = timezone.now()
+        if job.attempts < job.max_attempts:
+            status, changes = Job.QUEUED, {'run_at': now + timedelta(seconds=retry_delay(job.attempts))}
+        else:
+            status, changes = Job.FAILED, {'finished_at': now}
+        Job.objects.filter(pk=job.pk, lock_token=token).update(
+            status=status, locked_until=None, lock_token='', last_error=traceback.format_exc(), **changes
+        )
+        return status
+
+
+def purge_finished_jobs(older_than):
+    """Delete jobs that finished successfully more than `older_than` ago; returns the number deleted."""
+    deleted, _ = Job.objects.filter(status=Job.DONE, finished_at__lt=timezone.now() - older_than).delete()
+    return deleted
+
+
+def queue_metrics(window=timedelta(hours=1)):
+    """
+    Queue depth and job latency. `latency` is how long due jobs waited for
+    a worker and `duration` how long they took once started, over the jobs
+    finished in the last `window`.
+    """
+    now = timezone.now()
+    depth = dict(Job.objects.values_list('status').annotate(count=Count('pk')).order_by())
+    due = Job.objects.filter(status=Job.QUEUED, run_at__lte=now).aggregate(count=Count('pk'), oldest=Min('run_at'))
+
+    finished = Job.objects.filter(status=Job.DONE, finished_at__gte=now - window).values_list(
+        'run_at', 'started_at', 'finished_at'
+    )
+    latencies, durations = [], []
+    for run_at, started_at, finished_at in finished:
+        latencies.append(max((started_at - run_at).total_seconds(), 0))
+        durations.append((finished_at - started_at).total_seconds())
+
+    return {
+        'depth': {status: depth.get(status, 0) for status, _ in Job.STATUS_CHOICES},
+        'due': due['count'],
+        'oldest_due_age': (now - due['oldest']).total_seconds() if due['oldest'] else 0,
+        'finished': len(durations),
+        'latency': _percentiles(latencies),
+        'duration': _percentiles(durations),
+    }
+
+
+def _percentiles(values):
+    if not values:
+        return {'p50': 0, 'p95': 0, 'max': 0}
+    if len(values) == 1:
+        return {'p50': values[0], 'p95': values[0], 'max': values[0]}
+    cuts = quantiles(values, n=20, method='inclusive')
+    return {'p50': cuts[9], 'p95': cuts[18], 'max': max(values)}
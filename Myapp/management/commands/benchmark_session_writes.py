@@ -0,0 +1,69 @@
+import time
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from Myapp.middleware.auto_logout import AutoLogoutMiddleware
+
+
+class Command(BaseCommand):
+    help = "Count the session saves AutoLogoutMiddleware causes per 1,000 requests (all data is rolled back)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=1000, help="Requests to simulate")
+        parser.add_argument('--interval', type=float, default=5, help="Simulated seconds between requests")
+
+    def handle(self, *args, **options):
+        engine = import_module(settings.SESSION_ENGINE)
+        self.stdout.write(f"Session engine: {settings.SESSION_ENGINE}")
+        with transaction.atomic():
+            user = User.objects.create(username='session-bench', password='!')
+            for granularity in (0, settings.AUTO_LOGOUT_GRANULARITY):
+                self.run(engine, user, granularity, options['requests'], options['interval'])
+            transaction.set_rollback(True)
+        self.stdout.write(self.style.SUCCESS("Done; benchmark data rolled back."))
+
+    def run(self, engine, user, granularity, count, interval):
+        clock = [time.time()]
+        middleware = AutoLogoutMiddleware(lambda request: HttpResponse())
+        middleware.clock = lambda: clock[0]
+        middleware.granularity = granularity
+
+        session = engine.SessionStore()
+        session[SESSION_KEY] = str(user.pk)
+        session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.save()
+
+        factory = RequestFactory()
+        saves = 0
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            for _ in range(count):
+                # What SessionMiddleware does around each request
+                request = factory.get('/')
+                request.session = engine.SessionStore(session.session_key)
+                request.user = user
+                if not request.session.get(SESSION_KEY):
+                    raise RuntimeError("The simulated user was logged out; lower --interval.")
+                middleware(request)
+                if request.session.modified:
+                    request.session.save()
+                    saves += 1
+                clock[0] += interval
+            elapsed = time.perf_counter() - started
+
+        writes = sum(1 for query in queries if query['sql'].startswith(('UPDATE', 'INSERT')))
+        self.stdout.write(
+            f"Granularity {granularity:>3}s: {saves * 1000 / count:.0f} session saves and "
+            f"{writes * 1000 / count:.0f} database writes per 1k requests "
+            f"({elapsed * 1000 / count:.2f} ms per request)"
+        )
+        session.delete()
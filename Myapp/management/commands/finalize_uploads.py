@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from Myapp.models import Application
+from Myapp.uploads import discard_staged, finalize_resume, stale_staged_files
+
+
+class Command(BaseCommand):
+    help = "Move staged resumes whose job never finished to the file storage, and purge orphaned staged files"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--purge-after', type=int, default=24 * 60 * 60,
+            help="Delete unreferenced staged files older than this many seconds"
+        )
+
+    def handle(self, *args, **options):
+        pending = Application.objects.exclude(resume_upload='').values_list('pk', flat=True)
+        moved = failed = 0
+        for application_id in pending:
+            try:
+                moved += finalize_resume(application_id)
+            except Exception as exc:
+                failed += 1
+                self.stderr.write(f"Application {application_id}: {exc}")
+
+        orphans = stale_staged_files(options['purge_after'])
+        for name in orphans:
+            discard_staged(name)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Stored {moved} resumes ({failed} failed); purged {len(orphans)} orphaned staged files."
+        ))
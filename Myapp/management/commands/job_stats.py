@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+
+from Myapp.jobs import queue_metrics
+from Myapp.models import Job
+
+
+class Command(BaseCommand):
+    help = "Report the depth of the background job queue and recent job latency"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--window', type=int, default=60, help="Minutes of finished jobs to measure")
+
+    def handle(self, *args, **options):
+        metrics = queue_metrics(timedelta(minutes=options['window']))
+
+        depth = ', '.join(f"{count} {status}" for status, count in metrics['depth'].items())
+        self.stdout.write(f"Queue: {depth}")
+        self.stdout.write(f"Due now: {metrics['due']} (oldest waiting {metrics['oldest_due_age']:.1f}s)")
+        self.stdout.write(f"Finished in the last {options['window']} minutes: {metrics['finished']}")
+        for label in ('latency', 'duration'):
+            values = metrics[label]
+            self.stdout.write(
+                f"  {label:<8} p50 {values['p50']:.3f}s  p95 {values['p95']:.3f}s  max {values['max']:.3f}s"
+            )
+
+        pending = (
+            Job.objects.exclude(status=Job.DONE)
+            .values_list('task', 'status').annotate(count=Count('pk')).order_by('task', 'status')
+        )
+        for task_name, status, count in pending:
+            self.stdout.write(f"  {task_name}: {count} {status}")
@@ -0,0 +1,76 @@
+import time
+from statistics import quantiles
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from Myapp.sessions import write_behind_queue
+
+LOADTEST_USERNAME = 'session-loadtest'
+ENGINES = (
+    'django.contrib.sessions.backends.db',
+    'django.contrib.sessions.backends.cached_db',
+    'Myapp.sessions',
+)
+
+
+class Command(BaseCommand):
+    help = "Time authenticated requests with each session engine and report p50/p99 latency"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=2000, help="Requests per session engine")
+        parser.add_argument('--path', default=None, help="Page to request (default: the home page)")
+        parser.add_argument('--granularity', type=int, default=settings.AUTO_LOGOUT_GRANULARITY,
+                            help="AUTO_LOGOUT_GRANULARITY to run with; 0 saves the session on every request")
+
+    def handle(self, *args, **options):
+        path = options['path'] or reverse('home')
+        host = settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS else 'localhost'
+        user, _ = User.objects.get_or_create(username=LOADTEST_USERNAME)
+        self.stdout.write(
+            f"{options['requests']} requests to {path} per engine, "
+            f"activity saved every {options['granularity']}s"
+        )
+        try:
+            for engine in ENGINES:
+                with override_settings(SESSION_ENGINE=engine, AUTO_LOGOUT_GRANULARITY=options['granularity']):
+                    self.run(engine, user, path, host, options['requests'])
+        finally:
+            user.delete()
+
+    def run(self, engine, user, path, host, count):
+        client = Client(HTTP_HOST=host)
+        client.force_login(user)
+        client.get(path)  # warm up
+
+        queue = write_behind_queue()
+        flushes, written = queue.flushes, queue.written
+        latencies = []
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(count):
+                started = time.perf_counter()
+                response = client.get(path)
+                latencies.append((time.perf_counter() - started) * 1000)
+                if response.status_code != 200:
+                    self.stderr.write(f"{engine}: got status {response.status_code}")
+                    return
+        session_queries = [query['sql'] for query in queries if 'django_session' in query['sql']]
+        writes = sum(1 for sql in session_queries if sql.startswith(('UPDATE', 'INSERT')))
+
+        queue.flush()
+        cuts = quantiles(latencies, n=100, method='inclusive')
+        self.stdout.write(
+            f"{engine:<45} p50 {cuts[49]:6.2f} ms  p99 {cuts[98]:6.2f} ms  "
+            f"session queries {len(session_queries) * 1000 / count:5.0f}/1k "
+            f"(writes {writes * 1000 / count:.0f}/1k)"
+        )
+        if queue.flushes > flushes:
+            self.stdout.write(
+                f"{'':<45} {queue.written - written} deferred session writes in {queue.flushes - flushes} batches"
+            )
+        client.logout()
@@ -0,0 +1,22 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from Myapp.sessions import purge_expired_sessions
+
+
+class Command(BaseCommand):
+    help = "Delete expired sessions in batches, once or every --every seconds"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help="Sessions deleted per statement")
+        parser.add_argument('--every', type=int, default=0, help="Keep running and purge every this many seconds")
+
+    def handle(self, *args, **options):
+        while True:
+            started = time.perf_counter()
+            deleted = purge_expired_sessions(options['batch_size'])
+            self.stdout.write(f"Deleted {deleted} expired sessions in {time.perf_counter() - started:.2f}s")
+            if not options['every']:
+                return
+            time.sleep(options['every'])
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from Myapp.counters import rebuild_application_counters
+
+
+class Command(BaseCommand):
+    help = "Recompute the denormalized application counters on postings and organizations"
+
+    def handle(self, *args, **options):
+        postings, organizations = rebuild_application_counters()
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt counters for {postings} postings and {organizations} organizations."
+        ))
@@ -0,0 +1,100 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import autodiscover_modules
+
+from Myapp import worker
+from Myapp.jobs import claim_jobs, purge_finished_jobs, queue_metrics
+from Myapp.utils import cache_is_per_process
+
+# Seconds between queue metric reports and clean-ups of finished jobs
+REPORT_INTERVAL = 60
+
+
+class Command(BaseCommand):
+    help = "Run queued background jobs (notifications and other deferred work) in a pool of processes"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=os.cpu_count() or 1,
+                            help="Jobs run at the same time (default: one per CPU)")
+        parser.add_argument('--poll-interval', type=float, default=1.0,
+                            help="Seconds to wait before checking an empty queue again")
+        parser.add_argument('--visibility-timeout', type=int, default=300,
+                            help="Seconds a claimed job stays hidden from other workers before it is retried")
+        parser.add_argument('--retention-hours', type=int, default=24,
+                            help="Delete successful jobs this long after they finish")
+        parser.add_argument('--once', action='store_true',
+                            help="Exit once no jobs are due instead of waiting for more")
+
+    def handle(self, *args, **options):
+        if cache_is_per_process():
+            # Jobs clear cached state (notification badges, roles) the web
+            # processes would never see, leaving their pages stale
+            raise CommandError(
+                "The worker needs a cache shared with the web processes; "
+                "set CACHE_BACKEND (e.g. django.core.cache.backends.filebased.FileBasedCache) and CACHE_LOCATION."
+            )
+        autodiscover_modules('tasks')
+        self.options = options
+        self.last_report = 0
+        self.stdout.write(f"Worker started with {options['processes']} processes")
+        try:
+            while not self.run_pool():
+                self.stderr.write("A job process died; restarting the pool")
+        except KeyboardInterrupt:
+            self.stdout.write("Worker stopped")
+
+    def run_pool(self):
+        """Feed jobs to a process pool. Returns False if the pool broke and must be replaced."""
+        options = self.options
+        in_flight = set()
+        executor = ProcessPoolExecutor(
+            max_workers=options['processes'],
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=worker.init_process,
+        )
+        try:
+            while True:
+                self.report()
+                free = options['processes'] - len(in_flight)
+                if free:
+                    token, claimed = claim_jobs(free, options['visibility_timeout'])
+                    in_flight.update(executor.submit(worker.execute, job_id, token) for job_id in claimed)
+
+                if not in_flight:
+                    if options['once']:
+                        return True
+                    time.sleep(options['poll_interval'])
+                    continue
+
+                # Wait for a process to free up; with spare processes, poll again for new jobs
+                busy = len(in_flight) >= options['processes']
+                done, in_flight = wait(
+                    in_flight, timeout=None if busy else options['poll_interval'], return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    job_id, status = future.result()
+                    self.stdout.write(f"Job {job_id}: {status or 'abandoned'}")
+        except BrokenProcessPool:
+            # Claimed jobs reappear once their visibility timeout expires
+            return False
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def report(self):
+        if time.monotonic() - self.last_report < REPORT_INTERVAL:
+            return
+        self.last_report = time.monotonic()
+        purged = purge_finished_jobs(timedelta(hours=self.options['retention_hours']))
+        metrics = queue_metrics()
+        self.stdout.write(
+            f"Queue: {metrics['due']} due (oldest {metrics['oldest_due_age']:.1f}s), "
+            f"{metrics['depth']['running']} running, {metrics['depth']['failed']} failed; "
+            f"last hour {metrics['finished']} done, latency p50 {metrics['latency']['p50']:.2f}s "
+            f"p95 {metrics['latency']['p95']:.2f}s; {purged} old jobs purged"
+        )
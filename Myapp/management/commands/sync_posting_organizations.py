@@ -0,0 +1,47 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+
+from MyLogin.models import version_bump
+from Myapp.feed import invalidate_posting_cards, invalidate_tag_facets
+from Myapp.models import Posting, organization_fields
+from Myapp.search import index_posting
+
+
+class Command(BaseCommand):
+    help = "Check the organization fields copied onto postings against each profile and repair any drift"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help="Only report drifted postings")
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        drifted_total = 0
+
+        owners = User.objects.filter(pk__in=Posting.objects.values('organization_id')).select_related('profile')
+        for user in owners.iterator():
+            fields = organization_fields(user, getattr(user, 'profile', None))
+            drifted_ids = list(Posting.objects.for_org(user).exclude(**fields).values_list('pk', flat=True))
+            if not drifted_ids:
+                continue
+            drifted_total += len(drifted_ids)
+            self.stdout.write(self.style.WARNING(f"{user.email}: {len(drifted_ids)} postings out of sync"))
+            if not dry_run:
+                self.repair(drifted_ids, fields)
+
+        if drifted_total and not dry_run:
+            invalidate_tag_facets()
+
+        if not drifted_total:
+            self.stdout.write(self.style.SUCCESS("All postings match their organization profiles."))
+        elif dry_run:
+            self.stdout.write(f"{drifted_total} postings out of sync (dry run, nothing changed).")
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Repaired {drifted_total} postings."))
+
+    def repair(self, posting_ids, fields):
+        Posting.objects.filter(pk__in=posting_ids).update(**fields, **version_bump())
+        # The organization name is part of the search document and the card
+        postings = Posting.objects.filter(pk__in=posting_ids).prefetch_related('tags')
+        for posting in postings:
+            index_posting(posting)
+        invalidate_posting_cards(posting_ids)
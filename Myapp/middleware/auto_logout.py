@@ -1,34 +1,73 @@
 import datetime
+import time
 from django.conf import settings
+from django.contrib import messages
 from django.contrib.auth import logout
 from django.shortcuts import redirect
+from django.urls import reverse
+
+# Background requests that must not count as user activity
+PASSIVE_URL_NAMES = ('notification_stream', 'notification_poll')
+
+LAST_ACTIVITY_KEY = 'last_activity'
+
+
+def _parse_last_activity(value):
+    """Epoch seconds from the session; older sessions hold an ISO timestamp."""
+    if isinstance(value, (int, float)):
+        return value
+    activity = datetime.datetime.fromisoformat(value)
+    if activity.tzinfo is None:
+        activity = activity.replace(tzinfo=datetime.timezone.utc)
+    return activity.timestamp()
+
+
+def record_activity(request, now=None):
+    """Start the idle clock now (e.g. on login)."""
+    request.session[LAST_ACTIVITY_KEY] = int(time.time() if now is None else now)
+
 
 class AutoLogoutMiddleware:
+    """
+    Log users out after AUTO_LOGOUT_DELAY seconds without a request.
+
+    Activity is only written to the session once it has moved on by
+    AUTO_LOGOUT_GRANULARITY seconds, so most requests leave the session
+    unmodified and it is not saved. A user may therefore be logged out up
+    to one granularity step before the full delay has passed.
+    """
+
+    clock = staticmethod(time.time)
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self.delay = getattr(settings, 'AUTO_LOGOUT_DELAY', 300)  # default 5 mins
+        self.granularity = getattr(settings, 'AUTO_LOGOUT_GRANULARITY', 60)
+        self._passive_paths = None
+
+    def is_passive(self, request):
+        if self._passive_paths is None:
+            self._passive_paths = {reverse(name) for name in PASSIVE_URL_NAMES}
+        return request.path in self._passive_paths
 
     def __call__(self, request):
         if not request.user.is_authenticated:
             return self.get_response(request)
 
-        now = datetime.datetime.now(datetime.timezone.utc)  # use timezone-aware datetime
-        last_activity = request.session.get('last_activity')
-
-        if last_activity:
-            try:
-                last_activity_time = datetime.datetime.fromisoformat(last_activity)
-                # Make sure it's timezone-aware too
-                if last_activity_time.tzinfo is None:
-                    last_activity_time = last_activity_time.replace(tzinfo=datetime.timezone.utc)
-
-                elapsed = (now - last_activity_time).total_seconds()
-                if elapsed > getattr(settings, 'AUTO_LOGOUT_DELAY', 300):  # default 5 mins
-                    logout(request)
-                    return redirect('login')
+        now = self.clock()
+        last_activity = request.session.get(LAST_ACTIVITY_KEY)
+        try:
+            last_activity = _parse_last_activity(last_activity) if last_activity is not None else None
+        except (ValueError, TypeError):
+            # If session data is malformed, reset it safely
+            last_activity = None
 
-            except (ValueError, TypeError):
-                # If session data is malformed, reset it safely
-                request.session['last_activity'] = now.isoformat()
+        if last_activity is not None and now - last_activity > self.delay:
+            # Drop queued messages; the login page shows the inactivity notice
+            list(messages.get_messages(request))
+            logout(request)
+            return redirect(f"{reverse('login')}?session_expired=1")
 
-        request.session['last_activity'] = now.isoformat()
+        if last_activity is None or (now - last_activity >= self.granularity and not self.is_passive(request)):
+            record_activity(request, now)
         return self.get_response(request)
@@ -0,0 +1,17 @@
+from django.utils.functional import SimpleLazyObject
+
+from MyLogin.roles import get_user_role
+
+
+class UserRoleMiddleware:
+    """
+    Sets request.user_role (see MyLogin.roles.UserRole). It is loaded on
+    first use, from the cache, so requests that never check a role pay nothing.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.user_role = SimpleLazyObject(lambda: get_user_role(request.user))
+        return self.get_response(request)
@@ -0,0 +1,67 @@
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+FTS_TABLE = 'myapp_posting_fts'
+GIN_INDEX = 'myapp_posting_search_gin'
+
+
+def create_search_index(apps, schema_editor):
+    """
+    PostgreSQL: GIN index over Posting.search_vector, backfilled from the
+    existing rows. SQLite: an FTS5 table keyed by posting id instead.
+    """
+    Posting = apps.get_model('Myapp', 'Posting')
+    Profile = apps.get_model('MyLogin', 'Profile')
+    posting_table = schema_editor.quote_name(Posting._meta.db_table)
+    profile_table = schema_editor.quote_name(Profile._meta.db_table)
+    vendor = schema_editor.connection.vendor
+
+    if vendor == 'postgresql':
+        schema_editor.execute(f'CREATE INDEX {GIN_INDEX} ON {posting_table} USING gin (search_vector)')
+        schema_editor.execute(f"""
+            UPDATE {posting_table} AS p SET search_vector =
+                setweight(to_tsvector('english', coalesce(p.title, '')), 'A') ||
+                setweight(to_tsvector('english', replace(coalesce(p.tags, ''), ',', ' ')), 'B') ||
+                setweight(to_tsvector('english', coalesce(pr.org_name, '')), 'B') ||
+                setweight(to_tsvector('english', coalesce(p.description, '')), 'C')
+            FROM {posting_table} AS src
+            LEFT JOIN {profile_table} AS pr ON pr.user_id = src.organization_id
+            WHERE src.id = p.id
+        """)
+    elif vendor == 'sqlite':
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+            f"title, description, tags, org_name, tokenize = 'porter unicode61')"
+        )
+        schema_editor.execute(f"""
+            INSERT INTO {FTS_TABLE} (rowid, title, description, tags, org_name)
+            SELECT p.id, p.title, p.description, replace(coalesce(p.tags, ''), ',', ' '), coalesce(pr.org_name, '')
+            FROM {posting_table} AS p
+            LEFT JOIN {profile_table} AS pr ON pr.user_id = p.organization_id
+        """)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute(f'DROP INDEX IF EXISTS {GIN_INDEX}')
+    elif vendor == 'sqlite':
+        schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Myapp', '0010_posting_opportunity_type'),
+        ('MyLogin', '0007_add_skills_and_portfolio'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='posting',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
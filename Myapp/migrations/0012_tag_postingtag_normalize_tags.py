@@ -0,0 +1,81 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def split_tag_strings(apps, schema_editor):
+    """Turn the comma-separated Posting.tags strings into Tag/PostingTag rows."""
+    Posting = apps.get_model('Myapp', 'Posting')
+    Tag = apps.get_model('Myapp', 'Tag')
+    PostingTag = apps.get_model('Myapp', 'PostingTag')
+
+    tags_by_slug = {}
+    links = []
+    for posting_id, tag_string in Posting.objects.exclude(tags='').values_list('id', 'tags'):
+        seen = set()
+        for name in tag_string.split(','):
+            name = name.strip()[:100]
+            slug = slugify(name)
+            if not slug or slug in seen:
+                continue
+            seen.add(slug)
+            if slug not in tags_by_slug:
+                tags_by_slug[slug], _ = Tag.objects.get_or_create(slug=slug, defaults={'name': name})
+            links.append(PostingTag(posting_id=posting_id, tag=tags_by_slug[slug]))
+
+    PostingTag.objects.bulk_create(links, batch_size=1000)
+
+
+def join_tag_strings(apps, schema_editor):
+    Posting = apps.get_model('Myapp', 'Posting')
+    for posting in Posting.objects.prefetch_related('tag_set'):
+        posting.tags = ','.join(tag.name for tag in posting.tag_set.all())[:255]
+        posting.save(update_fields=['tags'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Myapp', '0011_posting_search_vector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('slug', models.SlugField(max_length=100, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PostingTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('posting', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='posting_tags', to='Myapp.posting')),
+                ('tag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='posting_tags', to='Myapp.tag')),
+            ],
+            options={
+                'unique_together': {('posting', 'tag')},
+                'indexes': [models.Index(fields=['tag', 'posting'], name='myapp_postingtag_tag_idx')],
+            },
+        ),
+        migrations.AddField(
+            model_name='posting',
+            name='tag_set',
+            field=models.ManyToManyField(blank=True, related_name='postings', through='Myapp.PostingTag', to='Myapp.tag'),
+        ),
+        migrations.RunPython(split_tag_strings, join_tag_strings),
+        migrations.RemoveField(
+            model_name='posting',
+            name='tags',
+        ),
+        migrations.RenameField(
+            model_name='posting',
+            old_name='tag_set',
+            new_name='tags',
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Myapp', '0012_tag_postingtag_normalize_tags'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['posting', 'status'], name='application_posting_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='posting',
+            index=models.Index(fields=['approval_status', '-created_at', '-id'], name='posting_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='posting',
+            index=models.Index(fields=['approval_status', 'status', 'deadline'], name='posting_open_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='posting',
+            index=models.Index(fields=['organization', '-created_at'], name='posting_org_created_idx'),
+        ),
+    ]
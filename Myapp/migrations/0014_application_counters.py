@@ -0,0 +1,89 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:55
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+STATUSES = ['submitted', 'under_review', 'accepted', 'rejected', 'withdrawn']
+
+
+def count_applications(apps, schema_editor):
+    """Fill the new counters from the existing applications."""
+    Posting = apps.get_model('Myapp', 'Posting')
+    Application = apps.get_model('Myapp', 'Application')
+    OrganizationApplicationStats = apps.get_model('Myapp', 'OrganizationApplicationStats')
+
+    postings = {}
+    organizations = {}
+    rows = Application.objects.values('posting_id', 'posting__organization_id', 'status').annotate(count=Count('id'))
+    for row in rows.order_by():
+        for counters, key in ((postings, row['posting_id']), (organizations, row['posting__organization_id'])):
+            counts = counters.setdefault(key, dict.fromkeys(['applicant_count'] + [f'{s}_count' for s in STATUSES], 0))
+            counts['applicant_count'] += row['count']
+            if row['status'] in STATUSES:
+                counts[f"{row['status']}_count"] += row['count']
+
+    for posting_id, counts in postings.items():
+        Posting.objects.filter(pk=posting_id).update(**counts)
+    OrganizationApplicationStats.objects.bulk_create(
+        [OrganizationApplicationStats(organization_id=org_id, **counts) for org_id, counts in organizations.items()],
+        batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Myapp', '0013_indexes'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrganizationApplicationStats',
+            fields=[
+                ('applicant_count', models.PositiveIntegerField(default=0, editable=False)),
+                ('submitted_count', models.PositiveIntegerField(default=0, editable=False)),
+                ('under_review_count', models.PositiveIntegerField(default=0, editable=False)),
+                ('accepted_count', models.PositiveIntegerField(default=0, editable=False)),
+                ('rejected_count', models.PositiveIntegerField(default=0, editable=False)),
+                ('withdrawn_count', models.PositiveIntegerField(default=0, editable=False)),
+                ('organization', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='application_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='posting',
+            name='accepted_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='posting',
+            name='applicant_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='posting',
+            name='rejected_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='posting',
+            name='submitted_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='posting',
+            name='under_review_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='posting',
+            name='withdrawn_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(count_applications, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.7 on 2026-10-17 19:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def copy_organization_fields(apps, schema_editor):
+    """Fill the new posting fields from each organization's profile."""
+    Posting = apps.get_model('Myapp', 'Posting')
+    User = apps.get_model('auth', 'User')
+    Profile = apps.get_model('MyLogin', 'Profile')
+
+    profiles = {profile.user_id: profile for profile in Profile.objects.all()}
+    for user in User.objects.filter(pk__in=Posting.objects.values('organization_id')):
+        profile = profiles.get(user.pk)
+        Posting.objects.filter(organization_id=user.pk).update(
+            organization_verified=bool(
+                profile and profile.role == 'Organization' and profile.verification_status == 'verified'
+            ),
+            org_display_name=(profile.org_name if profile else '') or user.email,
+            org_logo_url=profile.org_logo.url if profile and profile.org_logo else '',
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('MyLogin', '0009_notification_dedup_key'),
+        ('Myapp', '0014_application_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='posting',
+            name='posting_feed_idx',
+        ),
+        migrations.AddField(
+            model_name='posting',
+            name='org_display_name',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='posting',
+            name='org_logo_url',
+            field=models.CharField(blank=True, default='', editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name='posting',
+            name='organization_verified',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.RunPython(copy_organization_fields, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='posting',
+            index=models.Index(condition=models.Q(('approval_status', 'approved'), ('organization_verified', True)), fields=['-created_at', '-id'], name='posting_visible_feed_idx'),
+        ),
+    ]
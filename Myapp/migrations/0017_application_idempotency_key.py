@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-17 19:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Myapp', '0016_posting_versioning'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='idempotency_key',
+            field=models.CharField(blank=True, default='', editable=False, max_length=64),
+        ),
+    ]
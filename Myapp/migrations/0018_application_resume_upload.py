@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-17 19:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Myapp', '0017_application_idempotency_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='resume_upload',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='resume',
+            field=models.FileField(blank=True, upload_to='resumes/'),
+        ),
+    ]
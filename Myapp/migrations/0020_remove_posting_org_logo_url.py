@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-17 19:43
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Myapp', '0019_job'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='posting',
+            name='org_logo_url',
+        ),
+    ]
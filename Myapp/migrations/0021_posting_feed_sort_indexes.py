@@ -0,0 +1,27 @@
+# Generated by Django 5.2.7 on 2026-10-17 19:54
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Myapp', '0020_remove_posting_org_logo_url'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='posting',
+            index=models.Index(condition=models.Q(('approval_status', 'approved'), ('organization_verified', True)), fields=['deadline', 'id'], name='posting_visible_deadline_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='posting',
+            index=models.Index(condition=models.Q(('approval_status', 'approved'), ('organization_verified', True)), fields=['title', 'id'], name='posting_visible_title_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='posting',
+            index=models.Index(condition=models.Q(('approval_status', 'approved'), ('organization_verified', True)), fields=['org_display_name', 'id'], name='posting_visible_org_idx'),
+        ),
+    ]
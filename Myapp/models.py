@@ -1,7 +1,100 @@
+from datetime import date
+
 from django.db import models
 from django.contrib.auth.models import User
+from django.contrib.postgres.search import SearchVectorField
+from django.utils import timezone
+from django.utils.text import slugify
+
+from MyLogin.models import Versioned, version_bump
+
+
+class Tag(models.Model):
+    name = models.CharField(max_length=100)
+    slug = models.SlugField(max_length=100, unique=True)
+
+    class Meta:
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
 
-class Posting(models.Model):
+
+class ApplicationCounters(models.Model):
+    """
+    Denormalized application counts, one per Application status.
+    Kept current by Myapp.counters; rebuild with `manage.py rebuild_application_counters`.
+    """
+    applicant_count = models.PositiveIntegerField(default=0, editable=False)
+    submitted_count = models.PositiveIntegerField(default=0, editable=False)
+    under_review_count = models.PositiveIntegerField(default=0, editable=False)
+    accepted_count = models.PositiveIntegerField(default=0, editable=False)
+    rejected_count = models.PositiveIntegerField(default=0, editable=False)
+    withdrawn_count = models.PositiveIntegerField(default=0, editable=False)
+
+    COUNTER_FIELDS = (
+        'applicant_count', 'submitted_count', 'under_review_count',
+        'accepted_count', 'rejected_count', 'withdrawn_count',
+    )
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        # Counters only change through F() updates; saving a loaded instance
+        # must not write stale values back over concurrent increments
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+    @property
+    def acceptance_rate(self):
+        """Percentage of (non-withdrawn) applications that were accepted"""
+        considered = self.applicant_count - self.withdrawn_count
+        if considered <= 0:
+            return 0
+        return round(100 * self.accepted_count / considered)
+
+
+def organization_fields(user, profile):
+    """The Posting fields copied from an organization's profile."""
+    return {
+        'organization_verified': bool(profile and profile.is_verified_organization()),
+        'org_display_name': (profile.org_name if profile else '') or user.email,
+    }
+
+
+class PostingQuerySet(models.QuerySet):
+    def approved(self):
+        return self.filter(approval_status='approved')
+
+    def visible(self):
+        """
+        Approved postings from verified organizations (what students may see).
+        Reads the denormalized organization_verified flag, so no join is needed.
+        """
+        return self.approved().filter(organization_verified=True)
+
+    def open(self, today=None):
+        """Active postings whose deadline has not passed."""
+        return self.filter(status='Active', deadline__gte=today or date.today())
+
+    def for_org(self, organization):
+        return self.filter(organization=organization)
+
+    def sync_organization_fields(self, profile):
+        """
+        Copy an organization's profile onto its postings in this queryset.
+        Only rows that differ are written; returns the number updated.
+        """
+        fields = organization_fields(profile.user, profile)
+        return self.for_org(profile.user).exclude(**fields).update(**fields, **version_bump())
+
+
+class Posting(ApplicationCounters, Versioned):
     STATUS_CHOICES = [
         ('Active', 'Active'),
         ('Closed', 'Closed'),
@@ -28,7 +121,7 @@ class Posting(models.Model):
     title = models.CharField(max_length=255)
     description = models.TextField()
     deadline = models.DateField()
-    tags = models.CharField(max_length=255, blank=True, default="")
+    tags = models.ManyToManyField(Tag, through='PostingTag', related_name='postings', blank=True)
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='Active')
     organization = models.ForeignKey(
     User,
@@ -59,9 +152,73 @@ class Posting(models.Model):
         default='other'
     )
 
+    # Full-text search document (PostgreSQL), kept current by Myapp.signals.
+    # SQLite uses the myapp_posting_fts FTS5 table instead.
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    # Copied from the organization's profile so the student feed can render
+    # and filter without joining auth_user and mylogin_profile. Kept in sync
+    # by Myapp.signals; repair drift with `manage.py sync_posting_organizations`.
+    organization_verified = models.BooleanField(default=False, editable=False)
+    org_display_name = models.CharField(max_length=255, blank=True, default='', editable=False)
+
+    objects = PostingQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Student feed: visible postings only, newest first (keyset on created_at, id)
+            models.Index(
+                fields=['-created_at', '-id'],
+                condition=models.Q(approval_status='approved', organization_verified=True),
+                name='posting_visible_feed_idx',
+            ),
+            # The feed's other sort orders (Myapp.feed.FEED_SORTS), also keysets on id
+            models.Index(
+                fields=['deadline', 'id'],
+                condition=models.Q(approval_status='approved', organization_verified=True),
+                name='posting_visible_deadline_idx',
+            ),
+            models.Index(
+                fields=['title', 'id'],
+                condition=models.Q(approval_status='approved', organization_verified=True),
+                name='posting_visible_title_idx',
+            ),
+            models.Index(
+                fields=['org_display_name', 'id'],
+                condition=models.Q(approval_status='approved', organization_verified=True),
+                name='posting_visible_org_idx',
+            ),
+            # "Active opportunities": approved + Active + deadline in the future
+            models.Index(fields=['approval_status', 'status', 'deadline'], name='posting_open_idx'),
+            # Organization dashboard / manage postings, newest first
+            models.Index(fields=['organization', '-created_at'], name='posting_org_created_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
+    @property
+    def tags_list(self):
+        """Tag names for display (uses prefetched tags when available)"""
+        return [tag.name for tag in self.tags.all()]
+
+    def copy_organization_fields(self, profile=None):
+        """Refresh the denormalized organization fields from the owner's profile."""
+        if profile is None:
+            profile = getattr(self.organization, 'profile', None)
+        for field, value in organization_fields(self.organization, profile).items():
+            setattr(self, field, value)
+
+    def set_tags(self, names):
+        """Replace this posting's tags with the given tag names"""
+        tags = {}
+        for name in names:
+            name = name.strip()[:100]
+            slug = slugify(name)
+            if slug and slug not in tags:
+                tags[slug], _ = Tag.objects.get_or_create(slug=slug, defaults={'name': name})
+        self.tags.set(tags.values())
+
     def is_approved(self):
         """Check if posting is approved"""
         return self.approval_status == 'approved'
@@ -78,6 +235,36 @@ class Posting(models.Model):
         return False  # No auto-approval anymore
 
 
+class PostingTag(models.Model):
+    posting = models.ForeignKey(Posting, on_delete=models.CASCADE, related_name='posting_tags')
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name='posting_tags')
+
+    class Meta:
+        unique_together = ['posting', 'tag']
+        indexes = [
+            # Tag filters and facet counts look postings up by tag
+            models.Index(fields=['tag', 'posting'], name='myapp_postingtag_tag_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.posting_id} - {self.tag.name}"
+
+
+class ApplicationQuerySet(models.QuerySet):
+    def status_histogram(self):
+        """
+        Count these applications per status in a single query, e.g.
+        {'total': 4, 'submitted': 2, 'under_review': 1, 'accepted': 1, 'rejected': 0, 'withdrawn': 0}
+        """
+        return self.order_by().aggregate(
+            total=models.Count('pk'),
+            **{
+                status: models.Count('pk', filter=models.Q(status=status))
+                for status, _ in self.model.STATUS_CHOICES
+            }
+        )
+
+
 class Application(models.Model):
     STATUS_CHOICES = [
         ('submitted', 'Submitted'),
@@ -89,14 +276,91 @@ class Application(models.Model):
     
     student = models.ForeignKey(User, on_delete=models.CASCADE, related_name='applications')
     posting = models.ForeignKey(Posting, on_delete=models.CASCADE, related_name='applications')
-    resume = models.FileField(upload_to='resumes/')
+    # Empty until a job has moved the upload out of
+    # resume_upload (a staged file, see Myapp.uploads)
+    resume = models.FileField(upload_to='resumes/', blank=True)
+    resume_upload = models.CharField(max_length=255, blank=True, default='', editable=False)
     note = models.TextField(blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='submitted')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Sent with the apply form, so a resubmitted form is recognised as the
+    # same application rather than a second attempt
+    idempotency_key = models.CharField(max_length=64, blank=True, default='', editable=False)
+
+    objects = ApplicationQuerySet.as_manager()
     
     class Meta:
         unique_together = ['student', 'posting']
+        indexes = [
+            # Applicant counts per posting and status
+            models.Index(fields=['posting', 'status'], name='application_posting_status_idx'),
+        ]
     
     def __str__(self):
-        return f"{self.student.email} - {self.posting.title}"
\ No newline at end of file
+        return f"{self.student.email} - {self.posting.title}"
+
+
+class OrganizationApplicationStats(ApplicationCounters):
+    """Application counts rolled up across all of an organization's postings"""
+    organization = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='application_stats'
+    )
+
+    def __str__(self):
+        return f"{self.organization.email} - {self.applicant_count} applicants"
+
+
+class JobQuerySet(models.QuerySet):
+    def ready(self, now):
+        """Jobs a worker may claim: queued and due, or running past their visibility timeout."""
+        return self.filter(
+            models.Q(status=Job.QUEUED, run_at__lte=now)
+            | models.Q(status=Job.RUNNING, locked_until__lt=now)
+        )
+
+
+class Job(models.Model):
+    """
+    A unit of deferred work, run by `manage.py run_worker`, or by the process
+    that queued it when JOB_WORKER is unset (see Myapp.jobs).
+    A claimed job is hidden from other workers until locked_until; if its
+    worker dies it becomes visible again and is retried.
+    """
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (QUEUED, 'Queued'),
+        (RUNNING, 'Running'),
+        (DONE, 'Done'),
+        (FAILED, 'Failed'),
+    ]
+
+    task = models.CharField(max_length=200)
+    kwargs = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=QUEUED)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    # Set per claim, so a worker that outlived its timeout cannot finish a job another worker re-claimed
+    lock_token = models.CharField(max_length=32, blank=True, default='')
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    objects = JobQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'run_at'], name='job_ready_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.task} ({self.status})"
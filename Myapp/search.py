@@ -0,0 +1,173 @@
+import re
+
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank, SearchVector
+from django.core.exceptions import EmptyResultSet
+from django.db import connection
+from django.db.models import F, Q, TextField, Value
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+from .feed import visible_postings
+from .models import Posting
+
+SEARCH_CONFIG = 'english'
+SEARCH_RESULT_LIMIT = 50
+MAX_SEARCH_TERMS = 8
+
+# SQLite FTS5 table used in place of the tsvector column for local development
+FTS_TABLE = 'myapp_posting_fts'
+
+# Control characters mark highlights so the snippet can be escaped before
+# the markers are turned into <mark> tags
+HIGHLIGHT_START = '\x02'
+HIGHLIGHT_STOP = '\x03'
+
+
+def _search_terms(query):
+    return re.findall(r'\w+', query.lower())[:MAX_SEARCH_TERMS]
+
+
+def _render_snippet(text):
+    return mark_safe(escape(text or '').replace(HIGHLIGHT_START, '<mark>').replace(HIGHLIGHT_STOP, '</mark>'))
+
+
+def _search_document(posting):
+    """The text fields of a posting that are indexed for search."""
+    return {
+        'title': posting.title or '',
+        'description': posting.description or '',
+        'tags': ' '.join(posting.tags_list),
+        # The name shown on the card, copied from the organization's profile
+        'org_name': posting.org_display_name or '',
+    }
+
+
+def index_posting(posting):
+    """Refresh the search index entry for a single posting."""
+    document = _search_document(posting)
+
+    if connection.vendor == 'postgresql':
+        def weighted(field, weight):
+            return SearchVector(Value(document[field], output_field=TextField()), weight=weight, config=SEARCH_CONFIG)
+
+        Posting.objects.filter(pk=posting.pk).update(
+            search_vector=(
+                weighted('title', 'A')
+                + weighted('tags', 'B')
+                + weighted('org_name', 'B')
+                + weighted('description', 'C')
+            )
+        )
+    elif connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [posting.pk])
+            cursor.execute(
+                f'INSERT INTO {FTS_TABLE} (rowid, title, description, tags, org_name) VALUES (%s, %s, %s, %s, %s)',
+                [posting.pk, document['title'], document['description'], document['tags'], document['org_name']]
+            )
+
+
+def remove_posting(posting_id):
+    """Drop a deleted posting from the search index (the tsvector column goes with the row)."""
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [posting_id])
+
+
+def search_postings(query, postings=None, limit=SEARCH_RESULT_LIMIT):
+    """
+    Ranked, prefix-matching full-text search over postings.
+
+    Every term must match (as a prefix) in the title, description, tags or
+    organization name. Returns postings best match first, each with
+    `search_rank` and a highlighted `search_snippet` of the description.
+    """
+    terms = _search_terms(query)
+    if not terms:
+        return []
+
+    if postings is None:
+        postings = visible_postings()
+
+    if connection.vendor == 'postgresql':
+        return _search_postgresql(terms, postings, limit)
+    if connection.vendor == 'sqlite':
+        return _search_sqlite(terms, postings, limit)
+    return _search_fallback(terms, postings, limit)
+
+
+def _search_postgresql(terms, postings, limit):
+    tsquery = SearchQuery(' & '.join(f'{term}:*' for term in terms), search_type='raw', config=SEARCH_CONFIG)
+    results = list(
+        postings.filter(search_vector=tsquery)
+        .annotate(
+            search_rank=SearchRank(F('search_vector'), tsquery),
+            search_headline=SearchHeadline(
+                'description', tsquery, config=SEARCH_CONFIG,
+                start_sel=HIGHLIGHT_START, stop_sel=HIGHLIGHT_STOP,
+                min_words=15, max_words=35
+            ),
+        )
+        .order_by('-search_rank', '-created_at')[:limit]
+    )
+    for posting in results:
+        posting.search_snippet = _render_snippet(posting.search_headline)
+    return results
+
+
+def _search_sqlite(terms, postings, limit):
+    match = ' '.join(f'"{term}"*' for term in terms)
+    # Restrict the matches to the (filtered) postings being searched in SQL,
+    # so only the top `limit` rows are ranked, snippeted and returned
+    try:
+        allowed_sql, allowed_params = postings.order_by().values('pk').query.sql_with_params()
+    except EmptyResultSet:
+        return []
+    with connection.cursor() as cursor:
+        # bm25() column weights follow the table order: title, description, tags, org_name
+        cursor.execute(
+            f"SELECT rowid, bm25({FTS_TABLE}, 10.0, 2.0, 5.0, 5.0), "
+            f"snippet({FTS_TABLE}, 1, %s, %s, '…', 24) "
+            f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s AND rowid IN ({allowed_sql}) "
+            f"ORDER BY 2 LIMIT %s",
+            [HIGHLIGHT_START, HIGHLIGHT_STOP, match, *allowed_params, limit]
+        )
+        matches = cursor.fetchall()
+
+    found = postings.in_bulk([posting_id for posting_id, _, _ in matches])
+    results = []
+    for posting_id, score, snippet in matches:
+        posting = found.get(posting_id)
+        if posting is None:
+            continue
+        posting.search_rank = -score
+        posting.search_snippet = _render_snippet(snippet)
+        results.append(posting)
+    return results
+
+
+def _search_fallback(terms, postings, limit):
+    for term in terms:
+        postings = postings.filter(
+            Q(title__icontains=term) | Q(description__icontains=term)
+            | Q(tags__name__icontains=term) | Q(org_display_name__icontains=term)
+        )
+    results = list(postings.distinct()[:limit])
+    for posting in results:
+        posting.search_rank = 0
+        posting.search_snippet = escape(posting.description[:200])
+    return results
+
+
+def rebuild_search_index(postings=None):
+    """Re-index every posting; returns the number of postings indexed."""
+    if postings is None:
+        postings = Posting.objects.prefetch_related('tags')
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute(f'DELETE FROM {FTS_TABLE}')
+    count = 0
+    for posting in postings.iterator():
+        index_posting(posting)
+        count += 1
+    return count
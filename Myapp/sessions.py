@@ -0,0 +1,143 @@
+"""
+Session engine that reads through the cache like `cached_db`, but writes
+changes to existing sessions to the database in batches from a background
+thread instead of during the request. New sessions (logins) and deletions
+(logouts) still go straight to the database.
+
+Enable it with SESSION_WRITE_BEHIND=true, which needs a CACHE_BACKEND
+shared between processes. Changes not yet flushed when a process dies are
+only kept by the cache.
+"""
+import atexit
+import logging
+import threading
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.sessions.backends import cached_db
+from django.contrib.sessions.backends.base import UpdateError
+from django.db import close_old_connections
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Marks a deleted session, so a request still holding it cannot cache it again
+TOMBSTONE_PREFIX = 'sessions:deleted:'
+
+
+class WriteBehindQueue:
+    """The latest unsaved state of each changed session in this process."""
+
+    def __init__(self, model):
+        self.model = model
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        # Totals for this process, for load tests and monitoring
+        self.flushes = 0
+        self.written = 0
+
+    def add(self, instance):
+        with self._lock:
+            self._pending[instance.session_key] = instance
+            size = len(self._pending)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='session-write-behind', daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+        if size >= settings.SESSION_WRITE_BEHIND_BATCH:
+            self._wakeup.set()
+
+    def discard(self, session_key):
+        """Drop unsaved changes, waiting out a flush in progress so it cannot write them afterwards."""
+        with self._flush_lock, self._lock:
+            self._pending.pop(session_key, None)
+
+    def flush(self):
+        """Write every pending session; returns the number written."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+            try:
+                # An UPDATE only, so a session deleted since it was queued is not written back
+                self.model.objects.bulk_update(
+                    batch.values(), ['session_data', 'expire_date'], batch_size=settings.SESSION_WRITE_BEHIND_BATCH
+                )
+            except Exception:
+                with self._lock:
+                    for session_key, instance in batch.items():
+                        self._pending.setdefault(session_key, instance)
+                raise
+            self.flushes += 1
+            self.written += len(batch)
+            return len(batch)
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(settings.SESSION_WRITE_BEHIND_INTERVAL)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to write sessions to the database; will retry")
+            finally:
+                close_old_connections()
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def write_behind_queue():
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = WriteBehindQueue(SessionStore.get_model_class())
+        return _queue
+
+
+class SessionStore(cached_db.SessionStore):
+    def save(self, must_create=False):
+        if must_create or self.session_key is None:
+            # Written straight away, so the database can reject a duplicate key
+            return super().save(must_create)
+        if self._cache.get(TOMBSTONE_PREFIX + self.session_key):
+            raise UpdateError
+
+        data = self._get_session()
+        try:
+            self._cache.set(self.cache_key, data, self.get_expiry_age())
+        except Exception:
+            logger.exception("Error saving to cache (%s)", self._cache)
+            return super().save()
+        write_behind_queue().add(self.create_model_instance(data))
+
+    async def asave(self, must_create=False):
+        return await sync_to_async(self.save)(must_create)
+
+    def delete(self, session_key=None):
+        if session_key is None:
+            session_key = self.session_key
+        if session_key is not None:
+            write_behind_queue().discard(session_key)
+            self._cache.set(TOMBSTONE_PREFIX + session_key, True, settings.SESSION_COOKIE_AGE)
+        super().delete(session_key)
+
+    async def adelete(self, session_key=None):
+        return await sync_to_async(self.delete)(session_key)
+
+
+def purge_expired_sessions(batch_size=1000):
+    """Delete expired sessions a batch at a time, so no single DELETE holds long locks. Returns the number deleted."""
+    model = SessionStore.get_model_class()
+    deleted = 0
+    while True:
+        now = timezone.now()
+        keys = list(model.objects.filter(expire_date__lt=now).values_list('pk', flat=True)[:batch_size])
+        if not keys:
+            return deleted
+        deleted += model.objects.filter(pk__in=keys, expire_date__lt=now).delete()[0]
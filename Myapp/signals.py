@@ -0,0 +1,92 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from MyLogin.models import Profile, version_bump
+from .counters import application_created, application_deleted
+from .feed import invalidate_feed_version, invalidate_posting_cards, invalidate_tag_facets
+from .models import Application, Posting
+from .search import index_posting, remove_posting
+from .utils import invalidate_applied_postings
+
+
+@receiver(post_save, sender=Posting)
+def update_posting_search_index(sender, instance, raw=False, **kwargs):
+    """Keep the search index and cached card current whenever a posting is saved."""
+    if not raw:
+        index_posting(instance)
+        invalidate_posting_cards([instance.pk])
+        invalidate_tag_facets()
+
+
+@receiver(post_delete, sender=Posting)
+def remove_posting_search_index(sender, instance, **kwargs):
+    remove_posting(instance.pk)
+    invalidate_posting_cards([instance.pk])
+    invalidate_tag_facets()
+
+
+@receiver(m2m_changed, sender=Posting.tags.through)
+def update_posting_tags(sender, instance, action, reverse, pk_set, **kwargs):
+    """Tag names are part of the search document, the card and the facet counts."""
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if reverse:
+        postings = list(Posting.objects.filter(pk__in=pk_set or []))
+    else:
+        postings = [instance]
+    posting_ids = [posting.pk for posting in postings]
+    for posting in postings:
+        index_posting(posting)
+    Posting.objects.filter(pk__in=posting_ids).update(**version_bump())
+    invalidate_posting_cards(posting_ids)
+    invalidate_tag_facets()
+
+
+@receiver(pre_save, sender=Posting)
+def copy_posting_organization(sender, instance, raw=False, **kwargs):
+    """New postings start with their organization's verification and name."""
+    if instance._state.adding and not raw:
+        instance.copy_organization_fields()
+
+
+@receiver(post_save, sender=Profile)
+def sync_organization_postings(sender, instance, raw=False, **kwargs):
+    """
+    Verification and name are copied onto each of the organization's
+    postings. Runs for every role, so postings stop showing if an account
+    stops being a verified organization.
+    """
+    if raw:
+        return
+    if not Posting.objects.sync_organization_fields(instance):
+        return
+    # The organization name is part of each posting's search document
+    postings = list(Posting.objects.for_org(instance.user).prefetch_related('tags'))
+    for posting in postings:
+        index_posting(posting)
+    # ...and is shown on each posting's card
+    invalidate_posting_cards([posting.pk for posting in postings])
+    # Verification changes decide which postings count towards the facets
+    invalidate_tag_facets()
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def count_students(sender, instance, created=True, raw=False, **kwargs):
+    """The student dashboard shows how many student profiles there are."""
+    if created and not raw and instance.role == 'Student':
+        invalidate_feed_version()
+
+
+@receiver(post_save, sender=Application)
+def count_new_application(sender, instance, created, raw=False, **kwargs):
+    """Status changes go through Myapp.counters.change_application_status."""
+    if created and not raw:
+        application_created(instance)
+        invalidate_applied_postings(instance.student_id)
+
+
+@receiver(post_delete, sender=Application)
+def uncount_deleted_application(sender, instance, **kwargs):
+    application_deleted(instance)
+    invalidate_applied_postings(instance.student_id)
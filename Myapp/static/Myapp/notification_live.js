@@ -0,0 +1,79 @@
+// Live notification badge: server-sent events, falling back to long polling
+
+class NotificationLive {
+  constructor(script) {
+    this.streamUrl = script.dataset.streamUrl;
+    this.pollUrl = script.dataset.pollUrl;
+    this.bell = document.getElementById('notifBell');
+    this.lastId = null;
+
+    if (this.bell) {
+      this.connect();
+    }
+  }
+
+  connect() {
+    if (!window.EventSource) {
+      this.poll();
+      return;
+    }
+
+    const source = new EventSource(this.streamUrl);
+    source.addEventListener('notifications', (event) => this.update(JSON.parse(event.data)));
+    source.addEventListener('error', () => {
+      // EventSource retries dropped streams by itself; it only gives up when
+      // the server refuses to stream (e.g. running under WSGI)
+      if (source.readyState === EventSource.CLOSED) {
+        this.poll();
+      }
+    });
+  }
+
+  async poll() {
+    const url = this.lastId === null ? this.pollUrl : `${this.pollUrl}?after=${this.lastId}`;
+    let data;
+    try {
+      const response = await fetch(url, {
+        headers: { 'X-Requested-With': 'XMLHttpRequest' },
+        credentials: 'same-origin'
+      });
+      if (response.redirected || !response.ok) {
+        return; // logged out
+      }
+      data = await response.json();
+    } catch (error) {
+      setTimeout(() => this.poll(), 5000);
+      return;
+    }
+    this.update(data);
+    if (data.retry) {
+      // Short polling: the server answered without waiting (e.g. under WSGI)
+      setTimeout(() => this.poll(), data.retry * 1000);
+    } else {
+      this.poll();
+    }
+  }
+
+  update(data) {
+    if (typeof data.last_id === 'number') {
+      this.lastId = data.last_id;
+    }
+    this.setBadge(data.unread_count);
+  }
+
+  setBadge(count) {
+    let badge = this.bell.querySelector('.notif-badge');
+    if (!count) {
+      if (badge) badge.remove();
+      return;
+    }
+    if (!badge) {
+      badge = document.createElement('span');
+      badge.className = 'notif-badge';
+      this.bell.appendChild(badge);
+    }
+    badge.textContent = count;
+  }
+}
+
+new NotificationLive(document.currentScript);
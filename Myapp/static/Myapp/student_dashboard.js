@@ -2,12 +2,9 @@ class OpportunitySearch {
     constructor() {
         this.searchInput = document.querySelector('.search-box input');
         this.opportunityGrid = document.getElementById('opportunityGrid');
-        this.noResults = document.getElementById('noResults');
-        this.noOpportunitiesMessage = document.querySelector('.no-opportunities-message');
         this.resultsCount = document.getElementById('resultsCount');
         this.searchResultsInfo = document.getElementById('searchResultsInfo');
         
-        this.opportunities = [];
         this.searchTimeout = null;
         this.debounceDelay = 300; // milliseconds
         
@@ -15,34 +12,8 @@ class OpportunitySearch {
     }
     
     init() {
-        // Load existing opportunities from the page
-        this.loadOpportunitiesFromDOM();
         this.attachEventListeners();
-        this.updateResultsCount(this.opportunities.length);
-        
-        // Check if there are no opportunities at all (on page load)
-        if (this.opportunities.length === 0 && this.noOpportunitiesMessage) {
-            this.noOpportunitiesMessage.style.display = 'block';
-            this.opportunityGrid.style.display = 'none';
-        }
-    }
-    
-    loadOpportunitiesFromDOM() {
-        const opportunityCards = this.opportunityGrid.querySelectorAll('.opp-card');
-        
-        this.opportunities = Array.from(opportunityCards).map((card, index) => {
-            return {
-                id: index + 1,
-                element: card,
-                title: card.querySelector('.opp-header h3')?.textContent || '',
-                organization: card.querySelector('.opp-org')?.textContent || '',
-                description: card.querySelector('.opp-desc')?.textContent || '',
-                tags: Array.from(card.querySelectorAll('.opp-tags span')).map(span => span.textContent),
-                type: card.querySelector('.opp-type')?.textContent || '',
-                // Store original HTML for highlighting
-                originalHTML: card.innerHTML
-            };
-        });
+        this.refresh();
     }
     
     attachEventListeners() {
@@ -81,104 +52,9 @@ class OpportunitySearch {
     }
     
     performSearch(searchTerm) {
-    const trimmedTerm = searchTerm.trim().toLowerCase();
-    
-    if (!trimmedTerm) {
-        this.handleAllFilters(); 
-        return;
-    }
-        
-        const filteredOpportunities = this.opportunities.filter(opp => 
-            this.opportunityMatchesSearch(opp, trimmedTerm)
-        );
-        
-        this.displaySearchResults(filteredOpportunities, trimmedTerm);
-    }
-    
-    opportunityMatchesSearch(opportunity, searchTerm) {
-        const searchableFields = [
-            opportunity.title,
-            opportunity.organization,
-            opportunity.description,
-            opportunity.type,
-            ...opportunity.tags
-        ];
-        
-        return searchableFields.some(field => 
-            field.toLowerCase().includes(searchTerm)
-        );
-    }
-    
-    displaySearchResults(opportunities, searchTerm) {
-        // Hide all opportunities first
-        this.opportunities.forEach(opp => {
-            opp.element.style.display = 'none';
-        });
-        
-        // Show matching opportunities with highlighting
-        opportunities.forEach(opp => {
-            opp.element.style.display = 'block';
-            this.highlightSearchTerms(opp, searchTerm);
-        });
-        
-        // Update results count and show/hide no results message
-        this.updateResultsCount(opportunities.length);
-        
-        if (opportunities.length === 0) {
-            this.showNoResults();
-        } else {
-            this.hideNoResults();
-        }
-    }
-    
-    highlightSearchTerms(opportunity, searchTerm) {
-        if (!searchTerm) {
-            // Restore original HTML if no search term
-            opportunity.element.innerHTML = opportunity.originalHTML;
-            return;
-        }
-        
-        const elementsToHighlight = [
-            { element: opportunity.element.querySelector('.opp-header h3'), text: opportunity.title },
-            { element: opportunity.element.querySelector('.opp-org'), text: opportunity.organization },
-            { element: opportunity.element.querySelector('.opp-desc'), text: opportunity.description }
-        ];
-        
-        elementsToHighlight.forEach(({ element, text }) => {
-            if (element && text) {
-                const highlightedText = this.highlightText(text, searchTerm);
-                element.innerHTML = highlightedText;
-            }
-        });
-        
-        // Highlight tags
-        const tagElements = opportunity.element.querySelectorAll('.opp-tags span');
-        tagElements.forEach((tagElement, index) => {
-            const tagText = opportunity.tags[index];
-            if (tagText && tagText.toLowerCase().includes(searchTerm)) {
-                const highlightedTag = this.highlightText(tagText, searchTerm);
-                tagElement.innerHTML = highlightedTag;
-            }
-        });
-    }
-    
-    highlightText(text, searchTerm) {
-        const regex = new RegExp(`(${this.escapeRegex(searchTerm)})`, 'gi');
-        return text.replace(regex, '<span class="highlight">$1</span>');
-    }
-    
-    escapeRegex(string) {
-        return string.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
-    }
-    
-    showAllOpportunities() {
-        this.opportunities.forEach(opp => {
-            opp.element.style.display = 'block';
-            opp.element.innerHTML = opp.originalHTML; // Remove highlighting
-        });
-        
-        this.updateResultsCount(this.opportunities.length);
-        this.hideNoResults();
+        // Ranking, prefix matching and highlighting happen server-side;
+        // an empty term switches the grid back to the paginated feed
+        window.postingFeedInstance.setSearch(searchTerm.trim());
     }
     
     updateResultsCount(count){
@@ -191,87 +67,14 @@ class OpportunitySearch {
         }
     }
     
-    showNoResults(){
-        this.noResults.style.display = 'block';
-        this.opportunityGrid.style.display = 'none';
-        // Only hide no-opportunities message when there ARE opportunities but none match search
-        if (this.opportunities.length > 0 && this.noOpportunitiesMessage) {
-            this.noOpportunitiesMessage.style.display = 'none';
-        }
-    }
-    
-    hideNoResults(){
-        this.noResults.style.display = 'none';
-        this.opportunityGrid.style.display = 'grid';
-        // Only hide no-opportunities message when there ARE opportunities
-        if (this.opportunities.length > 0 && this.noOpportunitiesMessage) {
-            this.noOpportunitiesMessage.style.display = 'none';
-        }
-        // Keep no-opportunities message visible when there are truly no opportunities
-        if (this.opportunities.length === 0 && this.noOpportunitiesMessage) {
-            this.noOpportunitiesMessage.style.display = 'block';
-        }
-    }
-    
     clearSearch(){
         this.searchInput.value = '';
-        this.showAllOpportunities();
+        this.performSearch('');
     }
 
-handleAllFilters(){
-    const searchTerm = this.searchInput.value.trim();
-    const opportunities = document.querySelectorAll('.opp-card');
-    let visibleCount = 0;
-
-    opportunities.forEach(opp => {
-        let shouldShow = true;
-
-        if (searchTerm) {
-            const title = opp.querySelector('.opp-header h3')?.textContent.toLowerCase() || '';
-            const org = opp.querySelector('.opp-org')?.textContent.toLowerCase() || '';
-            const desc = opp.querySelector('.opp-desc')?.textContent.toLowerCase() || '';
-            const tags = Array.from(opp.querySelectorAll('.opp-tags span')).map(span => span.textContent.toLowerCase());
-            
-            const matchesSearch = title.includes(searchTerm) || 
-                                org.includes(searchTerm) || 
-                                desc.includes(searchTerm) || 
-                                tags.some(tag => tag.includes(searchTerm));
-            
-            if (!matchesSearch) {
-                shouldShow = false;
-            }
-        }
-
-        const selectedTypes = Array.from(document.querySelectorAll('.type-checkbox input[name="opportunityType"]:checked, .type-checkbox-inline input[name="opportunityType"]:checked'))
-            .map(cb => cb.value);
-        const oppType = opp.getAttribute('data-type');
-        
-        if (selectedTypes.length > 0 && !selectedTypes.includes(oppType)) {
-            shouldShow = false;
-        }
-
-        opp.style.display = shouldShow ? 'block' : 'none';
-        if (shouldShow) visibleCount++;
-    });
-
-    this.updateResultsCount(visibleCount);
-    
-    if (visibleCount === 0) {
-        this.showNoResults();
-    } else {
-        this.hideNoResults();
-    }
-    
-    // NEW: Refresh sorting after filtering to maintain sort order
-    if (window.opportunitySorterInstance) {
-        window.opportunitySorterInstance.refreshSort();
-    }
-    
-    // Only hide no-opportunities message when filtering (there ARE opportunities)
-    const noOpportunitiesMessage = document.querySelector('.no-opportunities-message');
-    if (opportunities.length > 0 && noOpportunitiesMessage) {
-        noOpportunitiesMessage.style.display = 'none';
-    }
+    refresh() {
+        // Called after the feed replaced or appended a page of cards
+        this.updateResultsCount(this.opportunityGrid.querySelectorAll('.opp-card').length);
     }
 }
 
@@ -352,76 +155,20 @@ class DeadlineFilter {
     // Filter opportunities
     this.filterOpportunitiesByDateRange(startDate, endDate);
     this.showFilterActiveState(filterType);
-    
-    // Handle search + filter combination
-    this.handleSearchAndFilterCombination();
-
   }
 
 filterOpportunitiesByDateRange(startDate, endDate) {
-    const opportunities = document.querySelectorAll('.opp-card');
-    let visibleCount = 0;
-
-    opportunities.forEach(opp => {
-        const deadlineStr = opp.getAttribute('data-deadline');
-        if (!deadlineStr) {
-            opp.style.display = 'none';
-            return;
-        }
-
-        const deadline = new Date(deadlineStr);
-        
-        // Check if deadline is within range
-        if (deadline >= startDate && deadline <= endDate) {
-            opp.style.display = 'block';
-            visibleCount++;
-        } else {
-            opp.style.display = 'none';
-        }
+    // Deadline filtering happens server-side; reload the feed for the window
+    window.postingFeedInstance.setFilters({
+        deadline_from: this.formatDate(startDate),
+        deadline_to: this.formatDate(endDate)
     });
-
-    // Update results count and show/hide no results
-    this.updateFilterResults(visibleCount);
-    
-    // Only hide no-opportunities message when filtering (there ARE opportunities)
-    const noOpportunitiesMessage = document.querySelector('.no-opportunities-message');
-    if (opportunities.length > 0 && noOpportunitiesMessage) {
-        noOpportunitiesMessage.style.display = 'none';
-    }
 }
 
-updateFilterResults(visibleCount) {
-    const resultsCount = document.getElementById('resultsCount');
-    const noResults = document.getElementById('noResults');
-    const opportunityGrid = document.getElementById('opportunityGrid');
-    const noOpportunitiesMessage = document.querySelector('.no-opportunities-message');
-    const allOpportunities = document.querySelectorAll('.opp-card');
-
-    resultsCount.textContent = visibleCount;
-
-    if (visibleCount === 0) {
-        noResults.style.display = 'block';
-        opportunityGrid.style.display = 'none';
-        // Only hide no-opportunities message when there ARE opportunities but none match filter
-        if (allOpportunities.length > 0 && noOpportunitiesMessage) {
-            noOpportunitiesMessage.style.display = 'none';
-        }
-    } else {
-        noResults.style.display = 'none';
-        opportunityGrid.style.display = 'grid';
-        // Only hide no-opportunities message when there ARE opportunities
-        if (allOpportunities.length > 0 && noOpportunitiesMessage) {
-            noOpportunitiesMessage.style.display = 'none';
-        }
-        // Keep no-opportunities message visible when there are truly no opportunities
-        if (allOpportunities.length === 0 && noOpportunitiesMessage) {
-            noOpportunitiesMessage.style.display = 'block';
-        }
-    }
-
-    // Show results info
-    const searchResultsInfo = document.getElementById('searchResultsInfo');
-    searchResultsInfo.style.display = 'block';
+formatDate(date) {
+    const month = String(date.getMonth() + 1).padStart(2, '0');
+    const day = String(date.getDate()).padStart(2, '0');
+    return `${date.getFullYear()}-${month}-${day}`;
 }
     
     applyCustomDateFilter() {
@@ -445,8 +192,6 @@ updateFilterResults(visibleCount) {
     
     this.filterOpportunitiesByDateRange(startDate, endDate);
     this.showFilterActiveState('custom');
-    
-    this.handleSearchAndFilterCombination();
 }
     
     showFilterActiveState(filterType) {
@@ -461,37 +206,7 @@ updateFilterResults(visibleCount) {
     this.startDate.value = '';
     this.endDate.value = '';
     
-    const searchInput = document.querySelector('.search-box input');
-    const searchTerm = searchInput.value.trim();
-    
-    if (searchTerm) {
-        const searchEvent = new Event('input', { bubbles: true });
-        searchInput.dispatchEvent(searchEvent);
-    } else {
-        const opportunities = document.querySelectorAll('.opp-card');
-        opportunities.forEach(opp => {
-            opp.style.display = 'block';
-        });
-        
-        const resultsCount = document.getElementById('resultsCount');
-        const searchResultsInfo = document.getElementById('searchResultsInfo');
-        resultsCount.textContent = opportunities.length;
-        searchResultsInfo.style.display = 'none';
-        
-        const noResults = document.getElementById('noResults');
-        const opportunityGrid = document.getElementById('opportunityGrid');
-        const noOpportunitiesMessage = document.querySelector('.no-opportunities-message');
-        noResults.style.display = 'none';
-        opportunityGrid.style.display = 'grid';
-        // Only hide no-opportunities message when there ARE opportunities
-        if (opportunities.length > 0 && noOpportunitiesMessage) {
-            noOpportunitiesMessage.style.display = 'none';
-        }
-        // Keep no-opportunities message visible when there are truly no opportunities
-        if (opportunities.length === 0 && noOpportunitiesMessage) {
-            noOpportunitiesMessage.style.display = 'block';
-        }
-    }
+    window.postingFeedInstance.setFilters({ deadline_from: null, deadline_to: null });
     
     console.log('Deadline filter cleared');
 }
@@ -502,16 +217,6 @@ updateFilterResults(visibleCount) {
         this.endDate.min = today;
     }
 
-handleSearchAndFilterCombination() {
-    const searchInput = document.querySelector('.search-box input');
-    const searchTerm = searchInput.value.trim();
-    
-    if (searchTerm) {
-        const searchEvent = new Event('input', { bubbles: true });
-        searchInput.dispatchEvent(searchEvent);
-    }
-  }
-
   validateDateRange() {
     const start = this.startDate.value;
     const end = this.endDate.value;
@@ -537,29 +242,13 @@ class TypeFilter {
         this.inlineTypeCheckboxes = document.querySelectorAll('.type-checkbox-inline input[name="opportunityType"]');
         this.allTypeCheckboxes = [...this.typeCheckboxes, ...this.inlineTypeCheckboxes];
         
-        this.typeCounts = {
-            assistantship: document.getElementById('count-assistantship'),
-            volunteer: document.getElementById('count-volunteer'),
-            sports: document.getElementById('count-sports'),
-            leadership: document.getElementById('count-leadership'),
-            other: document.getElementById('count-other')
-        };
-        
-        // Remove any null entries
-        Object.keys(this.typeCounts).forEach(key => {
-            if (!this.typeCounts[key]) {
-                delete this.typeCounts[key];
-            }
-        });
         this.filterCount = document.getElementById('typeFilterCount'); // May be null if element doesn't exist
-        this.opportunities = document.querySelectorAll('.opp-card');
         
         this.init();
     }
     
     init() {
         this.attachEventListeners();
-        this.updateTypeCounts();
         this.updateFilterCountText();
     }
     
@@ -584,18 +273,9 @@ class TypeFilter {
     }
     
     handleTypeFilterChange() {
-        const selectedTypes = this.getSelectedTypes();
-        
-        if (selectedTypes.length === 0) {
-            // If no types selected, show all
-            this.showAllOpportunities();
-        } else {
-            // Filter opportunities based on selected types
-            this.filterOpportunitiesByType(selectedTypes);
-        }
-        
+        // Type filtering happens server-side; an empty list shows every type
+        window.postingFeedInstance.setFilters({ type: this.getSelectedTypes() });
         this.updateFilterCountText();
-        this.handleSearchAndFilterCombination();
     }
     
     getSelectedTypes() {
@@ -608,112 +288,6 @@ class TypeFilter {
         return selectedTypes;
     }
     
-    filterOpportunitiesByType(selectedTypes) {
-        let visibleCount = 0;
-        
-        this.opportunities.forEach(opp => {
-            const oppType = opp.getAttribute('data-type');
-            
-            if (selectedTypes.includes(oppType)) {
-                opp.style.display = 'block';
-                visibleCount++;
-            } else {
-                opp.style.display = 'none';
-            }
-        });
-        
-        this.updateResultsDisplay(visibleCount);
-        
-        // Only hide no-opportunities message when filtering (there ARE opportunities)
-        const noOpportunitiesMessage = document.querySelector('.no-opportunities-message');
-        if (this.opportunities.length > 0 && noOpportunitiesMessage) {
-            noOpportunitiesMessage.style.display = 'none';
-        }
-    }
-    
-    showAllOpportunities() {
-        this.opportunities.forEach(opp => {
-            opp.style.display = 'block';
-        });
-        
-        const resultsCount = document.getElementById('resultsCount');
-        const searchResultsInfo = document.getElementById('searchResultsInfo');
-        resultsCount.textContent = this.opportunities.length;
-        searchResultsInfo.style.display = 'none';
-        
-        const noResults = document.getElementById('noResults');
-        const opportunityGrid = document.getElementById('opportunityGrid');
-        const noOpportunitiesMessage = document.querySelector('.no-opportunities-message');
-        noResults.style.display = 'none';
-        opportunityGrid.style.display = 'grid';
-        // Only hide no-opportunities message when there ARE opportunities
-        if (this.opportunities.length > 0 && noOpportunitiesMessage) {
-            noOpportunitiesMessage.style.display = 'none';
-        }
-        // Keep no-opportunities message visible when there are truly no opportunities
-        if (this.opportunities.length === 0 && noOpportunitiesMessage) {
-            noOpportunitiesMessage.style.display = 'block';
-        }
-    }
-    
-    updateResultsDisplay(visibleCount) {
-    const resultsCount = document.getElementById('resultsCount');
-    const noResults = document.getElementById('noResults');
-    const opportunityGrid = document.getElementById('opportunityGrid');
-    const searchResultsInfo = document.getElementById('searchResultsInfo');
-    const noOpportunitiesMessage = document.querySelector('.no-opportunities-message');
-
-    resultsCount.textContent = visibleCount;
-
-    if (visibleCount === 0) {
-        noResults.style.display = 'block';
-        opportunityGrid.style.display = 'none';
-        // Only hide no-opportunities message when there ARE opportunities but none match filter
-        if (this.opportunities.length > 0 && noOpportunitiesMessage) {
-            noOpportunitiesMessage.style.display = 'none';
-        }
-    } else {
-        noResults.style.display = 'none';
-        opportunityGrid.style.display = 'grid';
-        // Only hide no-opportunities message when there ARE opportunities
-        if (this.opportunities.length > 0 && noOpportunitiesMessage) {
-            noOpportunitiesMessage.style.display = 'none';
-        }
-        // Keep no-opportunities message visible when there are truly no opportunities
-        if (this.opportunities.length === 0 && noOpportunitiesMessage) {
-            noOpportunitiesMessage.style.display = 'block';
-        }
-    }
-
-    searchResultsInfo.style.display = 'block';
-}
-    
-    updateTypeCounts() {
-        // Reset counts
-        const counts = {
-            assistantship: 0,
-            volunteer: 0,
-            sports: 0,
-            leadership: 0,
-            other: 0
-        };
-        
-        // Count opportunities for each type
-        this.opportunities.forEach(opp => {
-            const type = opp.getAttribute('data-type');
-            if (counts.hasOwnProperty(type)) {
-                counts[type]++;
-            }
-        });
-    
-        // Update the display for each type count
-        Object.keys(counts).forEach(type => {
-            if (this.typeCounts[type]) {
-                this.typeCounts[type].textContent = counts[type];
-            }
-        });
-    }
-    
     updateFilterCountText() {
         // Skip if filterCount element doesn't exist
         if (!this.filterCount) return;
@@ -727,28 +301,42 @@ class TypeFilter {
         }
     }
     
-    handleSearchAndFilterCombination() {
-        const searchInput = document.querySelector('.search-box input');
-        const searchTerm = searchInput.value.trim();
-        
-        if (searchTerm) {
-            const searchEvent = new Event('input', { bubbles: true });
-            searchInput.dispatchEvent(searchEvent);
-        }
-    }
-
     resetTypeFilter() {
         this.allTypeCheckboxes.forEach(checkbox => {
             checkbox.checked = false;
         });
         this.updateFilterCountText();
-        this.showAllOpportunities();
+        window.postingFeedInstance.setFilters({ type: [] });
+    }
+}
+
+// ===== TAG CHIP FILTER =====
+class TagFilter {
+    constructor() {
+        this.chips = document.querySelectorAll('#tagFilter .tag-chip');
+        this.selectedTags = new Set();
         
-        // Only hide no-opportunities message when filtering (there ARE opportunities)
-        const noOpportunitiesMessage = document.querySelector('.no-opportunities-message');
-        if (this.opportunities.length > 0 && noOpportunitiesMessage) {
-            noOpportunitiesMessage.style.display = 'none';
+        this.init();
+    }
+    
+    init() {
+        this.chips.forEach(chip => {
+            chip.addEventListener('click', () => this.toggleTag(chip));
+        });
+    }
+    
+    toggleTag(chip) {
+        const tag = chip.dataset.tag;
+        if (this.selectedTags.has(tag)) {
+            this.selectedTags.delete(tag);
+            chip.classList.remove('active');
+        } else {
+            this.selectedTags.add(tag);
+            chip.classList.add('active');
         }
+        
+        // Postings must carry every selected tag (filtered server-side)
+        window.postingFeedInstance.setFilters({ tag: Array.from(this.selectedTags) });
     }
 }
 
@@ -756,16 +344,13 @@ class TypeFilter {
 class OpportunitySorter {
     constructor() {
         this.currentSort = 'recent';
-        this.sortDirection = 'desc';
         this.sortDropdown = document.getElementById('sortDropdown');
-        this.opportunityGrid = document.getElementById('opportunityGrid');
         
         this.init();
     }
     
     init() {
         this.attachEventListeners();
-        this.applySort('recent', 'desc'); // Default sort
     }
     
     attachEventListeners() {
@@ -777,83 +362,24 @@ class OpportunitySorter {
     handleSortChange(sortType) {
         this.currentSort = sortType;
         
-        // Set default direction based on sort type
-        switch(sortType) {
-            case 'recent':
-                this.sortDirection = 'desc'; // Newest first
-                break;
-            case 'deadline':
-                this.sortDirection = 'asc'; // Soonest first
-                break;
-            case 'organization':
-            case 'title':
-                this.sortDirection = 'asc'; // A-Z
-                break;
-        }
-        
-        this.applySort(sortType, this.sortDirection);
+        // Sorting happens server-side, so "load more" continues in the same order
+        window.postingFeedInstance.setFilters({ sort: sortType === 'recent' ? null : sortType });
         this.updateSortIndicator();
     }
     
-    applySort(sortType, direction) {
-        const opportunities = Array.from(this.opportunityGrid.querySelectorAll('.opp-card'));
-        const sortedOpportunities = this.sortOpportunities(opportunities, sortType, direction);
-        
-        // Clear and re-append sorted opportunities
-        this.opportunityGrid.innerHTML = '';
-        sortedOpportunities.forEach(opp => {
-            this.opportunityGrid.appendChild(opp);
-        });
-    }
-    
-    sortOpportunities(opportunities, sortType, direction) {
-        return opportunities.sort((a, b) => {
-            let aValue, bValue;
-            
-            switch(sortType) {
-                case 'recent':
-                    aValue = new Date(a.getAttribute('data-posted'));
-                    bValue = new Date(b.getAttribute('data-posted'));
-                    break;
-                case 'deadline':
-                    aValue = new Date(a.getAttribute('data-deadline'));
-                    bValue = new Date(b.getAttribute('data-deadline'));
-                    break;
-                case 'organization':
-                    aValue = a.querySelector('.opp-org').textContent.toLowerCase();
-                    bValue = b.querySelector('.opp-org').textContent.toLowerCase();
-                    break;
-                case 'title':
-                    aValue = a.querySelector('.opp-header h3').textContent.toLowerCase();
-                    bValue = b.querySelector('.opp-header h3').textContent.toLowerCase();
-                    break;
-                default:
-                    return 0;
-            }
-            
-            let comparison = 0;
-            if (sortType === 'recent' || sortType === 'deadline') {
-                comparison = aValue - bValue;
-            } else {
-                if (aValue < bValue) comparison = -1;
-                if (aValue > bValue) comparison = 1;
-            }
-            
-            return direction === 'desc' ? -comparison : comparison;
-        });
+    sortDirection() {
+        // Newest first; everything else soonest / A-Z first
+        return this.currentSort === 'recent' ? 'desc' : 'asc';
     }
     
     updateSortIndicator() {
         // Add indicator to selected option
+        Array.from(this.sortDropdown.options).forEach(option => {
+            option.textContent = option.textContent.replace(/ ↑| ↓/g, '');
+        });
         const selectedOption = this.sortDropdown.options[this.sortDropdown.selectedIndex];
-        selectedOption.textContent = selectedOption.textContent.replace(/ ↑| ↓/g, '');
-        selectedOption.textContent += this.sortDirection === 'asc' ? ' ↑' : ' ↓';
-    }
-    
-    refreshSort() {
-        this.applySort(this.currentSort, this.sortDirection);
+        selectedOption.textContent += this.sortDirection() === 'asc' ? ' ↑' : ' ↓';
     }
-    
 }
 
 
@@ -1098,10 +624,6 @@ class OrganizationFilter {
             const searchEvent = new Event('input', { bubbles: true });
             searchInput.dispatchEvent(searchEvent);
         }
-        
-        if (window.opportunitySorterInstance) {
-            window.opportunitySorterInstance.refreshSort();
-        }
     }
     
     clearOrganizationFilter() {
@@ -1124,10 +646,125 @@ class OrganizationFilter {
     }
 }
 
+// ===== SERVER-SIDE FEED PAGINATION =====
+class PostingFeed {
+    constructor() {
+        this.opportunityGrid = document.getElementById('opportunityGrid');
+        this.noResults = document.getElementById('noResults');
+        this.loadMoreBtn = document.getElementById('loadMoreBtn');
+        this.feedUrl = this.opportunityGrid.dataset.feedUrl;
+        this.searchUrl = this.opportunityGrid.dataset.searchUrl;
+        this.nextCursor = this.opportunityGrid.dataset.nextCursor || '';
+        this.filters = {};
+        this.query = '';
+        this.requestId = 0;
+        
+        this.init();
+    }
+    
+    init() {
+        if (this.loadMoreBtn) {
+            this.loadMoreBtn.addEventListener('click', () => this.loadMore());
+        }
+    }
+    
+    setFilters(filters) {
+        Object.entries(filters).forEach(([name, value]) => {
+            if (value === null || value === '' || (Array.isArray(value) && value.length === 0)) {
+                delete this.filters[name];
+            } else {
+                this.filters[name] = value;
+            }
+        });
+        return this.reload();
+    }
+    
+    setSearch(query) {
+        if (query === this.query) return Promise.resolve();
+        this.query = query;
+        return this.reload();
+    }
+    
+    buildUrl(cursor) {
+        const params = new URLSearchParams();
+        Object.entries(this.filters).forEach(([name, value]) => {
+            [].concat(value).forEach(item => params.append(name, item));
+        });
+        if (this.query) {
+            // Search results are ranked and returned in a single page
+            params.set('q', this.query);
+            return `${this.searchUrl}?${params.toString()}`;
+        }
+        if (cursor) {
+            params.set('cursor', cursor);
+        }
+        return `${this.feedUrl}?${params.toString()}`;
+    }
+    
+    async fetchPage(cursor) {
+        const response = await fetch(this.buildUrl(cursor), {
+            headers: { 'X-Requested-With': 'XMLHttpRequest' }
+        });
+        if (!response.ok) {
+            throw new Error(`Feed request failed with status ${response.status}`);
+        }
+        return response.json();
+    }
+    
+    async reload() {
+        // Ignore responses from requests superseded by a newer filter change
+        const requestId = ++this.requestId;
+        try {
+            const data = await this.fetchPage('');
+            if (requestId !== this.requestId) return;
+            this.opportunityGrid.innerHTML = data.html;
+            this.nextCursor = data.next_cursor || '';
+            this.afterRender();
+        } catch (error) {
+            console.error(error);
+            showErrorMessage('Unable to load opportunities', 'Please try again in a moment.');
+        }
+    }
+    
+    async loadMore() {
+        if (!this.nextCursor) return;
+        
+        const requestId = this.requestId;
+        this.loadMoreBtn.disabled = true;
+        try {
+            const data = await this.fetchPage(this.nextCursor);
+            if (requestId !== this.requestId) return;
+            this.opportunityGrid.insertAdjacentHTML('beforeend', data.html);
+            this.nextCursor = data.next_cursor || '';
+            this.afterRender();
+        } catch (error) {
+            console.error(error);
+            showErrorMessage('Unable to load opportunities', 'Please try again in a moment.');
+        } finally {
+            this.loadMoreBtn.disabled = false;
+        }
+    }
+    
+    afterRender() {
+        const hasCards = this.opportunityGrid.querySelector('.opp-card') !== null;
+        this.noResults.style.display = hasCards ? 'none' : 'block';
+        this.opportunityGrid.style.display = hasCards ? 'grid' : 'none';
+        if (this.loadMoreBtn) {
+            this.loadMoreBtn.style.display = this.nextCursor ? 'inline-block' : 'none';
+        }
+        
+        if (window.opportunitySearchInstance) {
+            window.opportunitySearchInstance.refresh();
+        }
+    }
+}
+
 document.addEventListener('DOMContentLoaded', () => {
+    window.postingFeedInstance = new PostingFeed();
     window.opportunitySearchInstance = new OpportunitySearch();
     window.deadlineFilterInstance = new DeadlineFilter(); 
     window.typeFilterInstance = new TypeFilter();
+    window.tagFilterInstance = new TagFilter();
     window.opportunitySorterInstance = new OpportunitySorter();
     
     // Only initialize organization filter if the HTML elements exist
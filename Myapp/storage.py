@@ -0,0 +1,109 @@
+import mimetypes
+from urllib.parse import quote
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.base import File
+from django.core.files.storage import Storage
+from django.utils.deconstruct import deconstructible
+from django.utils.functional import cached_property
+
+# Part size for multipart uploads (S3 needs at least 5 MB per part)
+UPLOAD_PART_SIZE = 8 * 1024 * 1024
+# Lifetime of presigned download URLs for private buckets
+PRESIGNED_URL_EXPIRY = 60 * 60  # seconds
+
+
+@deconstructible
+class S3CompatibleStorage(Storage):
+    """
+    Files in an S3-compatible bucket: AWS S3, Supabase Storage (through its
+    S3 endpoint) or a local MinIO. Files are uploaded in parts as they are
+    read, so an upload is never held in memory whole.
+    """
+
+    def __init__(self, bucket, endpoint_url=None, region=None, access_key=None, secret_key=None, public_url=''):
+        if not bucket:
+            raise ImproperlyConfigured("S3CompatibleStorage needs a bucket (S3_BUCKET).")
+        self.bucket = bucket
+        self.endpoint_url = endpoint_url
+        self.region = region
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.public_url = public_url
+
+    @cached_property
+    def client(self):
+        try:
+            import boto3
+        except ImportError as exc:
+            raise ImproperlyConfigured("FILE_STORAGE=s3 needs boto3 (pip install boto3).") from exc
+        return boto3.client(
+            's3',
+            endpoint_url=self.endpoint_url,
+            region_name=self.region,
+            aws_access_key_id=self.access_key,
+            aws_secret_access_key=self.secret_key,
+        )
+
+    @cached_property
+    def transfer_config(self):
+        from boto3.s3.transfer import TransferConfig
+        return TransferConfig(
+            multipart_threshold=UPLOAD_PART_SIZE,
+            multipart_chunksize=UPLOAD_PART_SIZE,
+            use_threads=False,
+        )
+
+    def _save(self, name, content):
+        content.seek(0)
+        content_type = (
+            getattr(content, 'content_type', None)
+            or mimetypes.guess_type(name)[0]
+            or 'application/octet-stream'
+        )
+        self.client.upload_fileobj(
+            content, self.bucket, name,
+            ExtraArgs={'ContentType': content_type},
+            Config=self.transfer_config,
+        )
+        return name
+
+    def _open(self, name, mode='rb'):
+        if 'w' in mode or 'a' in mode:
+            raise ValueError("S3CompatibleStorage files can only be opened for reading.")
+        body = self.client.get_object(Bucket=self.bucket, Key=name)['Body']
+        return File(body, name)
+
+    def _head(self, name):
+        from botocore.exceptions import ClientError
+        try:
+            return self.client.head_object(Bucket=self.bucket, Key=name)
+        except ClientError as exc:
+            if exc.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return None
+            raise
+
+    def exists(self, name):
+        return self._head(name) is not None
+
+    def delete(self, name):
+        self.client.delete_object(Bucket=self.bucket, Key=name)
+
+    def size(self, name):
+        head = self._head(name)
+        if head is None:
+            raise FileNotFoundError(name)
+        return head['ContentLength']
+
+    def get_modified_time(self, name):
+        head = self._head(name)
+        if head is None:
+            raise FileNotFoundError(name)
+        return head['LastModified']
+
+    def url(self, name):
+        if self.public_url:
+            return f"{self.public_url.rstrip('/')}/{quote(name)}"
+        return self.client.generate_presigned_url(
+            'get_object', Params={'Bucket': self.bucket, 'Key': name}, ExpiresIn=PRESIGNED_URL_EXPIRY
+        )
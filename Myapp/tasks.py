@@ -0,0 +1,15 @@
+from .jobs import task
+from .uploads import finalize_resume
+
+
+@task
+def store_resume(application_id):
+    finalize_resume(application_id)
+
+
+def finalize_resume_later(application_id):
+    """
+    Queue the move of an application's staged resume to the file storage;
+    `manage.py finalize_uploads` picks up any whose job failed for good.
+    """
+    return store_resume.enqueue(application_id=application_id)
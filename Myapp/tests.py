@@ -1,3 +1,162 @@
-from django.test import TestCase
+import shutil
+import tempfile
+import threading
+from datetime import date, timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from MyLogin.models import Notification, Profile
+from .applications import submit_application
+from .feed import FEED_PAGE_SIZE, visible_postings
+from .models import Application, Posting, PostingTag
+
+# Plan fragments that show an index being used, per database vendor
+INDEX_MARKERS = {
+    'postgresql': ('Index Scan', 'Index Only Scan', 'Bitmap Index Scan'),
+    'sqlite': ('USING INDEX', 'USING COVERING INDEX', 'USING PRIMARY KEY', 'USING INTEGER PRIMARY KEY'),
+}
+
+
+def create_organization(username='org@example.com', org_name='Org One'):
+    organization = User.objects.create_user(username, username, 'pw')
+    Profile.objects.create(user=organization, role='Organization', org_name=org_name, verification_status='verified')
+    return organization
+
+
+def create_student(username='student@example.com'):
+    student = User.objects.create_user(username, username, 'pw', first_name='Stu')
+    Profile.objects.create(user=student, role='Student')
+    return student
+
+
+def create_postings(organization, count, **fields):
+    return [
+        Posting.objects.create(
+            organization=organization, title=f'Posting {i}', description=f'Description {i}',
+            deadline=date.today() + timedelta(days=i + 1), approval_status='approved', **fields
+        )
+        for i in range(count)
+    ]
+
+
+def hot_queries():
+    """The query shapes run on (nearly) every page, keyed by a short label."""
+    user_id = 1
+    today = timezone.now().date()
+    return {
+        'unread notification count': Notification.objects.filter(
+            recipient_id=user_id, read=False, is_archived=False
+        ),
+        'recent notifications': Notification.objects.filter(recipient_id=user_id).order_by('-timestamp')[:5],
+        'student feed page': visible_postings()[:FEED_PAGE_SIZE + 1],
+        'student feed by deadline': visible_postings().order_by('deadline', 'id')[:FEED_PAGE_SIZE + 1],
+        'student feed by title': visible_postings().order_by('title', 'id')[:FEED_PAGE_SIZE + 1],
+        'student feed by organization': visible_postings().order_by('org_display_name', 'id')[:FEED_PAGE_SIZE + 1],
+        'active opportunities': visible_postings().open(today),
+        'pending verifications': Profile.objects.filter(role='Organization', verification_status='pending'),
+        'organization postings': Posting.objects.for_org(user_id).order_by('-created_at'),
+        'applicants by status': Application.objects.filter(posting_id=1, status='submitted'),
+        'postings by tag': PostingTag.objects.filter(tag_id=1),
+        'login by email or username': User.objects.select_related('profile').alias(email_lower=Lower('email')).filter(
+            Q(username='student@example.com') | Q(email_lower='student@example.com')
+        ),
+    }
+
+
+class QueryPlanTests(TestCase):
+    """The hot dashboard queries must be able to use an index."""
+
+    def test_hot_queries_use_an_index(self):
+        markers = INDEX_MARKERS.get(connection.vendor)
+        if markers is None:
+            self.skipTest(f"No query plan markers for {connection.vendor}")
+        if connection.vendor == 'postgresql':
+            # Small tables make sequential scans cheaper; ask the planner
+            # whether the indexes are usable at all
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+
+        for label, queryset in hot_queries().items():
+            with self.subTest(label):
+                plan = queryset.explain()
+                self.assertTrue(any(marker in plan for marker in markers), f"{label} skips its index:\n{plan}")
+
+
+class DuplicateSubmitTests(TransactionTestCase):
+    """
+    Parallel submits of one application store it exactly once. SQLite
+    serialises the writers; PostgreSQL gives a real race.
+    """
+
+    SUBMITS = 10
+
+    def setUp(self):
+        if connection.vendor == 'sqlite' and connection.is_in_memory_db():
+            self.skipTest("Threads cannot share an in-memory SQLite database")
+        cache.clear()
+        self.storage_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.storage_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=self.storage_root, UPLOAD_STAGING_ROOT=self.storage_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        # Staged uploads go to a storage built once per process
+        staging_patch = mock.patch('Myapp.uploads._staging_storage', None)
+        staging_patch.start()
+        self.addCleanup(staging_patch.stop)
+
+        self.posting = create_postings(create_organization(), 1)[0]
+        self.student = create_student()
+
+    def submit_in_parallel(self):
+        barrier = threading.Barrier(self.SUBMITS)
+        results = [None] * self.SUBMITS
+
+        def submit(index):
+            try:
+                barrier.wait()
+                _, results[index] = submit_application(
+                    self.student, self.posting, ContentFile(b'%PDF-1.4\n', name='resume.pdf'),
+                    idempotency_key=f'submit-{index}'
+                )
+            except Exception as exc:
+                results[index] = exc
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=submit, args=(index,)) for index in range(self.SUBMITS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_one_application_is_stored(self):
+        results = self.submit_in_parallel()
+
+        self.assertEqual([outcome for outcome in results if isinstance(outcome, Exception)], [])
+        self.assertEqual(results.count(True), 1)
+        self.assertEqual(Application.objects.filter(student=self.student, posting=self.posting).count(), 1)
+        self.posting.refresh_from_db(fields=['applicant_count'])
+        self.assertEqual(self.posting.applicant_count, 1)
+
+
+class StatusHistogramTests(TestCase):
+    def test_counts_every_status_in_one_query(self):
+        organization = create_organization()
+        statuses = ['submitted', 'submitted', 'under_review', 'accepted', 'rejected']
+        for index, (posting, status) in enumerate(zip(create_postings(organization, len(statuses)), statuses)):
+            Application.objects.create(student=create_student(f'student-{index}@example.com'), posting=posting, status=status)
+
+        with self.assertNumQueries(1):
+            histogram = Application.objects.status_histogram()
+        self.assertEqual(histogram, {
+            'total': 5, 'submitted': 2, 'under_review': 1, 'accepted': 1, 'rejected': 1, 'withdrawn': 0,
+        })
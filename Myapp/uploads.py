@@ -0,0 +1,78 @@
+import posixpath
+import time
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.utils import timezone
+
+from .models import Application
+
+_staging_storage = None
+
+
+def staging_storage():
+    """Local disk where uploads wait for a job to move them to the default storage."""
+    global _staging_storage
+    if _staging_storage is None:
+        _staging_storage = FileSystemStorage(location=settings.UPLOAD_STAGING_ROOT)
+    return _staging_storage
+
+
+def stage_upload(uploaded_file, upload_to):
+    """
+    Store an upload on local disk and return its staged name. Django has
+    already spooled large uploads to a temporary file, which is moved
+    rather than copied, so this is cheap whatever the final storage is.
+    """
+    return staging_storage().save(posixpath.join(upload_to, posixpath.basename(uploaded_file.name)), uploaded_file)
+
+
+def discard_staged(name):
+    if name:
+        staging_storage().delete(name)
+
+
+def finalize_resume(application_id):
+    """
+    Move an application's staged resume to the default storage (streamed
+    in chunks by the storage backend). Returns True if it was moved.
+    """
+    application = Application.objects.filter(pk=application_id).exclude(resume_upload='').first()
+    if application is None:
+        return False
+
+    staged = application.resume_upload
+    with staging_storage().open(staged) as staged_file:
+        application.resume.save(posixpath.basename(staged), staged_file, save=False)
+
+    # updated_at changes the application's ETag, so pages stop showing it as pending
+    stored = Application.objects.filter(pk=application_id, resume_upload=staged).update(
+        resume=application.resume.name, resume_upload='', updated_at=timezone.now()
+    )
+    if stored:
+        discard_staged(staged)
+    else:
+        # Deleted (or finalized by someone else) while the file was copied
+        application.resume.delete(save=False)
+    return bool(stored)
+
+
+def stale_staged_files(max_age):
+    """Staged files older than max_age seconds that no application refers to."""
+    storage = staging_storage()
+    referenced = set(Application.objects.exclude(resume_upload='').values_list('resume_upload', flat=True))
+    cutoff = time.time() - max_age
+
+    def walk(directory):
+        directories, files = storage.listdir(directory)
+        for name in files:
+            yield posixpath.join(directory, name) if directory else name
+        for subdirectory in directories:
+            yield from walk(posixpath.join(directory, subdirectory) if directory else subdirectory)
+
+    if not storage.exists(''):
+        return []
+    return [
+        name for name in walk('')
+        if name not in referenced and storage.get_modified_time(name).timestamp() < cutoff
+    ]
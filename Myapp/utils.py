@@ -1,12 +1,50 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
 from .models import Application
 
+APPLIED_POSTINGS_CACHE_TIMEOUT = 60 * 60  # seconds
+
+# Cache backends whose entries only exist in one process
+PER_PROCESS_CACHES = ('django.core.cache.backends.locmem.LocMemCache',)
+
+
+def cache_is_per_process():
+    """True if the default cache is not shared, so other processes never see what this one writes."""
+    return settings.CACHES['default']['BACKEND'] in PER_PROCESS_CACHES
+
+
+def _applied_postings_cache_key(user_id):
+    return f'applications:applied_postings:{user_id}'
+
+
+def applied_posting_ids(user):
+    """
+    Ids of every posting the user has applied to, as a frozenset.
+    Cached per user; Myapp.signals clears the entry when one of the
+    user's applications is created or deleted.
+    """
+    key = _applied_postings_cache_key(user.pk)
+    posting_ids = cache.get(key)
+    if posting_ids is None:
+        posting_ids = frozenset(Application.objects.filter(student=user).values_list('posting_id', flat=True))
+        cache.set(key, posting_ids, APPLIED_POSTINGS_CACHE_TIMEOUT)
+    return posting_ids
+
+
+def invalidate_applied_postings(user_id):
+    key = _applied_postings_cache_key(user_id)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
 def check_duplicate_application(student, posting_id):
     """
     SUB-TASK 1: Duplicate Check
     Given I submit application, When API checks for duplicates, 
     Then system prevents multiple applications to same posting.
     """
-    return Application.objects.filter(student=student, posting_id=posting_id).exists()
+    return int(posting_id) in applied_posting_ids(student)
 
 def get_user_application_status(user, posting_id):
     """
@@ -28,8 +66,11 @@ def can_user_apply(user, posting_id):
     if not user.is_authenticated:
         return False, None, "Please log in to apply"
     
-    existing_app = get_user_application_status(user, posting_id)
+    # Only load the application when the cached ids say there is one
+    existing_app = None
+    if check_duplicate_application(user, posting_id):
+        existing_app = get_user_application_status(user, posting_id)
     if existing_app:
         return False, existing_app, "You have already applied to this opportunity"
     
-    return True, None, "Apply now"
\ No newline at end of file
+    return True, None, "Apply now"
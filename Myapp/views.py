@@ -3,6 +3,7 @@ from django.shortcuts import render, redirect
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.models import User
 from django.contrib import messages
+from .counters import change_application_status
 from .models import Application, Posting, Profile 
 
 def organizationDashboard(request):
@@ -36,8 +37,7 @@ def withdraw_application(request, application_id):
     application = get_object_or_404(Application, id=application_id, student=request.user)
     
     if application.status in ['submitted', 'under_review']:
-        application.status = 'withdrawn'
-        application.save()
+        change_application_status(application, 'withdrawn')
         messages.success(request, "Application withdrawn successfully.")
     else:
         messages.error(request, "Cannot withdraw this application.")
@@ -55,11 +55,7 @@ def login_view(request):
         email = request.POST.get("email")
         password = request.POST.get("password")
 
-        try:
-            user = User.objects.get(email=email)
-            user = authenticate(request, username=user.username, password=password)
-        except User.DoesNotExist:
-            user = None
+        user = authenticate(request, username=email, password=password)
 
         if user is not None:
             login(request, user)
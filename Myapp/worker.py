@@ -0,0 +1,23 @@
+"""
+Entry points for the child processes of `manage.py run_worker`.
+
+Children are spawned rather than forked, so they never share the parent's
+database connections. This module is imported before Django is set up in
+the child, so it must not import models at module level.
+"""
+import django
+
+
+def init_process():
+    django.setup()
+    from django.utils.module_loading import autodiscover_modules
+    autodiscover_modules('tasks')
+
+
+def execute(job_id, token):
+    from django.db import close_old_connections
+
+    from .jobs import run_job
+
+    close_old_connections()
+    return job_id, run_job(job_id, token)